@@ -0,0 +1,28 @@
+"""add incremental crawl watermarks to channels
+
+Revision ID: 0a1b2c3d4e5f
+Revises: f1a2b3c4d5e6
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0a1b2c3d4e5f"
+down_revision: Union[str, Sequence[str], None] = "f1a2b3c4d5e6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Shopify 증분 크롤: 마지막으로 수집한 updated_at 최대값 + 전체 순회 완료 시각
+    op.add_column("channels", sa.Column("shopify_updated_hwm", sa.DateTime(), nullable=True))
+    op.add_column("channels", sa.Column("last_full_crawl_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("channels", "last_full_crawl_at")
+    op.drop_column("channels", "shopify_updated_hwm")
@@ -0,0 +1,36 @@
+"""add last_seen_at to products
+
+Revision ID: 1b2c3d4e5f60
+Revises: 0a1b2c3d4e5f
+Create Date: 2026-10-18 00:10:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "1b2c3d4e5f60"
+down_revision: Union[str, Sequence[str], None] = "0a1b2c3d4e5f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    product_cols = {c["name"] for c in inspector.get_columns("products")}
+    if "last_seen_at" not in product_cols:
+        op.add_column("products", sa.Column("last_seen_at", sa.DateTime(), nullable=True))
+    # 기존 제품은 마지막 upsert 시각(updated_at)을 마지막 확인 시각으로 간주
+    op.execute("UPDATE products SET last_seen_at = updated_at WHERE last_seen_at IS NULL")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    product_cols = {c["name"] for c in inspector.get_columns("products")}
+    if "last_seen_at" in product_cols:
+        op.drop_column("products", "last_seen_at")
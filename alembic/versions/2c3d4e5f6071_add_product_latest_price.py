@@ -0,0 +1,83 @@
+"""add product_latest_price table
+
+Revision ID: 2c3d4e5f6071
+Revises: 1b2c3d4e5f60
+Create Date: 2026-10-18 00:20:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "2c3d4e5f6071"
+down_revision: Union[str, Sequence[str], None] = "1b2c3d4e5f60"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "product_latest_price",
+        sa.Column(
+            "product_id",
+            sa.Integer(),
+            sa.ForeignKey("products.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("price", sa.Numeric(12, 2), nullable=False),
+        sa.Column("original_price", sa.Numeric(12, 2), nullable=True),
+        sa.Column("currency", sa.String(length=10), nullable=False, server_default="KRW"),
+        sa.Column("is_sale", sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column("discount_rate", sa.Integer(), nullable=True),
+        sa.Column("crawled_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index(
+        "ix_product_latest_price_sale_discount",
+        "product_latest_price",
+        ["is_sale", "discount_rate"],
+    )
+
+    # price_history에서 product_id별 마지막 행으로 백필 (price_history.currency는 NULL 허용)
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute(
+            """
+            INSERT INTO product_latest_price (
+                product_id, price, original_price, currency, is_sale, discount_rate, crawled_at
+            )
+            SELECT DISTINCT ON (product_id)
+                product_id, price, original_price, COALESCE(currency, 'KRW'),
+                is_sale, discount_rate, crawled_at
+            FROM price_history
+            ORDER BY product_id, crawled_at DESC, id DESC
+            """
+        )
+    else:
+        op.execute(
+            """
+            INSERT INTO product_latest_price (
+                product_id, price, original_price, currency, is_sale, discount_rate, crawled_at
+            )
+            SELECT
+                product_id, price, original_price, COALESCE(currency, 'KRW'),
+                is_sale, discount_rate, crawled_at
+            FROM (
+                SELECT
+                    ph.*,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY ph.product_id
+                        ORDER BY ph.crawled_at DESC, ph.id DESC
+                    ) AS rn
+                FROM price_history ph
+            ) x
+            WHERE x.rn = 1
+            """
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_product_latest_price_sale_discount", table_name="product_latest_price")
+    op.drop_table("product_latest_price")
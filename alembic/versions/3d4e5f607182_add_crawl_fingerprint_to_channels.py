@@ -0,0 +1,45 @@
+"""add crawl strategy fingerprint to channels
+
+Revision ID: 3d4e5f607182
+Revises: 2c3d4e5f6071
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3d4e5f607182"
+down_revision: Union[str, Sequence[str], None] = "2c3d4e5f6071"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 크롤 전략 라우터: 마지막 성공 전략 + 전략별 캐시(JSON 문자열)
+    op.add_column("channels", sa.Column("crawl_strategy", sa.String(length=50), nullable=True))
+    op.add_column("channels", sa.Column("crawl_hints", sa.Text(), nullable=True))
+
+    # 기존 크롤 로그의 마지막 성공 전략으로 채운다
+    op.execute(
+        """
+        UPDATE channels
+        SET crawl_strategy = (
+            SELECT l.strategy
+            FROM crawl_channel_logs l
+            WHERE l.channel_id = channels.id
+              AND l.status = 'success'
+              AND l.strategy IS NOT NULL
+              AND l.strategy <> 'unknown'
+            ORDER BY l.crawled_at DESC, l.id DESC
+            LIMIT 1
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("channels", "crawl_hints")
+    op.drop_column("channels", "crawl_strategy")
@@ -0,0 +1,41 @@
+"""add per-stage timings to crawl_channel_logs
+
+Revision ID: 4e5f60718293
+Revises: 3d4e5f607182
+Create Date: 2026-10-18 00:00:01.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4e5f60718293"
+down_revision: Union[str, Sequence[str], None] = "3d4e5f607182"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INT_COLUMNS = (
+    "fetch_ms",
+    "parse_ms",
+    "brand_lookup_ms",
+    "upsert_ms",
+    "history_ms",
+    "commit_ms",
+    "request_count",
+    "retry_count",
+)
+
+
+def upgrade() -> None:
+    # 기존 로그는 단계별 계측이 없으므로 NULL로 둔다
+    for name in _INT_COLUMNS:
+        op.add_column("crawl_channel_logs", sa.Column(name, sa.Integer(), nullable=True))
+    op.add_column("crawl_channel_logs", sa.Column("bytes_downloaded", sa.BigInteger(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("crawl_channel_logs", "bytes_downloaded")
+    for name in reversed(_INT_COLUMNS):
+        op.drop_column("crawl_channel_logs", name)
@@ -0,0 +1,26 @@
+"""add price_changes to crawl_channel_logs
+
+Revision ID: 5f6071829304
+Revises: 4e5f60718293
+Create Date: 2026-10-18 00:00:02.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5f6071829304"
+down_revision: Union[str, Sequence[str], None] = "4e5f60718293"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 적응형 크롤 스케줄의 채널 변경률 입력 (기존 제품 가격/재고 변경 수)
+    op.add_column("crawl_channel_logs", sa.Column("price_changes", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("crawl_channel_logs", "price_changes")
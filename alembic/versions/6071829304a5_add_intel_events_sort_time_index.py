@@ -0,0 +1,34 @@
+"""add coalesced sort-time index to intel_events
+
+Revision ID: 6071829304a5
+Revises: 5f6071829304
+Create Date: 2026-10-18 00:00:03.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6071829304a5"
+down_revision: Union[str, Sequence[str], None] = "5f6071829304"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # /intel/events 정렬·keyset 커서 (coalesce(event_time, detected_at), id) 를 인덱스 순서로 읽는다
+    op.create_index(
+        "ix_intel_events_active_sort_time",
+        "intel_events",
+        [
+            "is_active",
+            sa.text("coalesce(event_time, detected_at) DESC"),
+            sa.text("id DESC"),
+        ],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_intel_events_active_sort_time", table_name="intel_events")
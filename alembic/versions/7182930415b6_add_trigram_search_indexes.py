@@ -0,0 +1,54 @@
+"""add pg_trgm GIN indexes for text search
+
+Revision ID: 7182930415b6
+Revises: 6071829304a5
+Create Date: 2026-10-18 00:00:04.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7182930415b6"
+down_revision: Union[str, Sequence[str], None] = "6071829304a5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (인덱스명, 테이블, 컬럼) — search_service.FTS_COLUMNS와 같은 대상
+_TRGM_INDEXES = (
+    ("ix_products_name_trgm", "products", "name"),
+    ("ix_product_catalog_canonical_name_trgm", "product_catalog", "canonical_name"),
+    ("ix_brands_name_trgm", "brands", "name"),
+    ("ix_brands_name_ko_trgm", "brands", "name_ko"),
+    ("ix_brands_slug_trgm", "brands", "slug"),
+    ("ix_intel_events_title_trgm", "intel_events", "title"),
+    ("ix_intel_events_summary_trgm", "intel_events", "summary"),
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        # SQLite는 init_db에서 FTS5 trigram 테이블을 만든다
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # ILIKE '%q%' 를 seq scan 대신 trigram GIN 인덱스로 처리
+    for name, table, column in _TRGM_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    for name, table, _ in reversed(_TRGM_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,33 @@
+"""add search_suggestions index table
+
+Revision ID: 82930415b6c7
+Revises: 7182930415b6
+Create Date: 2026-10-18 00:00:05.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "82930415b6c7"
+down_revision: Union[str, Sequence[str], None] = "7182930415b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 연관검색어 사전 집계 — 초기 데이터는 API 시작 시(ensure_search_suggestions), 이후 크롤 후처리에서 재빌드
+    op.create_table(
+        "search_suggestions",
+        sa.Column("term", sa.String(length=64), nullable=False),
+        sa.Column("kind", sa.String(length=10), nullable=False),
+        sa.Column("suggestion", sa.String(length=255), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("term", "kind", "suggestion"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("search_suggestions")
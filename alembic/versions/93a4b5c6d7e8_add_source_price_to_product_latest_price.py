@@ -0,0 +1,32 @@
+"""add source-currency price to product_latest_price
+
+Revision ID: 93a4b5c6d7e8
+Revises: 82930415b6c7
+Create Date: 2026-10-18 00:00:06.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "93a4b5c6d7e8"
+down_revision: Union[str, Sequence[str], None] = "82930415b6c7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존 행은 원 통화 가격을 알 수 없으므로 NULL (다음 가격 기록 때 채워진다)
+    op.add_column("product_latest_price", sa.Column("source_price", sa.Numeric(12, 2), nullable=True))
+    op.add_column(
+        "product_latest_price", sa.Column("source_original_price", sa.Numeric(12, 2), nullable=True)
+    )
+    op.add_column("product_latest_price", sa.Column("source_currency", sa.String(length=10), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("product_latest_price", "source_currency")
+    op.drop_column("product_latest_price", "source_original_price")
+    op.drop_column("product_latest_price", "source_price")
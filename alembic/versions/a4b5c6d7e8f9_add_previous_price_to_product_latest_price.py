@@ -0,0 +1,58 @@
+"""add previous price to product_latest_price
+
+Revision ID: a4b5c6d7e8f9
+Revises: 93a4b5c6d7e8
+Create Date: 2026-10-18 00:00:07.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a4b5c6d7e8f9"
+down_revision: Union[str, Sequence[str], None] = "93a4b5c6d7e8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("product_latest_price", sa.Column("previous_price", sa.Numeric(12, 2), nullable=True))
+    op.add_column("product_latest_price", sa.Column("price_changed_at", sa.DateTime(), nullable=True))
+
+    # price_history에서 가격이 바뀐 마지막 행(직전 행과 price가 다른 행)으로 백필
+    op.execute(
+        """
+        WITH ordered AS (
+            SELECT
+                ph.id, ph.product_id, ph.price, ph.crawled_at,
+                LAG(ph.price) OVER (
+                    PARTITION BY ph.product_id
+                    ORDER BY ph.crawled_at, ph.id
+                ) AS prev_price
+            FROM price_history ph
+        ),
+        changes AS (
+            SELECT
+                product_id, prev_price, crawled_at,
+                ROW_NUMBER() OVER (
+                    PARTITION BY product_id
+                    ORDER BY crawled_at DESC, id DESC
+                ) AS crn
+            FROM ordered
+            WHERE prev_price IS NOT NULL AND prev_price <> price
+        )
+        UPDATE product_latest_price
+        SET previous_price = changes.prev_price,
+            price_changed_at = changes.crawled_at
+        FROM changes
+        WHERE changes.product_id = product_latest_price.product_id
+          AND changes.crn = 1
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("product_latest_price", "price_changed_at")
+    op.drop_column("product_latest_price", "previous_price")
@@ -6,7 +6,7 @@ import type {
   AdminStats, AdminChannelHealth, AdminCrawlStatus, ChannelSignalOut,
   FashionNews, CollabItem, BrandDirector, DirectorsByBrand, AdminCollabItem, AdminAuditItem, MultiChannelProduct,
   CrawlRunOut, CrawlRunDetail, ChannelNoteOut,
-  IntelEvent, IntelEventsPage, IntelMapPoint, IntelTimelineOut, AdminIntelStatus,
+  IntelEvent, IntelEventsPage, IntelMapPoint, IntelMapCluster, IntelTimelineOut, AdminIntelStatus,
 } from "./types";
 
 const BASE = process.env.NEXT_PUBLIC_API_URL ?? "http://localhost:8000";
@@ -304,6 +304,19 @@ export const getIntelMapPoints = (params: {
   return apiFetch<IntelMapPoint[]>(`/intel/map-points?${q.toString()}`);
 };
 
+export const getIntelMapClusters = (params: {
+  zoom: number;
+  layers?: string[];
+  time_range?: string;
+  bbox?: [number, number, number, number];
+}) => {
+  const q = new URLSearchParams({ zoom: String(params.zoom) });
+  if (params.layers?.length) q.set("layers", params.layers.join(","));
+  if (params.time_range) q.set("time_range", params.time_range);
+  if (params.bbox) q.set("bbox", params.bbox.join(","));
+  return apiFetch<IntelMapCluster[]>(`/intel/map-clusters?${q.toString()}`);
+};
+
 export const getIntelTimeline = (params: {
   layers?: string[];
   time_range?: string;
@@ -386,10 +386,20 @@ export interface CrawlChannelLog {
   products_found: number;
   products_new: number;
   products_updated: number;
+  price_changes: number | null;
   error_msg: string | null;
   error_type: string | null;
   strategy: string | null;
   duration_ms: number;
+  fetch_ms: number | null;
+  parse_ms: number | null;
+  brand_lookup_ms: number | null;
+  upsert_ms: number | null;
+  history_ms: number | null;
+  commit_ms: number | null;
+  bytes_downloaded: number | null;
+  request_count: number | null;
+  retry_count: number | null;
   crawled_at: string;
 }
 
@@ -405,7 +415,21 @@ export interface CrawlRunOut {
   error_channels: number;
 }
 
+export interface CrawlRunStageTotals {
+  duration_ms: number;
+  fetch_ms: number;
+  parse_ms: number;
+  brand_lookup_ms: number;
+  upsert_ms: number;
+  history_ms: number;
+  commit_ms: number;
+  bytes_downloaded: number;
+  request_count: number;
+  retry_count: number;
+}
+
 export interface CrawlRunDetail extends CrawlRunOut {
+  stage_totals: CrawlRunStageTotals;
   logs: CrawlChannelLog[];
 }
 
@@ -452,7 +476,8 @@ export interface IntelEvent {
 export interface IntelEventsPage {
   items: IntelEvent[];
   next_cursor: string | null;
-  total: number;
+  total: number | null;
+  total_capped: boolean;
 }
 
 export interface IntelMapPoint {
@@ -467,6 +492,15 @@ export interface IntelMapPoint {
   geo_precision: string;
 }
 
+export interface IntelMapCluster {
+  key: string;
+  lat: number;
+  lng: number;
+  count: number;
+  max_severity: string | null;
+  sample_id: number;
+}
+
 export interface IntelTimelineOut {
   granularity: string;
   items: Array<{
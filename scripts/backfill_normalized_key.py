@@ -9,19 +9,21 @@ import asyncio
 import json
 import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
+import pandas as pd
 import typer
 from rich.console import Console
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, func, select, update
 from sqlalchemy.orm import aliased
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from fashion_engine.database import AsyncSessionLocal, init_db
+from fashion_engine.database import AsyncSessionLocal, engine, init_db
 from fashion_engine.models.brand import Brand
 from fashion_engine.models.product import Product
-from fashion_engine.crawler.product_crawler import ProductCrawler
+from fashion_engine.crawler.normalized_key_batch import build_normalized_keys
 from slugify import slugify
 
 app = typer.Typer()
@@ -37,6 +39,11 @@ class BackfillStats:
     skipped_no_key: int = 0
 
 
+@lru_cache(maxsize=50_000)
+def _vendor_slug(vendor: str) -> str:
+    return slugify(vendor)
+
+
 def _infer_brand_slug(
     product_key: str | None,
     vendor: str | None,
@@ -49,7 +56,7 @@ def _infer_brand_slug(
         if left and left != "unknown":
             return left
     if vendor:
-        s = slugify(vendor)
+        s = _vendor_slug(vendor)
         if s:
             return s
     return None
@@ -89,79 +96,107 @@ async def _count_confidence_08() -> int:
         )
 
 
-async def run_backfill(apply: bool, limit: int, force: bool) -> BackfillStats:
-    stats = BackfillStats()
-    last_id = 0
-    chunk_size = 1000
-    remaining = limit if limit > 0 else None
+_BACKFILL_COLUMNS = ["id", "product_key", "vendor", "sku", "name", "tags", "brand_slug"]
+
+
+async def _iter_product_chunks(limit: int, force: bool, chunk_size: int):
+    """백필 대상 행을 chunk_size씩 내보낸다.
+
+    PostgreSQL은 server-side cursor(yield_per) 스트리밍, SQLite는 읽기 커서가 쓰기를
+    막으므로 id 기준 keyset 페이지로 읽는다.
+    """
     brand_alias = aliased(Brand)
+    query = (
+        select(
+            Product.id,
+            Product.product_key,
+            Product.vendor,
+            Product.sku,
+            Product.name,
+            Product.tags,
+            brand_alias.slug.label("brand_slug"),
+        )
+        .outerjoin(brand_alias, Product.brand_id == brand_alias.id)
+        .order_by(Product.id.asc())
+    )
+    if not force:
+        query = query.where(Product.normalized_key.is_(None))
 
-    while True:
-        fetch_size = chunk_size if remaining is None else min(chunk_size, remaining)
-        if fetch_size <= 0:
-            break
+    remaining = limit if limit > 0 else None
+    if engine.dialect.name == "postgresql":
+        if remaining is not None:
+            query = query.limit(remaining)
+        async with AsyncSessionLocal() as read_db:
+            result = await read_db.stream(query.execution_options(yield_per=chunk_size))
+            async for rows in result.partitions():
+                yield rows
+        return
 
-        async with AsyncSessionLocal() as db:
+    last_id = 0
+    while remaining is None or remaining > 0:
+        fetch_size = chunk_size if remaining is None else min(chunk_size, remaining)
+        async with AsyncSessionLocal() as read_db:
             rows = (
-                await db.execute(
-                    select(
-                        Product.id,
-                        Product.product_key,
-                        Product.vendor,
-                        Product.sku,
-                        Product.name,
-                        Product.normalized_key,
-                        Product.tags,
-                        brand_alias.slug.label("brand_slug"),
-                    )
-                    .outerjoin(brand_alias, Product.brand_id == brand_alias.id)
-                    .where(Product.id > last_id)
-                    .order_by(Product.id.asc())
-                    .limit(fetch_size)
-                )
+                await read_db.execute(query.where(Product.id > last_id).limit(fetch_size))
             ).all()
-            if not force:
-                rows = [row for row in rows if row.normalized_key is None]
-
-            if not rows:
-                break
-
-            for row in rows:
-                stats.scanned += 1
-                last_id = row.id
-                if remaining is not None:
-                    remaining -= 1
-
-                inferred_slug = _infer_brand_slug(row.product_key, row.vendor, row.brand_slug)
-                if not inferred_slug:
-                    stats.skipped_no_brand += 1
-                    continue
-
-                normalized_key, confidence = ProductCrawler._build_normalized_key(
-                    brand_slug=inferred_slug,
-                    sku=row.sku,
-                    title=row.name or "",
-                    tags=_parse_tags(row.tags),
+        if not rows:
+            return
+        last_id = rows[-1].id
+        if remaining is not None:
+            remaining -= len(rows)
+        yield rows
+
+
+async def run_backfill(apply: bool, limit: int, force: bool, chunk_size: int = 5000) -> BackfillStats:
+    """chunk 단위로 읽어 normalized_key를 일괄 생성하고 chunk 단위 executemany UPDATE."""
+    stats = BackfillStats()
+    products = Product.__table__
+    update_stmt = (
+        update(products)
+        .where(products.c.id == bindparam("pid"))
+        .values(normalized_key=bindparam("nk"), match_confidence=bindparam("mc"))
+    )
+
+    # 읽기(스트리밍) 세션과 쓰기 세션을 분리 — 쓰기 커밋이 서버 측 커서를 닫지 않도록
+    async with AsyncSessionLocal() as write_db:
+        async for rows in _iter_product_chunks(limit, force, chunk_size):
+            frame = pd.DataFrame(rows, columns=_BACKFILL_COLUMNS, dtype=object)
+            stats.scanned += len(frame)
+            frame["brand_slug"] = [
+                _infer_brand_slug(product_key, vendor, brand_slug)
+                for product_key, vendor, brand_slug in zip(
+                    frame["product_key"], frame["vendor"], frame["brand_slug"]
                 )
-                if not normalized_key:
-                    stats.skipped_no_key += 1
-                    continue
-
-                stats.candidates += 1
-                if apply:
-                    product = await db.get(Product, row.id)
-                    if product:
-                        product.normalized_key = normalized_key
-                        product.match_confidence = confidence
-                        stats.updated += 1
-
-                if stats.scanned % 100 == 0:
-                    console.print(
-                        f"[dim]progress[/dim] scanned={stats.scanned} candidates={stats.candidates} updated={stats.updated}"
+            ]
+            no_brand = frame["brand_slug"].isna()
+            stats.skipped_no_brand += int(no_brand.sum())
+            frame = frame[~no_brand]
+            if frame.empty:
+                continue
+
+            frame["title"] = frame["name"].fillna("")
+            frame["tags"] = frame["tags"].map(_parse_tags)
+            keys = build_normalized_keys(frame)
+            has_key = keys["normalized_key"].notna()
+            stats.skipped_no_key += int((~has_key).sum())
+            stats.candidates += int(has_key.sum())
+
+            if apply and has_key.any():
+                params = [
+                    {"pid": int(pid), "nk": key, "mc": float(conf)}
+                    for pid, key, conf in zip(
+                        frame.loc[has_key, "id"],
+                        keys.loc[has_key, "normalized_key"],
+                        keys.loc[has_key, "match_confidence"],
                     )
+                ]
+                await write_db.execute(update_stmt, params)
+                await write_db.commit()
+                stats.updated += len(params)
 
-            if apply and stats.updated > 0:
-                await db.commit()
+            console.print(
+                f"[dim]progress[/dim] scanned={stats.scanned} candidates={stats.candidates} updated={stats.updated}"
+            )
 
     return stats
 
@@ -171,16 +206,17 @@ def cli_main(
     apply: bool = typer.Option(False, "--apply", help="실제 DB 업데이트 실행"),
     limit: int = typer.Option(0, "--limit", min=0, help="처리 상한 (0=전체)"),
     force: bool = typer.Option(False, "--force", help="normalized_key 존재 제품도 강제 재계산"),
+    chunk_size: int = typer.Option(5000, "--chunk-size", min=100, help="스트리밍·UPDATE 단위 행 수"),
 ):
-    asyncio.run(_main(apply=apply, limit=limit, force=force))
+    asyncio.run(_main(apply=apply, limit=limit, force=force, chunk_size=chunk_size))
 
 
-async def _main(apply: bool, limit: int, force: bool) -> None:
+async def _main(apply: bool, limit: int, force: bool, chunk_size: int = 5000) -> None:
     await init_db()
 
     before_count = await _count_not_null()
     before_conf_08 = await _count_confidence_08()
-    stats = await run_backfill(apply=apply, limit=limit, force=force)
+    stats = await run_backfill(apply=apply, limit=limit, force=force, chunk_size=chunk_size)
     after_count = await _count_not_null() if apply else before_count + stats.candidates
     after_conf_08 = await _count_confidence_08() if apply else before_conf_08
     increased = max(0, after_count - before_count)
@@ -0,0 +1,160 @@
+"""
+HTML 파서 백엔드 벤치마크 + 결과 동등성 검사.
+
+저장된 fixture 페이지(Cafe24 목록/브랜드 페이지, 일반 JSON-LD 페이지)를 백엔드별로 파싱해
+페이지당 파싱 시간과 html.parser 대비 결과 일치 여부를 출력한다.
+불일치가 하나라도 있으면 exit code 1.
+기본 fixture는 data/fixtures/html/에 커밋되어 있다 (--save로 추가).
+
+사용법:
+    uv run python scripts/bench_html_parsers.py --save https://shop.example.com/product/list.html?cate_no=42
+    uv run python scripts/bench_html_parsers.py                     # data/fixtures/html/*.html 벤치마크
+    uv run python scripts/bench_html_parsers.py --rounds 50
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fashion_engine.config import settings  # noqa: E402
+from fashion_engine.crawler.html_parser import (  # noqa: E402
+    HTML_PARSER_BACKENDS,
+    LXML_AVAILABLE,
+    make_soup,
+)
+from fashion_engine.crawler.http_pool import build_http_client  # noqa: E402
+from fashion_engine.crawler.product_crawler import ProductCrawler  # noqa: E402
+
+app = typer.Typer()
+console = Console()
+
+_FIXTURE_BASE_URL = "https://fixture.local"
+
+ParsedFixture = tuple[list[dict], dict[str, str], list[dict]]
+
+
+def _fixture_name(url: str) -> str:
+    return re.sub(r"[^A-Za-z0-9.-]+", "_", url.split("://", 1)[-1]).strip("_")[:150] + ".html"
+
+
+async def _save_fixtures(urls: list[str], fixtures_dir: Path) -> None:
+    fixtures_dir.mkdir(parents=True, exist_ok=True)
+    async with build_http_client() as client:
+        for url in urls:
+            resp = await client.get(url)
+            resp.raise_for_status()
+            path = fixtures_dir / _fixture_name(url)
+            path.write_text(resp.text, encoding="utf-8")
+            console.print(f"[green]저장[/green] {path} ({len(resp.text):,} bytes)")
+
+
+def _parse_jsonld_products(html: str) -> list[dict]:
+    # 일반 HTML 크롤러(_crawl_generic_product_cards)의 JSON-LD fallback 경로
+    found: list[dict] = []
+    for script in make_soup(html).select("script[type='application/ld+json']"):
+        raw = (script.string or script.get_text() or "").strip()
+        try:
+            ProductCrawler._collect_jsonld_products(json.loads(raw), found)
+        except ValueError:
+            continue
+    return found
+
+
+def _parse_fixture(crawler: ProductCrawler, html: str) -> ParsedFixture:
+    products = crawler._parse_cafe24_product_list(
+        html=html,
+        channel_url=_FIXTURE_BASE_URL,
+        currency="KRW",
+        brand_name=None,
+    )
+    categories = crawler._extract_cafe24_categories(html)
+    return [asdict(p) for p in products], categories, _parse_jsonld_products(html)
+
+
+@app.command()
+def main(
+    fixtures_dir: Path = typer.Option(Path("data/fixtures/html"), help="fixture HTML 디렉터리"),
+    rounds: int = typer.Option(20, help="fixture당 반복 파싱 횟수"),
+    save: list[str] = typer.Option([], "--save", help="URL을 받아 fixture로 저장 (여러 번 지정 가능)"),
+):
+    if save:
+        asyncio.run(_save_fixtures(save, fixtures_dir))
+
+    fixtures = sorted(fixtures_dir.glob("*.html"))
+    if not fixtures:
+        console.print(f"[yellow]fixture 없음:[/yellow] {fixtures_dir} (--save URL로 먼저 저장)")
+        raise typer.Exit(code=0)
+
+    backends = [b for b in HTML_PARSER_BACKENDS if b != "lxml" or LXML_AVAILABLE]
+    if not LXML_AVAILABLE:
+        console.print("[yellow]lxml 미설치 — html.parser만 측정[/yellow]")
+
+    crawler = ProductCrawler()
+    table = Table(title=f"HTML 파서 벤치마크 (rounds={rounds})", show_lines=True)
+    table.add_column("fixture", style="cyan")
+    table.add_column("파서")
+    table.add_column("ms/page", justify="right", style="green")
+    table.add_column("제품", justify="right")
+    table.add_column("카테고리", justify="right")
+    table.add_column("JSON-LD", justify="right")
+    table.add_column("동등성")
+
+    original_parser = settings.crawler_html_parser
+    mismatches = 0
+    totals: dict[str, float] = {b: 0.0 for b in backends}
+    try:
+        for path in fixtures:
+            html = path.read_text(encoding="utf-8", errors="replace")
+            baseline: ParsedFixture | None = None
+            for backend in ("html.parser", *[b for b in backends if b != "html.parser"]):
+                settings.crawler_html_parser = backend
+                parsed = _parse_fixture(crawler, html)
+                t0 = time.perf_counter()
+                for _ in range(rounds):
+                    _parse_fixture(crawler, html)
+                elapsed_ms = (time.perf_counter() - t0) * 1000 / rounds
+                totals[backend] += elapsed_ms
+
+                if baseline is None:
+                    baseline = parsed
+                    parity = "기준"
+                elif parsed == baseline:
+                    parity = "[green]일치[/green]"
+                else:
+                    mismatches += 1
+                    parity = "[red]불일치[/red]"
+                table.add_row(
+                    path.name,
+                    backend,
+                    f"{elapsed_ms:.2f}",
+                    str(len(parsed[0])),
+                    str(len(parsed[1])),
+                    str(len(parsed[2])),
+                    parity,
+                )
+    finally:
+        settings.crawler_html_parser = original_parser
+
+    console.print(table)
+    base_total = totals.get("html.parser") or 0.0
+    for backend, total in totals.items():
+        speedup = f" (x{base_total / total:.1f})" if total and backend != "html.parser" else ""
+        console.print(f"{backend}: 합계 {total:.1f} ms/round{speedup}")
+    if mismatches:
+        console.print(f"[bold red]결과 불일치 {mismatches}건[/bold red]")
+        raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,32 @@
+"""
+연관검색어 인덱스(search_suggestions) 전체 재빌드 스크립트.
+
+크롤 런 후 자동 재빌드되므로 수동 실행은 초기 적재·복구용.
+"""
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from fashion_engine.database import AsyncSessionLocal, init_db  # noqa: E402
+from fashion_engine.services.search_suggestion_service import (  # noqa: E402
+    rebuild_search_suggestions,
+)
+
+
+async def run() -> int:
+    await init_db()
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        rows = await rebuild_search_suggestions(db)
+    print(f"✅ search_suggestions 재빌드 완료: {rows:,}행 ({time.perf_counter() - started:.1f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(run()))
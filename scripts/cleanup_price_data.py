@@ -19,6 +19,7 @@ ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(ROOT / "src"))
 
 from fashion_engine.database import AsyncSessionLocal, init_db  # noqa: E402
+from fashion_engine.services.product_service import refresh_latest_prices  # noqa: E402
 
 console = Console()
 
@@ -99,10 +100,18 @@ def _detect_ids(rows: list[tuple]) -> list[int]:
 async def _delete_ids(ids: list[int]) -> int:
     bp = bindparam("ids", expanding=True)
     async with AsyncSessionLocal() as db:
+        product_ids = (
+            await db.execute(
+                text("SELECT DISTINCT product_id FROM price_history WHERE id IN :ids").bindparams(bp),
+                {"ids": ids},
+            )
+        ).scalars().all()
         await db.execute(
             text("DELETE FROM price_history WHERE id IN :ids").bindparams(bp),
             {"ids": ids},
         )
+        # 삭제된 행이 최신 가격이었을 수 있으므로 해당 제품의 product_latest_price 재계산
+        await refresh_latest_prices(db, [int(pid) for pid in product_ids])
         await db.commit()
     return len(ids)
 
@@ -11,48 +11,82 @@
     uv run python scripts/crawl_products.py --limit 3    # 처음 3개 채널만 (테스트)
     uv run python scripts/crawl_products.py --channel-type edit-shop
     uv run python scripts/crawl_products.py --concurrency 3  # 동시 처리 채널 수
+    uv run python scripts/crawl_products.py --no-http-cache  # ETag/해시 캐시 무시하고 전체 재다운로드
+    uv run python scripts/crawl_products.py --full-sweep     # Shopify 증분 크롤 대신 전체 순회 (삭제 감지)
+    uv run python scripts/crawl_products.py --writers 4      # 배치 저장 writer 수 (PostgreSQL)
+    uv run python scripts/crawl_products.py --parse-workers 4  # 파싱을 프로세스 풀로 오프로드
+    uv run python scripts/crawl_products.py --record-dir data/replay   # 원본 응답 녹화
+    uv run python scripts/crawl_products.py --replay-dir data/replay \
+        --replay-database-url sqlite+aiosqlite:///data/replay.db       # 녹화본으로 오프라인 재실행 (DB 사본에 저장)
 
 주의:
     크롤 직전에 `channel_probe.py --all --force-retag`를 실행하면 Shopify IP rate-limit
     (429)이 발생할 수 있습니다. probe는 별도 시간대(권장: 크롤 30분 이상 전)에 실행하세요.
 """
 import asyncio
+from contextlib import aclosing
 from dataclasses import dataclass, field
 import logging
+import sqlite3
 import sys
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 import typer
 from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from rich.console import Console
 from rich.table import Table
 from sqlalchemy import select, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import create_async_engine
 
 from fashion_engine.config import settings
-from fashion_engine.database import init_db, AsyncSessionLocal
+from fashion_engine import database
+from fashion_engine.database import init_db, AsyncSessionLocal, engine
 from fashion_engine.models.channel import Channel
 from fashion_engine.models.channel_brand import ChannelBrand
 from fashion_engine.models.brand import Brand
 from fashion_engine.models.price_history import PriceHistory
 from fashion_engine.models.product import Product
 from fashion_engine.models.crawl_run import CrawlRun, CrawlChannelLog
-from fashion_engine.crawler.product_crawler import ProductCrawler, ChannelProductResult
+from fashion_engine.crawler.http_cache import PageValidatorCache
+from fashion_engine.crawler.http_pool import build_http_client
+from fashion_engine.crawler.parse_pool import parse_pool
+from fashion_engine.crawler.product_crawler import (
+    CRAWL_STRATEGIES,
+    PARSER_VERSION,
+    ChannelProductResult,
+    ProductCrawler,
+)
 from fashion_engine.services.product_service import (
+    archive_unseen_channel_products,
+    bulk_insert_price_history,
     build_price_history_row,
     build_product_upsert_row,
     get_rate_to_krw,
     find_brands_by_vendors,
     get_existing_products_by_urls,
-    get_prev_prices_by_product_ids,
+    get_latest_price_states_by_product_ids,
+    latest_price_row,
+    price_row_changed,
+    product_row_unchanged,
+    touch_products_last_seen,
+    upsert_latest_prices,
     upsert_product,
 )
-from fashion_engine.services.channel_service import update_platform
+from fashion_engine.services.channel_service import (
+    get_cached_cafe24_categories,
+    update_crawl_fingerprint,
+    update_crawl_watermark,
+    update_platform,
+)
 from fashion_engine.services.catalog_service import build_catalog_incremental
+from fashion_engine.services.search_suggestion_service import rebuild_search_suggestions
 from fashion_engine.services.intel_service import upsert_derived_product_event
 from fashion_engine.services.alert_service import (
     AlertPayload,
@@ -71,20 +105,29 @@ SKIP_TYPES = {"secondhand-marketplace", "non-fashion"}
 # 채널 타입별 크롤 우선순위 (낮을수록 먼저)
 _CHANNEL_PRIORITY = {"brand-store": 0, "edit-shop": 1}
 
-# 채널 platform별 최대 크롤 시간 (초) — asyncio.wait_for 상한
+# 채널 platform별 최대 크롤 시간 (초) — asyncio.timeout 상한 (배치 저장 포함)
 _CHANNEL_TIMEOUT_SECS: dict[str, int] = {
     "cafe24": 600,   # 카테고리 수십~수백 개 가능
     "shopify": 180,
     "default": 300,
 }
 
+# 크롤 전략 → channels.platform 갱신값
+_STRATEGY_PLATFORM: dict[str, str] = {
+    "shopify-api": "shopify",
+    "cafe24-html": "cafe24",
+    "woocommerce-api": "woocommerce",
+}
+
 _POSTGRES_CRAWL_TIMEOUT_SQL = (
     "SET LOCAL idle_in_transaction_session_timeout = '60s'",
     "SET LOCAL lock_timeout = '5s'",
     "SET LOCAL statement_timeout = '120s'",
 )
-_PRODUCT_BULK_CHUNK_SIZE = 500
-_PRICE_HISTORY_BULK_CHUNK_SIZE = 1000
+_PRODUCT_BULK_CHUNK_SIZE = 500  # SQLite bind 변수 한도(32766) 안쪽: 500행 × 19컬럼
+# UPSERT ... RETURNING은 SQLite 3.35+ — 그 이전 버전은 ORM 단건 경로 사용
+_SQLITE_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+_SAVE_QUEUE_PER_WRITER = 4  # 저장 대기 배치 상한 = writer 수 × 4
 
 
 async def _apply_crawl_db_timeouts(db) -> None:
@@ -143,8 +186,29 @@ class ChannelSaveOutcome:
     sale_count: int = 0
     new_count: int = 0
     updated_count: int = 0
+    unchanged_price_count: int = 0  # 직전 가격과 같아 PriceHistory 기록을 생략한 제품 수
+    price_change_count: int = 0  # 기존 제품 중 가격/재고 변경으로 PriceHistory를 기록한 수 — 적응형 스케줄 입력
+    # 저장 단계별 소요 시간(초) — CrawlChannelLog *_ms 컬럼으로 기록
+    brand_lookup_seconds: float = 0.0
+    upsert_seconds: float = 0.0
+    history_seconds: float = 0.0
+    commit_seconds: float = 0.0
     post_commit_work: ChannelPostCommitWork = field(default_factory=ChannelPostCommitWork)
 
+    def merge(self, other: "ChannelSaveOutcome") -> None:
+        """배치 단위 저장 결과를 채널 누적 결과에 합친다."""
+        self.products_count += other.products_count
+        self.sale_count += other.sale_count
+        self.new_count += other.new_count
+        self.updated_count += other.updated_count
+        self.unchanged_price_count += other.unchanged_price_count
+        self.price_change_count += other.price_change_count
+        self.brand_lookup_seconds += other.brand_lookup_seconds
+        self.upsert_seconds += other.upsert_seconds
+        self.history_seconds += other.history_seconds
+        self.commit_seconds += other.commit_seconds
+        # post_commit_work는 배치 커밋 직후 CrawlWritePipeline이 소비하므로 누적하지 않는다
+
 
 def _dedupe_product_infos(products: list) -> list:
     deduped: dict[str, object] = {}
@@ -260,41 +324,77 @@ async def _save_channel_products_sqlite(
 ) -> ChannelSaveOutcome:
     outcome = ChannelSaveOutcome(products_count=len(products))
     vendor_names = sorted({info.vendor for info in products if info.vendor})
+    started = time.perf_counter()
     brand_by_vendor = await find_brands_by_vendors(db, vendor_names)
+    upsert_started = time.perf_counter()
+    outcome.brand_lookup_seconds = upsert_started - started
     existing_by_url = await get_existing_products_by_urls(
         db,
         [info.product_url for info in products],
     )
-    prev_price_by_product_id = (
-        await get_prev_prices_by_product_ids(
-            db,
-            [row.id for row in existing_by_url.values()],
-        )
-        if alerts_enabled
-        else {}
+    # 변경 감지용 직전 가격 — 배치 내 기존 제품만 한 번에 조회
+    latest_price_by_product_id = await get_latest_price_states_by_product_ids(
+        db,
+        [row.id for row in existing_by_url.values()],
     )
 
+    written_price_rows: list[dict] = []
+    touched_product_ids: list[int] = []
+    row_now = datetime.utcnow()
     for info in products:
         brand = brand_by_vendor.get(info.vendor or "")
         brand_id = brand.id if brand else None
         brand_slug = brand.slug if brand else None
         existing_row = existing_by_url.get(info.product_url)
-        prev_price_krw = (
-            prev_price_by_product_id.get(existing_row.id)
+        latest_price = (
+            latest_price_by_product_id.get(existing_row.id)
             if existing_row
             else None
         )
-
-        product, is_new, sale_just_started, availability_transition = await upsert_product(
-            db,
-            channel.id,
-            info,
-            brand_id=brand_id,
-            existing=existing_row,
-        )
-        price_row = build_price_history_row(product.id, info, rate)
+        prev_price_krw = latest_price.price if latest_price else None
+
+        price_row = None
+        price_changed = False
+        unchanged = False
+        if existing_row is not None:
+            # 기존 제품은 upsert 전에 가격 변경을 판단 — 내용·가격 모두 그대로면 last_seen_at만 갱신
+            row, is_new, sale_just_started, availability_transition = build_product_upsert_row(
+                channel_id=channel.id,
+                info=info,
+                brand_id=brand_id,
+                existing=existing_row,
+                now=row_now,
+            )
+            price_row = build_price_history_row(existing_row.id, info, rate, crawled_at=row_now)
+            price_changed = price_row is not None and price_row_changed(
+                price_row,
+                latest_price,
+                info,
+                availability_changed=availability_transition is not None,
+            )
+            unchanged = not price_changed and product_row_unchanged(existing_row, row)
+        if unchanged:
+            product = existing_row
+            touched_product_ids.append(existing_row.id)
+        else:
+            product, is_new, sale_just_started, availability_transition = await upsert_product(
+                db,
+                channel.id,
+                info,
+                brand_id=brand_id,
+                existing=existing_row,
+            )
+        if is_new:
+            price_row = build_price_history_row(product.id, info, rate)
+            price_changed = price_row is not None
         if price_row is not None:
-            db.add(PriceHistory(**price_row))
+            if price_changed:
+                db.add(PriceHistory(**price_row))
+                written_price_rows.append(latest_price_row(price_row, info))
+                if not is_new:
+                    outcome.price_change_count += 1
+            else:
+                outcome.unchanged_price_count += 1
             current_krw = int(price_row["price"])
         else:
             current_krw = round(float(info.price) * rate)
@@ -360,10 +460,16 @@ async def _save_channel_products_sqlite(
             if alert_job:
                 outcome.post_commit_work.alert_jobs.append(alert_job)
 
+    await touch_products_last_seen(db, touched_product_ids, row_now)
+    history_started = time.perf_counter()
+    # db.add한 PriceHistory는 루프 중 autoflush로도 기록되므로 이 경로의 history 시간은 근사치
+    await upsert_latest_prices(db, written_price_rows)
+    outcome.history_seconds = time.perf_counter() - history_started
+    outcome.upsert_seconds = history_started - upsert_started
     return outcome
 
 
-async def _save_channel_products_postgres(
+async def _save_channel_products_bulk(
     db,
     *,
     channel: Channel,
@@ -373,24 +479,28 @@ async def _save_channel_products_postgres(
     alerts_enabled: bool,
     no_intel: bool,
 ) -> ChannelSaveOutcome:
+    """집합 기반 저장 — INSERT ... ON CONFLICT(url) DO UPDATE ... RETURNING (PostgreSQL/SQLite 공용)."""
+    insert_fn = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
     outcome = ChannelSaveOutcome(products_count=len(products))
     vendor_names = sorted({info.vendor for info in products if info.vendor})
+    started = time.perf_counter()
     brand_by_vendor = await find_brands_by_vendors(db, vendor_names)
+    upsert_started = time.perf_counter()
+    outcome.brand_lookup_seconds = upsert_started - started
     existing_by_url = await get_existing_products_by_urls(
         db,
         [info.product_url for info in products],
     )
-    prev_price_by_product_id = (
-        await get_prev_prices_by_product_ids(
-            db,
-            [row.id for row in existing_by_url.values()],
-        )
-        if alerts_enabled
-        else {}
+    # 변경 감지용 직전 가격 — 배치 내 기존 제품만 한 번에 조회
+    latest_price_by_product_id = await get_latest_price_states_by_product_ids(
+        db,
+        [row.id for row in existing_by_url.values()],
     )
 
     upsert_rows: list[dict] = []
+    touched_product_ids: list[int] = []
     meta_by_url: dict[str, dict] = {}
+    product_id_by_url: dict[str, int] = {}
     row_now = datetime.utcnow()
 
     for info in products:
@@ -398,11 +508,12 @@ async def _save_channel_products_postgres(
         brand_id = brand.id if brand else None
         brand_slug = brand.slug if brand else None
         existing_row = existing_by_url.get(info.product_url)
-        prev_price_krw = (
-            prev_price_by_product_id.get(existing_row.id)
+        latest_price = (
+            latest_price_by_product_id.get(existing_row.id)
             if existing_row
             else None
         )
+        prev_price_krw = latest_price.price if latest_price else None
         row, is_new, sale_just_started, availability_transition = build_product_upsert_row(
             channel_id=channel.id,
             info=info,
@@ -410,12 +521,29 @@ async def _save_channel_products_postgres(
             existing=existing_row,
             now=row_now,
         )
-        upsert_rows.append(row)
+        # 기존 제품은 upsert 전에 가격 변경을 판단 — 내용·가격 모두 그대로면 last_seen_at만 갱신
+        price_row = None
+        price_changed = False
+        if existing_row is not None:
+            price_row = build_price_history_row(existing_row.id, info, rate, crawled_at=row_now)
+            price_changed = price_row is not None and price_row_changed(
+                price_row,
+                latest_price,
+                info,
+                availability_changed=availability_transition is not None,
+            )
+        if not price_changed and product_row_unchanged(existing_row, row):
+            touched_product_ids.append(existing_row.id)
+            product_id_by_url[info.product_url] = existing_row.id
+        else:
+            upsert_rows.append(row)
         meta_by_url[info.product_url] = {
             "info": info,
             "brand_id": brand_id,
             "brand_slug": brand_slug,
             "prev_price_krw": prev_price_krw,
+            "price_row": price_row,
+            "price_changed": price_changed,
             "is_new": is_new,
             "sale_just_started": sale_just_started,
             "availability_transition": availability_transition,
@@ -430,9 +558,8 @@ async def _save_channel_products_postgres(
         else:
             outcome.updated_count += 1
 
-    product_id_by_url: dict[str, int] = {}
     for chunk in _chunk_rows(upsert_rows, _PRODUCT_BULK_CHUNK_SIZE):
-        stmt = pg_insert(Product).values(chunk)
+        stmt = insert_fn(Product).values(chunk)
         excluded = stmt.excluded
         upsert_stmt = (
             stmt.on_conflict_do_update(
@@ -453,6 +580,7 @@ async def _save_channel_products_postgres(
                     "is_active": excluded.is_active,
                     "is_sale": excluded.is_sale,
                     "archived_at": excluded.archived_at,
+                    "last_seen_at": excluded.last_seen_at,
                     "updated_at": excluded.updated_at,
                 },
             )
@@ -460,14 +588,27 @@ async def _save_channel_products_postgres(
         )
         upserted_rows = (await db.execute(upsert_stmt)).all()
         product_id_by_url.update({row.url: row.id for row in upserted_rows})
+    await touch_products_last_seen(db, touched_product_ids, row_now)
+    outcome.upsert_seconds = time.perf_counter() - upsert_started
 
     price_rows: list[dict] = []
+    latest_rows: list[dict] = []
     for product_url, meta in meta_by_url.items():
         info = meta["info"]
         product_id = product_id_by_url[product_url]
-        price_row = build_price_history_row(product_id, info, rate, crawled_at=row_now)
+        price_row = meta["price_row"]
+        price_changed = meta["price_changed"]
+        if meta["is_new"]:
+            price_row = build_price_history_row(product_id, info, rate, crawled_at=row_now)
+            price_changed = price_row is not None
         if price_row is not None:
-            price_rows.append(price_row)
+            if price_changed:
+                price_rows.append(price_row)
+                latest_rows.append(latest_price_row(price_row, info))
+                if not meta["is_new"]:
+                    outcome.price_change_count += 1
+            else:
+                outcome.unchanged_price_count += 1
             current_krw = int(price_row["price"])
         else:
             current_krw = round(float(info.price) * rate)
@@ -522,8 +663,10 @@ async def _save_channel_products_postgres(
             if alert_job:
                 outcome.post_commit_work.alert_jobs.append(alert_job)
 
-    for chunk in _chunk_rows(price_rows, _PRICE_HISTORY_BULK_CHUNK_SIZE):
-        await db.execute(pg_insert(PriceHistory).values(chunk))
+    history_started = time.perf_counter()
+    await bulk_insert_price_history(db, price_rows)
+    await upsert_latest_prices(db, latest_rows)
+    outcome.history_seconds = time.perf_counter() - history_started
 
     return outcome
 
@@ -611,6 +754,14 @@ async def run_post_commit_pipeline(
         except Exception as exc:
             console.print(f"[yellow]catalog 증분 빌드 실패(무시): {exc}[/yellow]")
 
+    if total_upserted > 0:
+        try:
+            async with AsyncSessionLocal() as db:
+                rows = await rebuild_search_suggestions(db)
+            console.print(f"[green]✅ 연관검색어 인덱스 재빌드[/green] (rows={rows})")
+        except Exception as exc:
+            console.print(f"[yellow]연관검색어 인덱스 재빌드 실패(무시): {exc}[/yellow]")
+
     if not no_intel and total_upserted > 0:
         try:
             console.print("[cyan][INTEL][/cyan] derived_spike 자동 실행")
@@ -634,6 +785,164 @@ async def run_post_commit_pipeline(
         console.print("[dim][INTEL] 변경 데이터 없음(total_upserted=0)으로 자동 실행 스킵[/dim]")
 
 
+def _incremental_since(
+    channel: Channel,
+    now: datetime,
+    full_sweep: bool,
+) -> datetime | None:
+    """Shopify 채널의 증분 크롤 기준 시각. 전체 순회 주기가 지났으면 None (전체 순회)."""
+    if full_sweep or channel.platform != "shopify":
+        return None
+    if channel.shopify_updated_hwm is None or channel.last_full_crawl_at is None:
+        return None
+    if now - channel.last_full_crawl_at >= timedelta(hours=settings.crawler_full_sweep_hours):
+        return None
+    return channel.shopify_updated_hwm
+
+
+async def _save_channel_batch(
+    *,
+    channel: Channel,
+    products: list,
+    rate: float,
+    threshold: float,
+    alerts_enabled: bool,
+    no_intel: bool,
+) -> ChannelSaveOutcome:
+    """페이지 배치 1개를 독립 세션으로 저장·커밋한다."""
+    async with AsyncSessionLocal() as db:
+        await _apply_crawl_db_timeouts(db)
+        save = (
+            _save_channel_products_bulk
+            if db.get_bind().dialect.name == "postgresql" or _SQLITE_SUPPORTS_RETURNING
+            else _save_channel_products_sqlite
+        )
+        outcome = await save(
+            db,
+            channel=channel,
+            products=products,
+            rate=rate,
+            threshold=threshold,
+            alerts_enabled=alerts_enabled,
+            no_intel=no_intel,
+        )
+        started = time.perf_counter()
+        await db.commit()
+        outcome.commit_seconds = time.perf_counter() - started
+    return outcome
+
+
+@dataclass
+class _SaveJob:
+    channel: Channel
+    products: list
+    rate: float
+    threshold: float
+    alerts_enabled: bool
+    no_intel: bool
+    done: asyncio.Future
+
+
+class CrawlWritePipeline:
+    """fetch → 저장 → 커밋 후처리 3단 파이프라인.
+
+    채널 fetch 워커는 배치를 bounded 큐에 넣고 바로 다음 페이지를 받는다.
+    writer 태스크 풀이 배치를 저장·커밋하고, 커밋된 배치의 intel/알림 작업은
+    후처리 태스크가 즉시 소비한다. 큐가 차면 put()이 막혀 fetch 속도가 저장 속도에 맞춰진다.
+    """
+
+    def __init__(self, writers: int, queue_size: int | None = None):
+        self._writer_count = max(1, writers)
+        self._save_queue: asyncio.Queue[_SaveJob | None] = asyncio.Queue(
+            maxsize=queue_size or self._writer_count * _SAVE_QUEUE_PER_WRITER
+        )
+        # 후처리 큐는 무제한 — writer가 알림 전송 때문에 막히지 않도록
+        self._post_commit_queue: asyncio.Queue[tuple[Channel, ChannelPostCommitWork] | None] = (
+            asyncio.Queue()
+        )
+        self._writer_tasks: list[asyncio.Task] = []
+        self._post_commit_task: asyncio.Task | None = None
+        # 벤치마크·런 요약용: 배치 저장(트랜잭션 포함) 누적 시간
+        self.save_seconds = 0.0
+        self.saved_batches = 0
+
+    def start(self) -> None:
+        self._writer_tasks = [
+            asyncio.create_task(self._writer()) for _ in range(self._writer_count)
+        ]
+        self._post_commit_task = asyncio.create_task(self._post_commit_worker())
+
+    async def submit(
+        self,
+        *,
+        channel: Channel,
+        products: list,
+        rate: float,
+        threshold: float,
+        alerts_enabled: bool,
+        no_intel: bool,
+    ) -> asyncio.Future:
+        """배치를 저장 큐에 넣고, 저장 결과(ChannelSaveOutcome)를 받을 future를 반환한다."""
+        done = asyncio.get_running_loop().create_future()
+        await self._save_queue.put(
+            _SaveJob(
+                channel=channel,
+                products=products,
+                rate=rate,
+                threshold=threshold,
+                alerts_enabled=alerts_enabled,
+                no_intel=no_intel,
+                done=done,
+            )
+        )
+        return done
+
+    async def close(self) -> None:
+        """남은 배치 저장과 후처리를 모두 마친 뒤 태스크를 종료한다."""
+        for _ in self._writer_tasks:
+            await self._save_queue.put(None)
+        await asyncio.gather(*self._writer_tasks, return_exceptions=True)
+        await self._post_commit_queue.put(None)
+        if self._post_commit_task is not None:
+            await asyncio.gather(self._post_commit_task, return_exceptions=True)
+
+    async def _writer(self) -> None:
+        while True:
+            job = await self._save_queue.get()
+            if job is None:
+                return
+            started = time.perf_counter()
+            try:
+                outcome = await _save_channel_batch(
+                    channel=job.channel,
+                    products=job.products,
+                    rate=job.rate,
+                    threshold=job.threshold,
+                    alerts_enabled=job.alerts_enabled,
+                    no_intel=job.no_intel,
+                )
+            except Exception as exc:
+                if not job.done.done():
+                    job.done.set_exception(exc)
+                continue
+            finally:
+                self.save_seconds += time.perf_counter() - started
+            self.saved_batches += 1
+            work = outcome.post_commit_work
+            if work.derived_events or work.alert_jobs:
+                self._post_commit_queue.put_nowait((job.channel, work))
+            if not job.done.done():
+                job.done.set_result(outcome)
+
+    async def _post_commit_worker(self) -> None:
+        while True:
+            item = await self._post_commit_queue.get()
+            if item is None:
+                return
+            channel, work = item
+            await run_channel_post_commit_pipeline(channel=channel, work=work)
+
+
 async def _crawl_one_channel(
     channel: Channel,
     run_id: int,
@@ -642,8 +951,17 @@ async def _crawl_one_channel(
     threshold: float,
     sem: asyncio.Semaphore,
     run_lock: asyncio.Lock,
+    pipeline: CrawlWritePipeline,
+    page_cache: PageValidatorCache | None = None,
+    http_client=None,
+    full_sweep: bool = False,
 ) -> dict:
-    """단일 채널 크롤 — 독립적인 ProductCrawler + DB 세션 사용."""
+    """단일 채널 크롤 — fetch는 sem 슬롯 안에서, 배치 저장은 pipeline writer가 담당."""
+    result = ChannelProductResult(channel_url=channel.url)
+    save_outcome = ChannelSaveOutcome()
+    pending_saves: list[asyncio.Future] = []
+    fetch_error: Exception | None = None
+
     async with sem:
         console.print(f"[dim]▶ 시작:[/dim] {channel.name}")
         t_start = time.time()
@@ -673,175 +991,236 @@ async def _crawl_one_channel(
             channel.platform or "default",
             _CHANNEL_TIMEOUT_SECS["default"],
         )
-        async with ProductCrawler(request_delay=0.5) as crawler:
-            try:
-                result = await asyncio.wait_for(
-                    crawler.crawl_channel(
-                        channel.url,
-                        country=channel.country,
-                        cafe24_brand_categories=cafe24_categories,
-                    ),
-                    timeout=chan_timeout,
-                )
-            except asyncio.TimeoutError:
-                console.print(f"[red]⏱ timeout:[/red] {channel.name} ({chan_timeout}s 초과)")
-                result = ChannelProductResult(
-                    channel_url=channel.url,
-                    products=[],
-                    error=f"Channel timeout after {chan_timeout}s",
-                    error_type="timeout",
-                )
-
-        duration_ms = int((time.time() - t_start) * 1000)
-        save_outcome = ChannelSaveOutcome()
-
-        if result.products and not result.error:
-            result.products = _dedupe_product_infos(result.products)
+        alerts_enabled = (not no_alerts) and bool(settings.discord_webhook_url)
+        seen_urls: set[str] = set()
+        rate: float | None = None
+        # 이번 크롤에서 확인된 제품은 last_seen_at >= channel_started_at → 정리 단계 기준 시각
+        channel_started_at = datetime.utcnow()
+        updated_since = _incremental_since(channel, channel_started_at, full_sweep)
+        if updated_since is not None:
+            console.print(f"[dim]  증분 크롤:[/dim] {channel.name} (since {updated_since:%Y-%m-%d %H:%M})")
+
+        # 페이지 배치는 저장 큐로 넘기고 바로 다음 페이지를 받는다 — 배치마다 커밋되므로
+        # timeout/저장 실패 시에도 이미 커밋된 배치는 보존된다.
+        async with ProductCrawler(
+            request_delay=0.5,
+            page_cache=page_cache,
+            client=http_client,
+        ) as crawler:
             try:
-                async with AsyncSessionLocal() as db:
-                    await _apply_crawl_db_timeouts(db)
-                    if result.crawl_strategy == "shopify-api":
-                        await update_platform(db, channel.id, "shopify")
-                    elif result.crawl_strategy == "cafe24-html":
-                        await update_platform(db, channel.id, "cafe24")
-                    elif result.crawl_strategy == "woocommerce-api":
-                        await update_platform(db, channel.id, "woocommerce")
-
-                    currency = result.products[0].currency if result.products else "KRW"
-                    rate = await get_rate_to_krw(db, currency)
-                    if rate is None:
-                        console.print(
-                            f"[yellow]환율 없음[/yellow] {currency} → 채널 {channel.name} 가격 저장 스킵"
+                async with asyncio.timeout(chan_timeout):
+                    async with aclosing(
+                        crawler.iter_channel_batches(
+                            channel.url,
+                            country=channel.country,
+                            cafe24_brand_categories=cafe24_categories,
+                            result=result,
+                            updated_since=updated_since,
+                            preferred_strategy=channel.crawl_strategy,
+                            cached_cafe24_categories=get_cached_cafe24_categories(channel),
                         )
-                        await db.commit()
-                        result.error = f"Missing FX rate for {currency}"
-                        result.error_type = "parse_error"
-                        result.products = []
-                    else:
-                        alerts_enabled = (not no_alerts) and bool(settings.discord_webhook_url)
-                        if db.get_bind().dialect.name == "postgresql":
-                            save_outcome = await _save_channel_products_postgres(
-                                db,
-                                channel=channel,
-                                products=result.products,
-                                rate=rate,
-                                threshold=threshold,
-                                alerts_enabled=alerts_enabled,
-                                no_intel=no_intel,
-                            )
-                        else:
-                            save_outcome = await _save_channel_products_sqlite(
-                                db,
-                                channel=channel,
-                                products=result.products,
-                                rate=rate,
-                                threshold=threshold,
-                                alerts_enabled=alerts_enabled,
-                                no_intel=no_intel,
+                    ) as batches:
+                        async for batch in batches:
+                            # 앞선 배치 저장이 실패했으면 더 받지 않는다
+                            if any(f.done() and f.exception() for f in pending_saves):
+                                break
+                            batch = [
+                                info
+                                for info in _dedupe_product_infos(batch)
+                                if info.product_url not in seen_urls
+                            ]
+                            if not batch:
+                                continue
+                            seen_urls.update(info.product_url for info in batch)
+
+                            if rate is None:
+                                currency = batch[0].currency or "KRW"
+                                async with AsyncSessionLocal() as db:
+                                    rate = await get_rate_to_krw(db, currency)
+                                if rate is None:
+                                    console.print(
+                                        f"[yellow]환율 없음[/yellow] {currency} → 채널 {channel.name} 가격 저장 스킵"
+                                    )
+                                    result.error = f"Missing FX rate for {currency}"
+                                    result.error_type = "parse_error"
+                                    break
+
+                            pending_saves.append(
+                                await pipeline.submit(
+                                    channel=channel,
+                                    products=batch,
+                                    rate=rate,
+                                    threshold=threshold,
+                                    alerts_enabled=alerts_enabled,
+                                    no_intel=no_intel,
+                                )
                             )
-                        await db.commit()
-            except Exception as save_exc:
-                db_error_type = _classify_db_error(save_exc)
-                if db_error_type == "lock_timeout":
-                    console.print(f"[yellow]lock timeout:[/yellow] {channel.name}")
-                elif db_error_type == "statement_timeout":
-                    console.print(f"[yellow]statement timeout:[/yellow] {channel.name}")
-                result.error = f"save_error: {str(save_exc)[:180]}"
-                result.error_type = db_error_type or "internal_error"
-                result.products = []
-                save_outcome = ChannelSaveOutcome()
-
-        log_status = "success" if not result.error else "failed"
-        if not result.products and not result.error:
-            log_status = "skipped"
+            except TimeoutError:
+                result.error = f"Channel timeout after {chan_timeout}s"
+                result.error_type = "timeout"
+            except Exception as exc:
+                fetch_error = exc
+
+    # 큐에 넘긴 배치가 모두 커밋될 때까지 대기 (sem 슬롯은 다음 채널 fetch에 양보)
+    for saved in await asyncio.gather(*pending_saves, return_exceptions=True):
+        if isinstance(saved, BaseException):
+            fetch_error = fetch_error or saved
+        else:
+            save_outcome.merge(saved)
 
+    if result.error_type == "timeout":
+        console.print(
+            f"[red]⏱ timeout:[/red] {channel.name} ({chan_timeout}s 초과,"
+            f" 저장된 {save_outcome.products_count}개 유지)"
+        )
+    elif fetch_error is not None and not result.error:
+        db_error_type = _classify_db_error(fetch_error)
+        if db_error_type == "lock_timeout":
+            console.print(f"[yellow]lock timeout:[/yellow] {channel.name}")
+        elif db_error_type == "statement_timeout":
+            console.print(f"[yellow]statement timeout:[/yellow] {channel.name}")
+        result.error = f"save_error: {str(fetch_error)[:180]}"
+        result.error_type = db_error_type or "internal_error"
+
+    if save_outcome.products_count or result.incremental:
         try:
-            async with run_lock:
-                async with AsyncSessionLocal() as db:
-                    await _apply_crawl_db_timeouts(db)
-                    db.add(
-                        CrawlChannelLog(
-                            run_id=run_id,
-                            channel_id=channel.id,
-                            status=log_status,
-                            products_found=save_outcome.products_count if not result.error else 0,
-                            products_new=save_outcome.new_count,
-                            products_updated=save_outcome.updated_count,
-                            error_msg=(result.error or "")[:500] if result.error else None,
-                            error_type=(
-                                result.error_type
-                                if result.error
-                                else ("zero_products" if log_status == "skipped" else None)
-                            ),
-                            strategy=result.crawl_strategy,
-                            duration_ms=duration_ms,
-                        )
+            async with AsyncSessionLocal() as db:
+                await _apply_crawl_db_timeouts(db)
+                platform = _STRATEGY_PLATFORM.get(result.crawl_strategy)
+                if platform:
+                    await update_platform(db, channel.id, platform)
+                if result.crawl_strategy in CRAWL_STRATEGIES:
+                    # 다음 크롤은 이 전략(및 탐지한 카테고리)부터 바로 시도
+                    await update_crawl_fingerprint(
+                        db,
+                        channel.id,
+                        result.crawl_strategy,
+                        cafe24_categories=result.discovered_categories,
                     )
-                    await db.execute(
-                        text(
-                            "UPDATE crawl_runs SET"
-                            "  done_channels    = done_channels + 1,"
-                            "  new_products     = new_products + :new_p,"
-                            "  updated_products = updated_products + :upd_p,"
-                            "  error_channels   = error_channels + :err"
-                            " WHERE id = :run_id"
-                        ),
-                        {
-                            "new_p": save_outcome.new_count,
-                            "upd_p": save_outcome.updated_count,
-                            "err": 1 if result.error else 0,
-                            "run_id": run_id,
-                        },
+                walked_to_end = not result.error and not result.truncated
+                # 전체 카탈로그를 끝까지 순회한 경우에만 미확인 제품 아카이브
+                if walked_to_end and not result.incremental:
+                    archived = await archive_unseen_channel_products(
+                        db, channel.id, channel_started_at
                     )
-                    await db.commit()
-        except Exception as log_exc:
-            console.print(f"[red]CrawlChannelLog 기록 실패[/red] {channel.name}: {log_exc}")
-            try:
-                async with AsyncSessionLocal() as db2:
-                    db2.add(
-                        CrawlChannelLog(
-                            run_id=run_id,
-                            channel_id=channel.id,
-                            status="failed",
-                            products_found=0,
-                            products_new=0,
-                            products_updated=0,
-                            error_msg=f"Internal log error: {str(log_exc)[:200]}",
-                            error_type="internal_error",
-                            strategy=result.crawl_strategy,
-                            duration_ms=duration_ms,
-                        )
+                    if archived:
+                        console.print(f"[dim]  아카이브:[/dim] {channel.name} — {archived}개 미확인 제품")
+                if walked_to_end and result.crawl_strategy == "shopify-api":
+                    await update_crawl_watermark(
+                        db,
+                        channel.id,
+                        result.max_updated_at,
+                        full_sweep_at=None if result.incremental else channel_started_at,
                     )
-                    await db2.execute(
-                        text(
-                            "UPDATE crawl_runs SET done_channels = done_channels + 1,"
-                            " error_channels = error_channels + 1 WHERE id = :run_id"
+                await db.commit()
+        except Exception as finalize_exc:
+            console.print(f"[yellow]채널 정리 단계 실패(무시)[/yellow] {channel.name}: {finalize_exc}")
+
+    duration_ms = int((time.time() - t_start) * 1000)
+    stats = crawler.stats
+    log_status = "success" if not result.error else "failed"
+    if not save_outcome.products_count and not result.error and not result.incremental:
+        log_status = "skipped"
+
+    try:
+        async with run_lock:
+            async with AsyncSessionLocal() as db:
+                await _apply_crawl_db_timeouts(db)
+                db.add(
+                    CrawlChannelLog(
+                        run_id=run_id,
+                        channel_id=channel.id,
+                        status=log_status,
+                        products_found=save_outcome.products_count,
+                        products_new=save_outcome.new_count,
+                        products_updated=save_outcome.updated_count,
+                        price_changes=save_outcome.price_change_count,
+                        error_msg=(result.error or "")[:500] if result.error else None,
+                        error_type=(
+                            result.error_type
+                            if result.error
+                            else ("zero_products" if log_status == "skipped" else None)
                         ),
-                        {"run_id": run_id},
+                        strategy=result.crawl_strategy,
+                        duration_ms=duration_ms,
+                        fetch_ms=int(stats.fetch_seconds * 1000),
+                        parse_ms=int(stats.parse_seconds * 1000),
+                        brand_lookup_ms=int(save_outcome.brand_lookup_seconds * 1000),
+                        upsert_ms=int(save_outcome.upsert_seconds * 1000),
+                        history_ms=int(save_outcome.history_seconds * 1000),
+                        commit_ms=int(save_outcome.commit_seconds * 1000),
+                        bytes_downloaded=stats.bytes_downloaded,
+                        request_count=stats.request_count,
+                        retry_count=stats.retry_count,
                     )
-                    await db2.commit()
-            except Exception as log_retry_exc:
-                console.print(
-                    f"[bold red]CrawlChannelLog 재시도도 실패[/bold red] {channel.name}: {log_retry_exc}"
                 )
+                await db.execute(
+                    text(
+                        "UPDATE crawl_runs SET"
+                        "  done_channels    = done_channels + 1,"
+                        "  new_products     = new_products + :new_p,"
+                        "  updated_products = updated_products + :upd_p,"
+                        "  error_channels   = error_channels + :err"
+                        " WHERE id = :run_id"
+                    ),
+                    {
+                        "new_p": save_outcome.new_count,
+                        "upd_p": save_outcome.updated_count,
+                        "err": 1 if result.error else 0,
+                        "run_id": run_id,
+                    },
+                )
+                await db.commit()
+    except Exception as log_exc:
+        console.print(f"[red]CrawlChannelLog 기록 실패[/red] {channel.name}: {log_exc}")
+        try:
+            async with AsyncSessionLocal() as db2:
+                db2.add(
+                    CrawlChannelLog(
+                        run_id=run_id,
+                        channel_id=channel.id,
+                        status="failed",
+                        products_found=0,
+                        products_new=0,
+                        products_updated=0,
+                        error_msg=f"Internal log error: {str(log_exc)[:200]}",
+                        error_type="internal_error",
+                        strategy=result.crawl_strategy,
+                        duration_ms=duration_ms,
+                    )
+                )
+                await db2.execute(
+                    text(
+                        "UPDATE crawl_runs SET done_channels = done_channels + 1,"
+                        " error_channels = error_channels + 1 WHERE id = :run_id"
+                    ),
+                    {"run_id": run_id},
+                )
+                await db2.commit()
+        except Exception as log_retry_exc:
+            console.print(
+                f"[bold red]CrawlChannelLog 재시도도 실패[/bold red] {channel.name}: {log_retry_exc}"
+            )
+
+    status_icon = "✅" if not result.error else "❌"
+    products_count = save_outcome.products_count
+    console.print(
+        f"[dim]{status_icon} 완료:[/dim] {channel.name}"
+        f" — {products_count}개 (신규 {save_outcome.new_count}, 세일 {save_outcome.sale_count},"
+        f" 가격 유지 {save_outcome.unchanged_price_count})"
+        + (f" [red]{result.error[:60]}[/red]" if result.error else "")
+    )
+
+    return {
+        "channel_name": channel.name,
+        "country": channel.country or "-",
+        "products_count": products_count,
+        "sale_count": save_outcome.sale_count,
+        "new_count": save_outcome.new_count,
+        "error": result.error,
+    }
 
-        status_icon = "✅" if not result.error else "❌"
-        products_count = save_outcome.products_count if not result.error else 0
-        console.print(
-            f"[dim]{status_icon} 완료:[/dim] {channel.name}"
-            f" — {products_count}개 (신규 {save_outcome.new_count}, 세일 {save_outcome.sale_count})"
-            + (f" [red]{result.error[:60]}[/red]" if result.error else "")
-        )
 
-        return {
-            "channel_name": channel.name,
-            "country": channel.country or "-",
-            "products_count": products_count,
-            "sale_count": save_outcome.sale_count,
-            "new_count": save_outcome.new_count,
-            "error": result.error,
-            "post_commit_work": save_outcome.post_commit_work,
-        }
 @app.command()
 def main(
     limit: int = typer.Option(0, help="크롤링할 채널 수 (0=전체)"),
@@ -855,9 +1234,28 @@ def main(
     skip_catalog: bool = typer.Option(False, "--skip-catalog", help="크롤 완료 후 catalog 증분 빌드 생략"),
     no_intel: bool = typer.Option(False, "--no-intel", help="크롤 완료 후 intel ingest 자동 실행 비활성화"),
     concurrency: int = typer.Option(
-        2, help="동시 처리 채널 수 (기본 2, Shopify rate-limit 방지)"
+        6, help="동시 처리 채널 수 (기본 6, 요청 속도는 host별 rate limiter가 조절)"
+    ),
+    no_http_cache: bool = typer.Option(
+        False, "--no-http-cache", help="Shopify products.json ETag/해시 캐시 비활성화"
+    ),
+    full_sweep: bool = typer.Option(
+        False, "--full-sweep", help="Shopify 증분 크롤 대신 전체 카탈로그 순회 강제"
+    ),
+    writers: int = typer.Option(
+        2, help="배치 저장 writer 태스크 수 (PostgreSQL 전용, SQLite는 1로 고정)"
+    ),
+    parse_workers: int = typer.Option(
+        0, help="HTML/JSON 파싱 프로세스 수 (0=이벤트 루프에서 인라인 파싱)"
+    ),
+    record_dir: str = typer.Option("", help="응답 녹화 디렉터리 (지정 시 원본 응답을 gzip 저장)"),
+    replay_dir: str = typer.Option("", help="녹화 디렉터리에서 응답 재생 (네트워크 요청 없음)"),
+    replay_database_url: str = typer.Option(
+        "", help="재생 결과를 저장할 별도 DB URL (운영 DB 사본/임시 DB, --replay-dir에 필수)"
     ),
 ):
+    if replay_database_url.strip():
+        _use_database(replay_database_url.strip())
     asyncio.run(
         run(
             limit,
@@ -869,10 +1267,29 @@ def main(
             skip_catalog,
             no_intel,
             concurrency,
+            no_http_cache,
+            full_sweep,
+            writers,
+            parse_workers,
+            record_dir.strip() or None,
+            replay_dir.strip() or None,
         )
     )
 
 
+def _use_database(database_url: str) -> None:
+    """이 프로세스의 DB 연결을 database_url로 교체 (재생 모드가 설정 DB에 쓰지 않도록)."""
+    global engine
+    engine = create_async_engine(database_url, echo=settings.api_debug)
+    database.engine = engine  # init_db
+    AsyncSessionLocal.configure(bind=engine)
+
+
+def _is_configured_database() -> bool:
+    configured = make_url(settings.database_url).render_as_string(hide_password=False)
+    return engine.url.render_as_string(hide_password=False) == configured
+
+
 async def run(
     limit: int,
     channel_type: str | None,
@@ -883,7 +1300,32 @@ async def run(
     skip_catalog: bool,
     no_intel: bool,
     concurrency: int = 5,
-) -> None:
+    no_http_cache: bool = False,
+    full_sweep: bool = False,
+    writers: int = 2,
+    parse_workers: int = 0,
+    record_dir: str | None = None,
+    replay_dir: str | None = None,
+    channel_ids: list[int] | None = None,
+    post_pipeline: bool = True,
+) -> dict:
+    """크롤 런 실행. 반환값은 런 요약 (run_id, 채널 수, upsert 수, 저장 시간).
+
+    post_pipeline=False면 런 후처리(catalog·연관검색어·intel 잡)를 생략한다.
+    적응형 스케줄러는 틱마다 크롤만 하고 후처리는 별도 잡에서 모아 실행한다.
+    """
+    if record_dir and replay_dir:
+        raise typer.BadParameter("--record-dir와 --replay-dir는 함께 쓸 수 없습니다")
+    if replay_dir:
+        # 재생도 저장 경로(price_history·HWM·아카이브·CrawlRun)를 그대로 실행하므로 설정 DB에는 쓰지 않는다
+        if _is_configured_database():
+            raise typer.BadParameter(
+                "--replay-dir는 운영 DB 사본 등 별도 DB에서만 실행합니다 (--replay-database-url 지정)"
+            )
+        no_alerts = True
+    if record_dir or replay_dir:
+        # Shopify 증분 URL(updated_at_min)은 HWM·현재 시각에 따라 달라져 녹화본과 맞지 않는다
+        full_sweep = True
     console.print("[bold blue]Fashion Data Engine — 제품 가격 크롤링[/bold blue]\n")
     if settings.discord_webhook_url and not no_alerts:
         console.print("[green]Discord 알림 활성화[/green]")
@@ -898,6 +1340,8 @@ async def run(
         query = select(Channel).where(Channel.is_active == True)  # noqa: E712
         if channel_id:
             query = query.filter(Channel.id == channel_id)
+        if channel_ids is not None:
+            query = query.filter(Channel.id.in_(channel_ids))
         if channel_name:
             query = query.filter(Channel.name.ilike(f"%{channel_name}%"))
         if channel_type:
@@ -933,12 +1377,47 @@ async def run(
     # ── 병렬 크롤링 ──────────────────────────────────────────────────────────
     sem = asyncio.Semaphore(concurrency)
     run_lock = asyncio.Lock()
+    if replay_dir:
+        console.print(f"[cyan]재생 모드:[/cyan] {replay_dir} → {engine.url.render_as_string()} (네트워크 요청 없음)")
+    elif record_dir:
+        console.print(f"[cyan]녹화 모드:[/cyan] {record_dir}")
+    # 304 응답은 본문이 없어 녹화·재생할 수 없으므로 페이지 캐시 비활성화
+    page_cache = (
+        None
+        if no_http_cache or record_dir or replay_dir
+        else PageValidatorCache(settings.crawler_http_cache_dir, parser_version=PARSER_VERSION)
+    )
 
-    tasks = [
-        _crawl_one_channel(ch, run_id, no_alerts, no_intel, threshold, sem, run_lock)
-        for ch in channels
-    ]
-    raw_results = await asyncio.gather(*tasks, return_exceptions=True)
+    # SQLite는 쓰기 트랜잭션이 하나뿐이라 writer를 늘려도 lock 대기만 생긴다
+    if engine.dialect.name != "postgresql":
+        writers = 1
+    pipeline = CrawlWritePipeline(writers=writers)
+    pipeline.start()
+
+    # 런 전체가 커넥션 풀·TLS 세션·DNS 캐시를 공유한다
+    try:
+        with parse_pool(parse_workers):
+            async with build_http_client(record_dir=record_dir, replay_dir=replay_dir) as http_client:
+                tasks = [
+                    _crawl_one_channel(
+                        ch,
+                        run_id,
+                        no_alerts,
+                        no_intel,
+                        threshold,
+                        sem,
+                        run_lock,
+                        pipeline,
+                        page_cache=page_cache,
+                        http_client=http_client,
+                        full_sweep=full_sweep,
+                    )
+                    for ch in channels
+                ]
+                raw_results = await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        # 남은 저장·알림/intel 후처리까지 마친 뒤 런을 종료한다
+        await pipeline.close()
 
     # ── 결과 테이블 출력 ─────────────────────────────────────────────────────
     results_table = Table(title=f"크롤링 결과 (Run #{run_id})", show_lines=True)
@@ -965,13 +1444,6 @@ async def run(
                 r["error"] or "",
             )
 
-    for ch, raw in zip(channels, raw_results):
-        if isinstance(raw, Exception):
-            continue
-        work = raw.get("post_commit_work")
-        if work and (work.derived_events or work.alert_jobs):
-            await run_channel_post_commit_pipeline(channel=ch, work=work)
-
     # CrawlRun 완료 처리
     total_upserted = 0
     async with AsyncSessionLocal() as db:
@@ -985,12 +1457,20 @@ async def run(
 
     console.print(results_table)
     console.print(f"\n[bold green]CrawlRun #{run_id} 완료[/bold green]")
-    await run_post_commit_pipeline(
-        run_started_at=run_started_at,
-        skip_catalog=skip_catalog,
-        no_intel=no_intel,
-        total_upserted=total_upserted,
-    )
+    if post_pipeline:
+        await run_post_commit_pipeline(
+            run_started_at=run_started_at,
+            skip_catalog=skip_catalog,
+            no_intel=no_intel,
+            total_upserted=total_upserted,
+        )
+    return {
+        "run_id": run_id,
+        "channels": len(channels),
+        "total_upserted": total_upserted,
+        "save_seconds": pipeline.save_seconds,
+        "saved_batches": pipeline.saved_batches,
+    }
 
 
 if __name__ == "__main__":
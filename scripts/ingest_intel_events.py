@@ -29,8 +29,8 @@ from fashion_engine.models.intel import (  # noqa: E402
     IntelIngestLog,
     IntelIngestRun,
 )
-from fashion_engine.models.price_history import PriceHistory  # noqa: E402
 from fashion_engine.models.product import Product  # noqa: E402
+from fashion_engine.models.product_latest_price import ProductLatestPrice  # noqa: E402
 from fashion_engine.services.intel_service import (  # noqa: E402
     normalize_domain,
     notify_discord_if_warranted,
@@ -290,7 +290,7 @@ async def _ingest_shopify_drops(db: AsyncSession, run: IntelIngestRun) -> None:
                 .join(Channel, Product.channel_id == Channel.id)
                 .where(
                     Product.is_active == True,
-                    Product.updated_at >= since,
+                    Product.last_seen_at >= since,
                     Product.tags.is_not(None),
                     Channel.channel_type == "brand-store",
                     Channel.platform == "shopify",
@@ -344,6 +344,9 @@ async def _pick_sales_spike_candidates(
     """
     (brand_id, sale_count, sale_ratio_48h, avg_discount_48h) 반환.
     조건: sale_count >= 15 AND (sale_ratio_delta >= 0.15 OR discount_delta >= 0.10)
+    비율·할인율 모두 현재 상태(products.is_sale, product_latest_price)를
+    window/7일 안에 확인된(last_seen_at) 활성 제품 기준으로 비교한다.
+    (price_history는 변경 시에만 기록되어 기간 평균이 변경 건으로 치우친다)
     """
     since_window = utcnow() - timedelta(hours=window_hours)
     since_baseline = utcnow() - timedelta(days=7)
@@ -358,7 +361,7 @@ async def _pick_sales_spike_candidates(
             .where(
                 Product.brand_id.is_not(None),
                 Product.is_active == True,
-                Product.updated_at >= since_window,
+                Product.last_seen_at >= since_window,
             )
             .group_by(Product.brand_id)
             .having(func.sum(cast(Product.is_sale, Integer)) >= 15)
@@ -379,7 +382,7 @@ async def _pick_sales_spike_candidates(
             .where(
                 Product.brand_id.in_(brand_ids),
                 Product.is_active == True,
-                Product.updated_at >= since_baseline,
+                Product.last_seen_at >= since_baseline,
             )
             .group_by(Product.brand_id)
         )
@@ -398,14 +401,15 @@ async def _pick_sales_spike_candidates(
         await db.execute(
             select(
                 Product.brand_id,
-                func.avg(cast(PriceHistory.discount_rate, Float) / 100.0).label("avg_discount"),
+                func.avg(cast(ProductLatestPrice.discount_rate, Float) / 100.0).label("avg_discount"),
             )
-            .join(PriceHistory, PriceHistory.product_id == Product.id)
+            .join(ProductLatestPrice, ProductLatestPrice.product_id == Product.id)
             .where(
                 Product.brand_id.in_(brand_ids),
-                PriceHistory.is_sale == True,
-                PriceHistory.discount_rate.is_not(None),
-                PriceHistory.crawled_at >= since_window,
+                Product.is_active == True,
+                Product.last_seen_at >= since_window,
+                ProductLatestPrice.is_sale == True,
+                ProductLatestPrice.discount_rate.is_not(None),
             )
             .group_by(Product.brand_id)
         )
@@ -414,14 +418,15 @@ async def _pick_sales_spike_candidates(
         await db.execute(
             select(
                 Product.brand_id,
-                func.avg(cast(PriceHistory.discount_rate, Float) / 100.0).label("avg_discount"),
+                func.avg(cast(ProductLatestPrice.discount_rate, Float) / 100.0).label("avg_discount"),
             )
-            .join(PriceHistory, PriceHistory.product_id == Product.id)
+            .join(ProductLatestPrice, ProductLatestPrice.product_id == Product.id)
             .where(
                 Product.brand_id.in_(brand_ids),
-                PriceHistory.is_sale == True,
-                PriceHistory.discount_rate.is_not(None),
-                PriceHistory.crawled_at >= since_baseline,
+                Product.is_active == True,
+                Product.last_seen_at >= since_baseline,
+                ProductLatestPrice.is_sale == True,
+                ProductLatestPrice.discount_rate.is_not(None),
             )
             .group_by(Product.brand_id)
         )
@@ -19,10 +19,11 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "src"))
 
-from fashion_engine.crawler.product_classifier import classify_gender_and_subcategory
+from fashion_engine.crawler.product_classifier import classify_many
 
 
 DB_PATH = ROOT / "data" / "fashion.db"
+CHUNK_SIZE = 5000
 
 
 def reclassify(apply: bool) -> None:
@@ -32,33 +33,34 @@ def reclassify(apply: bool) -> None:
     conn = sqlite3.connect(DB_PATH)
     cur = conn.cursor()
 
-    rows = cur.execute(
+    cur.execute(
         """
         SELECT id, name, description, gender, subcategory
         FROM products
         ORDER BY id
         """
-    ).fetchall()
+    )
 
     changed: list[tuple[str | None, str | None, int]] = []
+    scanned = 0
     gender_changed = 0
     subcat_changed = 0
 
-    for product_id, name, description, prev_gender, prev_subcategory in rows:
-        next_gender, next_subcategory = classify_gender_and_subcategory(
-            product_type=None,
-            title=name or "",
-            tags=description or "",
-        )
-        if next_gender != prev_gender or next_subcategory != prev_subcategory:
-            changed.append((next_gender, next_subcategory, product_id))
-            if next_gender != prev_gender:
-                gender_changed += 1
-            if next_subcategory != prev_subcategory:
-                subcat_changed += 1
+    while rows := cur.fetchmany(CHUNK_SIZE):
+        scanned += len(rows)
+        results = classify_many((None, name or "", description or "") for _, name, description, _, _ in rows)
+        for (product_id, _, _, prev_gender, prev_subcategory), (next_gender, next_subcategory) in zip(
+            rows, results
+        ):
+            if next_gender != prev_gender or next_subcategory != prev_subcategory:
+                changed.append((next_gender, next_subcategory, product_id))
+                if next_gender != prev_gender:
+                    gender_changed += 1
+                if next_subcategory != prev_subcategory:
+                    subcat_changed += 1
 
     print(
-        f"products={len(rows)} changed={len(changed)} "
+        f"products={scanned} changed={len(changed)} "
         f"gender_changed={gender_changed} subcategory_changed={subcat_changed} "
         f"mode={'apply' if apply else 'dry-run'}"
     )
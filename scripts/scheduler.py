@@ -1,9 +1,15 @@
 """
 자동 크롤 스케줄러.
 
+제품 크롤은 기본적으로 적응형 스케줄(CRAWLER_ADAPTIVE_SCHEDULE=true)로 돈다:
+CRAWLER_SCHEDULE_TICK_MINUTES마다 채널별 변경 빈도로 due 채널을 골라 일일 요청 예산 안에서 크롤.
+틱은 크롤만 하고, catalog 증분 빌드·연관검색어 재빌드는 CRAWLER_POST_PIPELINE_INTERVAL_HOURS마다
+그동안의 변경분을 모아 한 번 실행한다 (intel spike/mirror는 원래 별도 잡).
+false면 기존처럼 매일 03:00 전체 채널 크롤 + 후처리.
+
 사용법:
   uv run python scripts/scheduler.py
-  uv run python scripts/scheduler.py --dry-run
+  uv run python scripts/scheduler.py --dry-run   # 스케줄 + 현재 적응형 크롤 계획만 출력
 """
 from __future__ import annotations
 
@@ -11,13 +17,14 @@ import argparse
 import asyncio
 import logging
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
-from sqlalchemy import select
+from apscheduler.triggers.interval import IntervalTrigger
+from sqlalchemy import func, select
 
 
 ROOT = Path(__file__).resolve().parent.parent
@@ -34,6 +41,7 @@ from fashion_engine.database import AsyncSessionLocal  # noqa: E402
 from fashion_engine.models.crawl_run import CrawlRun  # noqa: E402
 from fashion_engine.config import settings  # noqa: E402
 from fashion_engine.services.alert_service import send_audit_alert, send_heartbeat_alert  # noqa: E402
+from fashion_engine.services.crawl_schedule_service import plan_adaptive_crawl  # noqa: E402
 
 
 def setup_logger() -> logging.Logger:
@@ -95,18 +103,93 @@ async def run_product_crawl_job() -> None:
         await crawl_products.run(
             limit=0,
             channel_type=None,
+            country=None,
             channel_id=None,
             channel_name=None,
             no_alerts=False,
             skip_catalog=False,
             no_intel=False,
-            concurrency=2,
+            concurrency=6,
         )
         LOGGER.info("[JOB] products completed")
     except Exception:
         LOGGER.exception("[JOB] products failed")
 
 
+async def _plan_adaptive_crawl():
+    async with AsyncSessionLocal() as session:
+        return await plan_adaptive_crawl(
+            session,
+            exclude_channel_types=crawl_products.SKIP_TYPES,
+        )
+
+
+async def run_adaptive_product_crawl_job() -> None:
+    try:
+        plan = await _plan_adaptive_crawl()
+        LOGGER.info(
+            "[JOB] products-adaptive plan selected=%s due=%s deferred=%s est_requests=%s used_24h=%s/%s",
+            len(plan.selected),
+            plan.due_count,
+            plan.deferred_count,
+            plan.estimated_requests,
+            plan.requests_used_24h,
+            plan.request_budget,
+        )
+        if not plan.selected:
+            return
+        await crawl_products.run(
+            limit=0,
+            channel_type=None,
+            country=None,
+            channel_id=None,
+            channel_name=None,
+            no_alerts=False,
+            skip_catalog=False,
+            no_intel=False,
+            concurrency=6,
+            channel_ids=plan.channel_ids,
+            post_pipeline=False,
+        )
+        LOGGER.info("[JOB] products-adaptive completed")
+    except Exception:
+        LOGGER.exception("[JOB] products-adaptive failed")
+
+
+_last_post_pipeline_at: datetime | None = None  # UTC naive, 프로세스 재시작 시 최근 24시간부터
+
+
+async def _get_upserted_since(since: datetime) -> int:
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(func.sum(CrawlRun.new_products + CrawlRun.updated_products)).where(
+                CrawlRun.status == "done",
+                CrawlRun.finished_at > since,
+            )
+        )
+        return int(result.scalar() or 0)
+
+
+async def run_crawl_post_pipeline_job() -> None:
+    """적응형 틱 크롤들의 후처리(catalog 증분·연관검색어)를 모아서 실행."""
+    global _last_post_pipeline_at
+    started_at = datetime.utcnow()
+    since = _last_post_pipeline_at or started_at - timedelta(hours=24)
+    try:
+        LOGGER.info("[JOB] crawl-post-pipeline started since=%s", since.isoformat())
+        upserted = await _get_upserted_since(since)
+        await crawl_products.run_post_commit_pipeline(
+            run_started_at=since,
+            skip_catalog=upserted == 0,
+            no_intel=True,  # intel spike/mirror는 전용 잡이 실행
+            total_upserted=upserted,
+        )
+        _last_post_pipeline_at = started_at
+        LOGGER.info("[JOB] crawl-post-pipeline completed upserted=%s", upserted)
+    except Exception:
+        LOGGER.exception("[JOB] crawl-post-pipeline failed")
+
+
 async def run_data_audit_job() -> None:
     try:
         LOGGER.info("[JOB] data-audit started")
@@ -188,12 +271,31 @@ async def run_scheduler_heartbeat_job(scheduler: AsyncIOScheduler) -> None:
 
 
 def register_jobs(scheduler: AsyncIOScheduler) -> None:
-    scheduler.add_job(
-        run_product_crawl_job,
-        CronTrigger(hour=3, minute=0),
-        id="product_crawl_daily_0300",
-        replace_existing=True,
-    )
+    if settings.crawler_adaptive_schedule:
+        # 이전 틱 크롤이 아직 돌고 있으면 이번 틱은 건너뛴다 (max_instances=1)
+        scheduler.add_job(
+            run_adaptive_product_crawl_job,
+            IntervalTrigger(minutes=settings.crawler_schedule_tick_minutes),
+            id="product_crawl_adaptive",
+            max_instances=1,
+            coalesce=True,
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            run_crawl_post_pipeline_job,
+            CronTrigger(hour=f"*/{settings.crawler_post_pipeline_interval_hours}", minute=40),
+            id="crawl_post_pipeline",
+            max_instances=1,
+            coalesce=True,
+            replace_existing=True,
+        )
+    else:
+        scheduler.add_job(
+            run_product_crawl_job,
+            CronTrigger(hour=3, minute=0),
+            id="product_crawl_daily_0300",
+            replace_existing=True,
+        )
     scheduler.add_job(
         run_exchange_rates_job,
         CronTrigger(hour=7, minute=0),
@@ -250,6 +352,33 @@ def print_jobs(scheduler: AsyncIOScheduler) -> None:
         LOGGER.info("scheduled: id=%s next=%s", job.id, job.next_run_time)
 
 
+async def print_adaptive_plan() -> None:
+    try:
+        plan = await _plan_adaptive_crawl()
+    except Exception:
+        LOGGER.exception("adaptive plan failed")
+        return
+    LOGGER.info(
+        "adaptive plan: selected=%s due=%s deferred=%s est_requests=%s used_24h=%s/%s",
+        len(plan.selected),
+        plan.due_count,
+        plan.deferred_count,
+        plan.estimated_requests,
+        plan.requests_used_24h,
+        plan.request_budget,
+    )
+    for item in plan.selected:
+        LOGGER.info(
+            "  %s (id=%s) interval=%.1fh since=%s changes/h=%s est_requests=%s",
+            item.channel_name,
+            item.channel_id,
+            item.interval_hours,
+            f"{item.hours_since_crawl:.1f}h" if item.hours_since_crawl is not None else "never",
+            f"{item.changes_per_hour:.2f}" if item.changes_per_hour is not None else "-",
+            item.estimated_requests,
+        )
+
+
 async def main(dry_run: bool) -> None:
     tz_name = "Asia/Seoul"
     scheduler = AsyncIOScheduler(timezone=ZoneInfo(tz_name))
@@ -259,6 +388,8 @@ async def main(dry_run: bool) -> None:
     print_jobs(scheduler)
 
     if dry_run:
+        if settings.crawler_adaptive_schedule:
+            await print_adaptive_plan()
         scheduler.shutdown(wait=False)
         return
 
@@ -6,6 +6,7 @@
 - products: url 기반 ON CONFLICT DO UPDATE (PK는 Railway 자동 할당)
 - price_history: (product_id, crawled_at) 기반 ON CONFLICT DO NOTHING
   → products 이전 후 url→Railway_id 매핑을 통해 FK 재매핑
+- product_latest_price: 동기화한 제품만 price_history에서 재계산
 
 사용법:
     # dry-run (카운트만 확인)
@@ -30,6 +31,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 
 from fashion_engine.models.product import Product
 from fashion_engine.models.price_history import PriceHistory
+from fashion_engine.services.product_service import refresh_latest_prices
 
 
 def parse_args() -> argparse.Namespace:
@@ -239,6 +241,17 @@ async def main() -> int:
 
             print(f"\n  완료: {total_ph:,}개 upsert, {skipped_ph}개 제품 미매핑으로 건너뜀")
 
+            # ── Step 6: 동기화한 제품의 product_latest_price 재계산 ─────────
+            # 조회 API는 최신가를 product_latest_price에서 읽으므로 price_history만 넣으면 반영되지 않는다
+            print("▶ product_latest_price 재계산 중...")
+            synced_ids = sorted(set(sqlite_to_rwy.values()))
+            async with target_sm() as ts:
+                for i in range(0, len(synced_ids), batch_size):
+                    await refresh_latest_prices(ts, synced_ids[i : i + batch_size])
+                    await ts.commit()
+                    print(f"  {min(i + batch_size, len(synced_ids)):,}/{len(synced_ids):,}", end="\r")
+            print(f"\n  완료: {len(synced_ids):,}개 제품")
+
     finally:
         await source_engine.dispose()
         await target_engine.dispose()
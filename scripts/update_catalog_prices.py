@@ -8,7 +8,7 @@ product_catalog 의 가격 통계 컬럼을 최신 PriceHistory 기반으로 갱
 
 전략:
 1. exchange_rates 에서 환율 로드 (KRW 기준)
-2. price_history DISTINCT ON product_id (최신 레코드) → KRW 환산
+2. product_latest_price (제품별 최신 가격) → KRW 환산
 3. product_catalog 일괄 UPDATE
 
 사용법:
@@ -61,29 +61,17 @@ async def run(*, apply: bool, batch_size: int) -> int:
             fx[currency] = float(rate)
         print(f"환율 로드: {fx}")
 
-        # ── 2. 최신 PriceHistory per product (ROW_NUMBER — SQLite/PG 공용) ──
-        print("▶ 최신 가격 집계 중 (ROW_NUMBER per product)...")
+        # ── 2. 제품별 최신 가격 (product_latest_price) ──
+        print("▶ 최신 가격 로드 중 (product_latest_price)...")
         price_rows = (await db.execute(text("""
-            WITH ranked AS (
-                SELECT
-                    ph.product_id,
-                    ph.price,
-                    ph.currency,
-                    ph.is_sale,
-                    ROW_NUMBER() OVER (
-                        PARTITION BY ph.product_id
-                        ORDER BY ph.crawled_at DESC
-                    ) AS rn
-                FROM price_history ph
-            )
             SELECT
                 p.id AS product_id,
                 COALESCE(p.normalized_key, p.product_key) AS nkey,
-                r.price,
-                r.currency,
-                r.is_sale
+                lp.price,
+                lp.currency,
+                lp.is_sale
             FROM products p
-            JOIN ranked r ON r.product_id = p.id AND r.rn = 1
+            JOIN product_latest_price lp ON lp.product_id = p.id
             WHERE COALESCE(p.normalized_key, p.product_key) IS NOT NULL
         """))).all()
 
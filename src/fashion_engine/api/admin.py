@@ -30,6 +30,7 @@ from fashion_engine.models.intel import IntelEvent, IntelIngestRun
 from fashion_engine.api.schemas import (
     CrawlRunOut,
     CrawlRunDetail,
+    CrawlRunStageTotals,
     CrawlChannelLogOut,
     ChannelNoteOut,
     ChannelNoteCreate,
@@ -104,7 +105,7 @@ async def get_admin_stats(
         await db.execute(
             select(
                 func.max(ChannelBrand.crawled_at).label("brands_latest"),
-                func.max(PriceHistory.crawled_at).label("products_latest"),
+                func.max(Product.last_seen_at).label("products_latest"),
             )
         )
     ).one()
@@ -850,6 +851,8 @@ async def admin_patch_channel_instagram(
 
 # ── 크롤 모니터 ───────────────────────────────────────────────────────────────
 
+_CRAWL_LOG_STAGE_FIELDS = tuple(CrawlRunStageTotals.model_fields)
+
 
 @router.get("/crawl-runs", response_model=list[CrawlRunOut])
 async def get_crawl_runs(
@@ -869,10 +872,15 @@ async def get_crawl_runs(
 @router.get("/crawl-runs/{run_id}", response_model=CrawlRunDetail)
 async def get_crawl_run_detail(
     run_id: int,
+    sort: str = Query(
+        "crawled_at",
+        pattern="^(crawled_at|" + "|".join(_CRAWL_LOG_STAGE_FIELDS) + ")$",
+        description="채널 로그 정렬 기준 (crawled_at 외에는 큰 값부터)",
+    ),
     _: None = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    """특정 크롤 실행 상세 (채널별 로그 포함)."""
+    """특정 크롤 실행 상세 (채널별 로그 + 단계별 소요 시간 합계)."""
     run = (
         await db.execute(
             select(CrawlRun)
@@ -883,6 +891,10 @@ async def get_crawl_run_detail(
     if not run:
         raise HTTPException(status_code=404, detail="crawl run not found")
 
+    if sort == "crawled_at":
+        logs = sorted(run.logs, key=lambda l: l.crawled_at)
+    else:
+        logs = sorted(run.logs, key=lambda l: getattr(l, sort) or 0, reverse=True)
     logs_out = [
         CrawlChannelLogOut(
             id=log.id,
@@ -892,14 +904,30 @@ async def get_crawl_run_detail(
             products_found=log.products_found,
             products_new=log.products_new,
             products_updated=log.products_updated,
+            price_changes=log.price_changes,
             error_msg=log.error_msg,
             error_type=log.error_type,
             strategy=log.strategy,
             duration_ms=log.duration_ms,
+            fetch_ms=log.fetch_ms,
+            parse_ms=log.parse_ms,
+            brand_lookup_ms=log.brand_lookup_ms,
+            upsert_ms=log.upsert_ms,
+            history_ms=log.history_ms,
+            commit_ms=log.commit_ms,
+            bytes_downloaded=log.bytes_downloaded,
+            request_count=log.request_count,
+            retry_count=log.retry_count,
             crawled_at=log.crawled_at,
         )
-        for log in sorted(run.logs, key=lambda l: l.crawled_at)
+        for log in logs
     ]
+    stage_totals = CrawlRunStageTotals(
+        **{
+            name: sum(getattr(log, name) or 0 for log in run.logs)
+            for name in _CRAWL_LOG_STAGE_FIELDS
+        }
+    )
     return CrawlRunDetail(
         id=run.id,
         started_at=run.started_at,
@@ -910,6 +938,7 @@ async def get_crawl_run_detail(
         new_products=run.new_products,
         updated_products=run.updated_products,
         error_channels=run.error_channels,
+        stage_totals=stage_totals,
         logs=logs_out,
     )
 
@@ -7,8 +7,9 @@ from fashion_engine.database import get_db
 from fashion_engine.models.product_catalog import ProductCatalog
 from fashion_engine.models.product import Product
 from fashion_engine.models.brand import Brand
-from fashion_engine.models.price_history import PriceHistory
+from fashion_engine.models.product_latest_price import ProductLatestPrice
 from fashion_engine.api.schemas import CatalogOut, CatalogDetailOut, CatalogListingOut
+from fashion_engine.services.search_service import text_match
 
 router = APIRouter(prefix="/catalog", tags=["catalog"])
 
@@ -71,7 +72,7 @@ async def list_catalog(
     if max_price is not None:
         stmt = stmt.where(ProductCatalog.min_price_krw <= max_price)
     if q:
-        stmt = stmt.where(ProductCatalog.canonical_name.ilike(f"%{q}%"))
+        stmt = stmt.where(text_match(db, [ProductCatalog.canonical_name], q))
 
     # 정렬
     sort_col = {
@@ -113,19 +114,19 @@ async def get_catalog_detail(
         .options(selectinload(Product.channel))
     )).scalars().all()
 
-    # 제품별 최신 PriceHistory 조회
+    # 제품별 최신 가격 (product_latest_price)
     product_ids = [p.id for p in products]
-    latest_prices: dict[int, PriceHistory] = {}
+    latest_prices: dict[int, tuple] = {}
     if product_ids:
-        # DISTINCT ON (product_id) 최신 가격
-        from sqlalchemy import text
-        ph_rows = (await db.execute(text("""
-            SELECT DISTINCT ON (product_id)
-                product_id, price, currency, is_sale, discount_rate
-            FROM price_history
-            WHERE product_id = ANY(:pids)
-            ORDER BY product_id, crawled_at DESC
-        """), {"pids": product_ids})).all()
+        ph_rows = (await db.execute(
+            select(
+                ProductLatestPrice.product_id,
+                ProductLatestPrice.price,
+                ProductLatestPrice.currency,
+                ProductLatestPrice.is_sale,
+                ProductLatestPrice.discount_rate,
+            ).where(ProductLatestPrice.product_id.in_(product_ids))
+        )).all()
         for row in ph_rows:
             latest_prices[row[0]] = row
 
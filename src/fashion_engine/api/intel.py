@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from fashion_engine.api.schemas import (
     IntelEventsPage,
+    IntelMapClusterOut,
     IntelMapPointOut,
     IntelTimelineOut,
     IntelEventOut,
@@ -80,6 +81,23 @@ async def get_map_points(
     )
 
 
+@router.get("/map-clusters", response_model=list[IntelMapClusterOut])
+async def get_map_clusters(
+    zoom: int = Query(3, ge=0, le=20),
+    layers: str | None = Query(None, description="CSV layers"),
+    time_range: str = Query("7d", description="24h|7d|30d|90d|all"),
+    bbox: str | None = Query(None, description="min_lng,min_lat,max_lng,max_lat"),
+    db: AsyncSession = Depends(get_db),
+):
+    return await intel_service.get_map_clusters(
+        db,
+        zoom=zoom,
+        layers=_parse_csv(layers),
+        time_range=time_range,
+        bbox=_parse_bbox(bbox),
+    )
+
+
 @router.get("/timeline", response_model=IntelTimelineOut)
 async def get_timeline(
     layers: str | None = Query(None, description="CSV layers"),
@@ -1,3 +1,5 @@
+import asyncio
+import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException
@@ -5,7 +7,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import text
 
 from fashion_engine.config import settings
-from fashion_engine.database import AsyncSessionLocal
+from fashion_engine.database import AsyncSessionLocal, engine
 from fashion_engine.api.channels import router as channels_router
 from fashion_engine.api.brands import router as brands_router
 from fashion_engine.api.collabs import router as collabs_router
@@ -18,11 +20,35 @@ from fashion_engine.api.news import router as news_router
 from fashion_engine.api.directors import router as directors_router
 from fashion_engine.api.catalog import router as catalog_router
 from fashion_engine.api.intel import router as intel_router
+from fashion_engine.api.response_cache import ResponseCacheMiddleware
+from fashion_engine.services.search_service import create_sqlite_fts
+from fashion_engine.services.search_suggestion_service import ensure_search_suggestions
+
+logger = logging.getLogger(__name__)
+
+
+async def _fill_search_suggestions() -> None:
+    # 마이그레이션 직후 빈 인덱스를 다음 크롤 후처리까지 기다리지 않고 채운다
+    try:
+        async with AsyncSessionLocal() as db:
+            rows = await ensure_search_suggestions(db)
+        if rows is not None:
+            logger.info("search_suggestions 초기 빌드: %s행", rows)
+    except Exception:
+        # 여러 워커가 동시에 빌드하면 한쪽은 PK 충돌로 실패한다 — 다른 워커가 채웠으므로 무시
+        logger.warning("search_suggestions 초기 빌드 실패", exc_info=True)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    if engine.dialect.name == "sqlite":
+        # 로컬 DB가 FTS 도입 이전에 만들어졌어도 검색이 동작하도록 (이미 있으면 no-op)
+        async with engine.begin() as conn:
+            await conn.run_sync(create_sqlite_fts)
+    fill_task = asyncio.create_task(_fill_search_suggestions())
     yield
+    if not fill_task.done():
+        fill_task.cancel()
 
 
 app = FastAPI(
@@ -32,6 +58,8 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# CORS보다 안쪽에 둬야 캐시된 응답에도 요청 Origin별 CORS 헤더가 붙는다
+app.add_middleware(ResponseCacheMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_allowed_origins_list,
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from fashion_engine.database import get_db
-from fashion_engine.services import product_service
+from fashion_engine.services import product_service, search_suggestion_service
 from fashion_engine.api.schemas import (
     ProductOut,
     PriceComparisonOut,
@@ -103,7 +103,7 @@ async def related_searches(
     db: AsyncSession = Depends(get_db),
 ):
     """검색어 연관검색어 제안."""
-    return await product_service.get_related_searches(db, q=q, limit=limit)
+    return await search_suggestion_service.get_related_searches(db, q=q, limit=limit)
 
 
 @router.get("/compare/{product_key:path}", response_model=PriceComparisonOut)
@@ -0,0 +1,186 @@
+"""
+공개 조회 API 응답 캐시 + ETag/304.
+
+- 대상: CACHED_PATHS의 GET 요청. 키는 경로 + 정렬된 쿼리 파라미터 + 데이터 버전.
+- 데이터 버전: crawl_runs / intel_ingest_runs의 최신 finished_at.
+  크롤·인텔 수집은 별도 프로세스(스케줄러·스크립트)에서 돌기 때문에 DB 값으로 변경을 감지한다.
+  런이 끝나면 버전이 바뀌어 기존 키는 더 이상 조회되지 않는다 (LRU로 밀려남).
+  버전 조회 자체도 _VERSION_CHECK_SECONDS 동안 재사용한다.
+- API 프로세스 안의 관리자 쓰기 요청(_INVALIDATING_PREFIXES)이 성공하면 로컬에서 즉시 무효화한다.
+  공개 쓰기(/watchlist, /purchases, /drops 등)는 캐시 대상 응답에 영향이 없어 무효화하지 않는다.
+  런 외 변경은 늦어도 settings.api_response_cache_ttl_seconds 안에 반영된다.
+- ETag는 본문 해시라 재계산 결과가 같으면 If-None-Match로 304를 돌려준다.
+
+기본 백엔드는 프로세스 내 TTL LRU. 여러 워커가 캐시를 공유하려면
+ResponseCacheBackend를 구현해 set_response_cache_backend()로 교체한다.
+"""
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Protocol
+
+from sqlalchemy import func, select
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import Response
+
+from fashion_engine.config import settings
+from fashion_engine.database import AsyncSessionLocal
+from fashion_engine.models.crawl_run import CrawlRun
+from fashion_engine.models.intel import IntelIngestRun
+
+CACHED_PATHS = frozenset(
+    {
+        "/products/sales-highlights",
+        "/products/ranking",
+        "/brands/landscape",
+        "/channels/landscape",
+        "/catalog/",
+        "/intel/highlights",
+    }
+)
+_VERSION_CHECK_SECONDS = 10.0
+_CACHE_CONTROL = "no-cache"  # 브라우저는 저장하되 매번 ETag로 재검증
+_MUTATING_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+_INVALIDATING_PREFIXES = ("/admin/",)
+_DROP_HEADERS = frozenset({"content-length", "etag", "cache-control"})
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    headers: tuple[tuple[str, str], ...]
+    etag: str
+
+
+class ResponseCacheBackend(Protocol):
+    def get(self, key: str) -> CachedResponse | None: ...
+
+    def set(self, key: str, value: CachedResponse, ttl: float) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class _MemoryBackend:
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[CachedResponse, float]] = OrderedDict()
+
+    def get(self, key: str) -> CachedResponse | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: CachedResponse, ttl: float) -> None:
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_backend: ResponseCacheBackend = _MemoryBackend(settings.api_response_cache_max_entries)
+_data_version: tuple[str, float] | None = None  # (버전, 확인 시각)
+_local_generation = 0
+
+
+def set_response_cache_backend(backend: ResponseCacheBackend) -> None:
+    global _backend
+    _backend = backend
+
+
+def invalidate_response_cache() -> None:
+    """캐시 비우고 다음 요청에서 데이터 버전을 다시 읽게 한다."""
+    global _data_version, _local_generation
+    _local_generation += 1
+    _data_version = None
+    _backend.clear()
+
+
+async def _current_data_version() -> str:
+    global _data_version
+    now = time.monotonic()
+    if _data_version is not None and now - _data_version[1] < _VERSION_CHECK_SECONDS:
+        return _data_version[0]
+    async with AsyncSessionLocal() as db:
+        crawl_finished = (await db.execute(select(func.max(CrawlRun.finished_at)))).scalar()
+        intel_finished = (await db.execute(select(func.max(IntelIngestRun.finished_at)))).scalar()
+    version = f"{crawl_finished}|{intel_finished}|{_local_generation}"
+    _data_version = (version, now)
+    return version
+
+
+def _cache_key(request: Request, version: str) -> str:
+    params = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    return f"{request.url.path}?{params}#{version}"
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {value.strip() for value in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": _CACHE_CONTROL})
+
+
+def _cached_response(entry: CachedResponse, cache_status: str) -> Response:
+    response = Response(content=entry.body, status_code=200)
+    for key, value in entry.headers:
+        response.headers.append(key, value)
+    response.headers["ETag"] = entry.etag
+    response.headers["Cache-Control"] = _CACHE_CONTROL
+    response.headers["X-Cache"] = cache_status
+    return response
+
+
+class ResponseCacheMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        if not settings.api_response_cache_enabled:
+            return await call_next(request)
+        if request.method in _MUTATING_METHODS and request.url.path.startswith(
+            _INVALIDATING_PREFIXES
+        ):
+            response = await call_next(request)
+            if response.status_code < 400:
+                invalidate_response_cache()
+            return response
+        if request.method != "GET" or request.url.path not in CACHED_PATHS:
+            return await call_next(request)
+
+        key = _cache_key(request, await _current_data_version())
+        entry = _backend.get(key)
+        if entry is not None:
+            if _etag_matches(request, entry.etag):
+                return _not_modified(entry.etag)
+            return _cached_response(entry, "HIT")
+
+        response = await call_next(request)
+        if response.status_code != 200:
+            return response
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        entry = CachedResponse(
+            body=body,
+            headers=tuple(
+                (k, v) for k, v in response.headers.items() if k.lower() not in _DROP_HEADERS
+            ),
+            etag='W/"' + hashlib.sha1(body).hexdigest()[:20] + '"',
+        )
+        _backend.set(key, entry, settings.api_response_cache_ttl_seconds)
+        if _etag_matches(request, entry.etag):
+            return _not_modified(entry.etag)
+        return _cached_response(entry, "MISS")
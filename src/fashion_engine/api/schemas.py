@@ -382,10 +382,21 @@ class CrawlChannelLogOut(BaseModel):
     products_found: int
     products_new: int
     products_updated: int
+    price_changes: int | None = None
     error_msg: str | None
     error_type: str | None
     strategy: str | None
     duration_ms: int
+    # 단계별 계측 — 계측 도입 전 로그는 None
+    fetch_ms: int | None = None
+    parse_ms: int | None = None
+    brand_lookup_ms: int | None = None
+    upsert_ms: int | None = None
+    history_ms: int | None = None
+    commit_ms: int | None = None
+    bytes_downloaded: int | None = None
+    request_count: int | None = None
+    retry_count: int | None = None
     crawled_at: datetime
 
     model_config = {"from_attributes": True}
@@ -405,7 +416,22 @@ class CrawlRunOut(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class CrawlRunStageTotals(BaseModel):
+    """런 전체 채널 합계 — 어느 단계가 야간 크롤 시간을 차지하는지 확인용."""
+    duration_ms: int = 0
+    fetch_ms: int = 0
+    parse_ms: int = 0
+    brand_lookup_ms: int = 0
+    upsert_ms: int = 0
+    history_ms: int = 0
+    commit_ms: int = 0
+    bytes_downloaded: int = 0
+    request_count: int = 0
+    retry_count: int = 0
+
+
 class CrawlRunDetail(CrawlRunOut):
+    stage_totals: CrawlRunStageTotals = CrawlRunStageTotals()
     logs: list[CrawlChannelLogOut]
 
 
@@ -471,7 +497,8 @@ class IntelEventOut(BaseModel):
 class IntelEventsPage(BaseModel):
     items: list[IntelEventOut]
     next_cursor: str | None
-    total: int
+    total: int | None  # 첫 페이지에서만 계산 (cursor 요청은 None)
+    total_capped: bool = False  # True면 total은 상한값(실제는 더 많음)
 
 
 class IntelMapPointOut(BaseModel):
@@ -486,6 +513,15 @@ class IntelMapPointOut(BaseModel):
     geo_precision: str
 
 
+class IntelMapClusterOut(BaseModel):
+    key: str
+    lat: float
+    lng: float
+    count: int
+    max_severity: str | None = None
+    sample_id: int
+
+
 class IntelTimelineBucket(BaseModel):
     bucket: str
     total: int
@@ -12,11 +12,23 @@ class Settings(BaseSettings):
     crawler_max_retries: int = 3
     crawler_timeout_seconds: int = 30
     crawler_headless: bool = True
+    crawler_http_cache_dir: str = "data/http_cache"  # Shopify products.json ETag/해시 캐시
+    crawler_full_sweep_hours: int = 24  # Shopify 증분 크롤 중 전체 순회(삭제 감지) 주기
+    crawler_html_parser: str = "auto"  # HTML 파서 백엔드: auto(lxml 있으면 lxml) / lxml / html.parser
+    crawler_adaptive_schedule: bool = True  # 스케줄러가 채널 변경 빈도 기반으로 크롤 (False면 일일 전체 크롤)
+    crawler_schedule_tick_minutes: int = 60
+    crawler_post_pipeline_interval_hours: int = 6  # 적응형 스케줄: catalog·연관검색어 후처리 주기 (틱마다 돌리지 않음)
+    crawler_daily_request_budget: int = 30000  # 적응형 스케줄 최근 24시간 요청 상한
+    crawler_min_interval_hours: float = 2.0
+    crawler_max_interval_hours: float = 72.0
 
     api_host: str = "0.0.0.0"
     api_port: int = 8000
     api_debug: bool = True
     admin_bearer_token: str | None = None
+    api_response_cache_enabled: bool = True  # 공개 조회 API 응답 캐시 (크롤/인텔 런 완료 시 무효화)
+    api_response_cache_ttl_seconds: int = 600
+    api_response_cache_max_entries: int = 1000
 
     discord_webhook_url: str | None = None
     intel_discord_webhook_url: str | None = None
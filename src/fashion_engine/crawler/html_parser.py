@@ -0,0 +1,52 @@
+"""
+크롤러 HTML 파서 백엔드 선택.
+
+BeautifulSoup 트리 빌더만 바꿔 끼우므로 select()/get_text() 호출부는 그대로 유지된다.
+- lxml: C 기반 파서 (기본 의존성)
+- html.parser: 표준 라이브러리, lxml import 실패 시 fallback
+
+CRAWLER_HTML_PARSER 설정(auto / lxml / html.parser)으로 강제할 수 있다.
+두 파서의 결과 동등성은 scripts/bench_html_parsers.py로 data/fixtures/html/ 페이지에서 확인한다.
+"""
+from __future__ import annotations
+
+import logging
+
+from bs4 import BeautifulSoup
+
+from fashion_engine.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except Exception:  # pragma: no cover - optional dependency fallback
+    LXML_AVAILABLE = False
+
+HTML_PARSER_BACKENDS: tuple[str, ...] = ("lxml", "html.parser")
+
+_warned_missing: set[str] = set()
+
+
+def resolve_parser(name: str | None = None) -> str:
+    """설정값(auto/lxml/html.parser)을 실제 사용 가능한 BeautifulSoup 파서명으로 변환."""
+    name = (name or settings.crawler_html_parser or "auto").strip().lower()
+    if name == "auto":
+        return "lxml" if LXML_AVAILABLE else "html.parser"
+    if name == "lxml" and not LXML_AVAILABLE:
+        if name not in _warned_missing:
+            _warned_missing.add(name)
+            logger.warning("lxml 미설치 — html.parser로 대체")
+        return "html.parser"
+    if name not in HTML_PARSER_BACKENDS:
+        if name not in _warned_missing:
+            _warned_missing.add(name)
+            logger.warning("알 수 없는 HTML 파서 %r — html.parser로 대체", name)
+        return "html.parser"
+    return name
+
+
+def make_soup(markup: str | bytes, parser: str | None = None) -> BeautifulSoup:
+    """설정된 백엔드로 BeautifulSoup 문서를 만든다."""
+    return BeautifulSoup(markup, resolve_parser(parser))
@@ -0,0 +1,122 @@
+"""
+Shopify /products.json 페이지 단위 HTTP validator 캐시.
+
+채널(host)별 JSON 파일에 페이지 URL → ETag / Last-Modified / 본문 해시와
+해당 페이지에서 파싱된 제품 row 목록을 저장한다.
+다음 크롤에서 304 응답이 오거나 본문 해시가 같으면 파싱을 건너뛰고 캐시된 row를 재사용한다.
+
+캐시된 row는 파싱 결과이므로 파일마다 parser_version(product_crawler.PARSER_VERSION)을 기록하고,
+현재 파서와 다르면 (분류 규칙·ProductInfo 필드 변경 등) 파일 전체를 버린다.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+_CACHE_VERSION = 2
+
+
+@dataclass
+class PageValidator:
+    etag: str | None
+    last_modified: str | None
+    content_hash: str
+    currency: str
+    item_count: int                      # 페이지 원본 제품 수 (페이지네이션 종료 판단용)
+    products: list[dict] = field(default_factory=list)  # ProductInfo asdict 목록
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ChannelPageCache:
+    """채널 1개 크롤 동안 사용하는 페이지 캐시 뷰.
+
+    끝까지 순회한 크롤은 방문한 페이지만 기록하므로, 카탈로그가 줄어들어
+    더 이상 존재하지 않는 페이지 항목은 자연스럽게 정리된다.
+    """
+
+    def __init__(self, path: Path, previous: dict[str, PageValidator], parser_version: str = ""):
+        self._path = path
+        self._previous = previous
+        self._parser_version = parser_version
+        self._current: dict[str, PageValidator] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, url: str, currency: str) -> PageValidator | None:
+        entry = self._previous.get(url)
+        if entry is None or entry.currency != currency:
+            return None
+        return entry
+
+    def put(self, url: str, entry: PageValidator) -> None:
+        self._current[url] = entry
+
+    def save(self, complete: bool = True) -> None:
+        """방문한 페이지를 기록한다. complete=False(중도 실패)면 기존 항목을 유지한 채 병합한다."""
+        pages = self._current if complete else {**self._previous, **self._current}
+        if not pages and not self._previous:
+            return
+        payload = {
+            "version": _CACHE_VERSION,
+            "parser": self._parser_version,
+            "pages": {url: asdict(entry) for url, entry in pages.items()},
+        }
+        tmp_path = self._path.with_suffix(".tmp")
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(
+                json.dumps(payload, ensure_ascii=False, separators=(",", ":")),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, self._path)
+        except OSError as exc:
+            logger.warning("HTTP 캐시 저장 실패 [%s]: %s", self._path, exc)
+
+
+class PageValidatorCache:
+    """cache_dir 아래 host별 JSON 파일로 영속화되는 validator 캐시."""
+
+    def __init__(self, cache_dir: str | Path, parser_version: str = ""):
+        self._dir = Path(cache_dir)
+        self._parser_version = parser_version
+
+    def _path_for(self, channel_url: str) -> Path:
+        host = urlparse(channel_url).netloc.lower() or "unknown"
+        safe = "".join(ch if ch.isalnum() or ch in ".-" else "_" for ch in host)
+        return self._dir / f"{safe}.json"
+
+    def open_channel(self, channel_url: str) -> ChannelPageCache:
+        path = self._path_for(channel_url)
+        previous: dict[str, PageValidator] = {}
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            raw = None
+        except (OSError, ValueError) as exc:
+            logger.warning("HTTP 캐시 로드 실패 [%s]: %s", path, exc)
+            raw = None
+
+        if (
+            isinstance(raw, dict)
+            and raw.get("version") == _CACHE_VERSION
+            and raw.get("parser") == self._parser_version
+        ):
+            for url, row in (raw.get("pages") or {}).items():
+                try:
+                    previous[url] = PageValidator(**row)
+                except TypeError:
+                    continue
+        return ChannelPageCache(path, previous, self._parser_version)
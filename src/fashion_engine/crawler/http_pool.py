@@ -0,0 +1,161 @@
+"""
+크롤 런 단위 공유 HTTP 클라이언트.
+
+채널마다 httpx.AsyncClient를 새로 만들면 TLS 핸드셰이크·커넥션 풀·DNS 조회가 매번 반복된다.
+crawl_products.py는 런 시작 시 클라이언트 하나를 만들고 모든 채널의 ProductCrawler가 빌려 쓴다.
+채널별 User-Agent 등 헤더는 ProductCrawler가 요청마다 붙인다.
+
+- HTTP/2: `httpx[http2]` 의존성(h2)으로 활성화. h2 import 실패 시 HTTP/1.1
+- keep-alive: host당 커넥션을 재사용하도록 풀 크기·만료 시간 조정
+- DNS 캐시: 새 커넥션 생성 시 getaddrinfo 주소 목록을 TTL 동안 재사용, 연결 실패 시 다음 주소 시도
+  httpx에 network backend 주입 API가 없어 httpcore 풀 내부를 감싸므로
+  httpx/httpcore 버전은 pyproject.toml에서 고정한다 (<0.29 / <2).
+- 녹화/재생: replay_cache transport로 응답 저장 또는 오프라인 재생
+"""
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import logging
+import socket
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable
+
+import httpcore
+import httpx
+
+from fashion_engine.crawler.replay_cache import RecordingTransport, ReplayTransport
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except Exception:  # pragma: no cover - optional dependency fallback
+    HTTP2_AVAILABLE = False
+
+_DNS_TTL_SECONDS = 300.0
+_POOL_LIMITS = httpx.Limits(
+    max_connections=200,
+    max_keepalive_connections=100,
+    keepalive_expiry=60.0,
+)
+_CLIENT_TIMEOUT = httpx.Timeout(connect=10.0, read=30.0, write=10.0, pool=5.0)
+
+
+class _CachingDNSBackend(httpcore.AsyncNetworkBackend):
+    """connect_tcp 전에 host를 캐시된 IP로 치환하는 네트워크 백엔드 래퍼.
+
+    TLS SNI/인증서 검증은 httpcore가 원래 host로 수행하므로 IP 치환의 영향을 받지 않는다.
+    """
+
+    def __init__(self, inner: httpcore.AsyncNetworkBackend, ttl: float = _DNS_TTL_SECONDS):
+        self._inner = inner
+        self._ttl = ttl
+        self._cache: dict[tuple[str, int], tuple[list[str], float]] = {}
+
+    async def _resolve(self, host: str, port: int) -> list[str]:
+        try:
+            ipaddress.ip_address(host)
+            return [host]
+        except ValueError:
+            pass
+
+        key = (host, port)
+        cached = self._cache.get(key)
+        now = time.monotonic()
+        if cached and cached[1] > now:
+            return cached[0]
+
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            host, port, type=socket.SOCK_STREAM
+        )
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        if not addresses:
+            return [host]
+        self._cache[key] = (addresses, now + self._ttl)
+        return addresses
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Iterable | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        try:
+            addresses = await self._resolve(host, port)
+        except OSError:
+            addresses = [host]
+        if socket_options is not None:
+            socket_options = list(socket_options)
+
+        last_exc: Exception | None = None
+        for address in addresses:
+            try:
+                return await self._inner.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout, OSError) as exc:
+                # 한 주소가 죽어도(IPv6 미지원, 장애 노드) 나머지 주소로 시도
+                last_exc = exc
+        # 모든 주소 실패 — 레코드가 바뀌었을 수 있으니 다음 연결에서 다시 조회
+        self._cache.pop((host, port), None)
+        assert last_exc is not None
+        raise last_exc
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: Iterable | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._inner.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        await self._inner.sleep(seconds)
+
+
+def build_http_client(
+    headers: dict[str, str] | None = None,
+    timeout: httpx.Timeout = _CLIENT_TIMEOUT,
+    record_dir: str | Path | None = None,
+    replay_dir: str | Path | None = None,
+    replay_at: datetime | None = None,
+) -> httpx.AsyncClient:
+    """HTTP/2·keep-alive·DNS 캐시가 적용된 AsyncClient 생성.
+
+    record_dir를 주면 응답을 녹화하고, replay_dir를 주면 네트워크 대신 녹화본으로 응답한다.
+    """
+    if replay_dir is not None:
+        return httpx.AsyncClient(
+            transport=ReplayTransport(replay_dir, replay_at=replay_at),
+            headers=headers,
+            follow_redirects=True,
+            timeout=timeout,
+        )
+
+    transport = httpx.AsyncHTTPTransport(http2=HTTP2_AVAILABLE, limits=_POOL_LIMITS)
+    # httpx는 network backend 주입 API가 없어 내부 커넥션 풀의 백엔드를 감싼다.
+    pool = getattr(transport, "_pool", None)
+    inner_backend = getattr(pool, "_network_backend", None)
+    if inner_backend is not None:
+        pool._network_backend = _CachingDNSBackend(inner_backend)
+    else:  # pragma: no cover - httpx 내부 구조 변경 시
+        logger.debug("httpx transport 구조가 달라 DNS 캐시를 건너뜀")
+
+    return httpx.AsyncClient(
+        transport=RecordingTransport(transport, record_dir) if record_dir is not None else transport,
+        headers=headers,
+        follow_redirects=True,
+        timeout=timeout,
+    )
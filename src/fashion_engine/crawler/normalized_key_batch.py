@@ -0,0 +1,118 @@
+"""
+normalized_key 일괄 생성기 (백필용).
+
+ProductCrawler._build_normalized_key와 같은 규칙을 pandas 열 단위로 적용한다.
+- 모델코드 추출: 제외 접두어(EU/FW 등)를 정규식 lookahead로 넣어 str.extract 한 번으로 처리
+- 태그: explode 후 추출, 제품별 첫 매칭만 사용
+- title slug fallback: 고유 title만 memoized slugify
+
+크롤 경로(제품 1건씩)는 계속 ProductCrawler._build_normalized_key를 사용한다.
+"""
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+import pandas as pd
+from slugify import slugify
+
+from fashion_engine.crawler.product_crawler import (
+    _EXCLUDE_PREFIXES,
+    _MODEL_CODE_RE,
+    _SHORT_CODE_RE,
+)
+
+_EXCLUDE_LOOKAHEAD = "(?!" + "|".join(sorted(_EXCLUDE_PREFIXES)) + ")"
+
+
+def _with_exclusion(pattern: re.Pattern[str]) -> str:
+    # r"\b(...)" → r"\b(?!EU|FW|...)(...)" : 매칭 첫 두 글자가 제외 접두어면 건너뜀
+    assert pattern.pattern.startswith(r"\b(")
+    return r"\b" + _EXCLUDE_LOOKAHEAD + pattern.pattern[2:]
+
+
+_LONG_CODE_PATTERN = _with_exclusion(_MODEL_CODE_RE)
+_SHORT_CODE_PATTERN = _with_exclusion(_SHORT_CODE_RE)
+
+
+@lru_cache(maxsize=200_000)
+def _title_slug(title: str) -> str | None:
+    return slugify(title, max_length=60, word_boundary=True) or None
+
+
+def extract_model_codes(texts: pd.Series) -> pd.Series:
+    """ProductCrawler._extract_model_code의 열 단위 버전 (소문자 코드, 없으면 None).
+
+    중복 텍스트(채널 간 같은 title/sku)는 고유값 기준으로 한 번만 추출한다.
+    """
+    positions, uniques = pd.factorize(texts.fillna("").astype(object))
+    upper = pd.Series(uniques, dtype=object).map(str.upper)
+    codes = upper.str.extract(_LONG_CODE_PATTERN, expand=False).astype(object)
+    need_short = codes.isna() & (upper != "")
+    if need_short.any():
+        codes[need_short] = upper[need_short].str.extract(_SHORT_CODE_PATTERN, expand=False)
+    codes = codes.where(codes.notna(), None).map(lambda code: code.lower() if code else None)
+    return pd.Series(codes.to_numpy()[positions], index=texts.index, dtype=object)
+
+
+def build_normalized_keys(frame: pd.DataFrame) -> pd.DataFrame:
+    """brand_slug / sku / title / tags(list) 열 → normalized_key / match_confidence 열.
+
+    결과 index는 입력과 같고, 키를 만들 수 없는 행은 둘 다 None.
+    """
+    brand_slug = frame["brand_slug"].astype(object)
+    has_brand = brand_slug.notna() & ~brand_slug.isin(["", "unknown"])
+    if not has_brand.all():
+        # 브랜드 없는 행은 키를 만들지 않으므로 추출 대상에서 먼저 제외
+        keyed = build_normalized_keys(frame[has_brand]) if has_brand.any() else None
+        result = pd.DataFrame(
+            {"normalized_key": None, "match_confidence": None}, index=frame.index, dtype=object
+        )
+        if keyed is not None:
+            result.loc[keyed.index] = keyed
+        return result
+
+    index = frame.index
+    titles = frame["title"].fillna("").astype(object)
+
+    key_code = pd.Series(None, index=index, dtype=object)
+    confidence = pd.Series(None, index=index, dtype=object)
+
+    def _fill(codes: pd.Series, score: float) -> None:
+        mask = key_code.isna() & codes.notna()
+        key_code[mask] = codes[mask]
+        confidence[mask] = score
+
+    # 1순위: SKU
+    skus = frame["sku"].astype(object)
+    skus = skus[skus.notna() & (skus != "")]
+    if not skus.empty:
+        _fill(extract_model_codes(skus).reindex(index), 1.0)
+
+    # 2순위: 3~15자 태그 중 첫 모델코드
+    tags = frame["tags"].map(lambda value: value if isinstance(value, list) else [])
+    exploded = tags.explode().dropna().map(lambda tag: str(tag).strip())
+    exploded = exploded[exploded.str.len().between(3, 15)]
+    if not exploded.empty:
+        tag_codes = extract_model_codes(exploded).dropna()
+        _fill(tag_codes.groupby(level=0).first().reindex(index), 0.8)
+
+    # 3순위: title 모델코드
+    pending = key_code.isna()
+    if pending.any():
+        _fill(extract_model_codes(titles[pending]).reindex(index), 0.7)
+
+    keys = brand_slug + ":" + key_code
+
+    # 4순위: title slug
+    missing = keys.isna()
+    if missing.any():
+        slugs = titles[missing].map(_title_slug)
+        has_slug = slugs.notna()
+        slug_index = slugs[has_slug].index
+        keys[slug_index] = brand_slug[slug_index] + ":" + slugs[has_slug]
+        confidence[slug_index] = 0.5
+
+    keys = keys.astype(object).where(keys.notna(), None)
+    confidence = confidence.where(keys.notna(), None)
+    return pd.DataFrame({"normalized_key": keys, "match_confidence": confidence}, index=index)
@@ -0,0 +1,63 @@
+"""
+CPU 바운드 파싱 단계의 프로세스 풀 오프로드.
+
+HTML 파싱·JSON-LD 추출·normalized_key 정규식·성별/카테고리 분류는 동기 코드라
+이벤트 루프에서 돌면 그동안 다른 채널의 HTTP 응답 처리가 멈춘다.
+crawl_products.py가 런 시작 시 풀을 열면 ProductCrawler의 파싱 호출이
+run_parse()를 거쳐 워커 프로세스에서 실행된다. 풀이 없으면 기존처럼 인라인 실행.
+
+워커에는 picklable 원본(dict 목록·HTML 문자열)만 넘기고 ProductInfo 목록을 돌려받는다.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterator, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_executor: ProcessPoolExecutor | None = None
+
+
+def configure_parse_pool(workers: int) -> None:
+    """파싱 워커 프로세스 수 설정. 0 이하면 풀 없이 이벤트 루프에서 인라인 파싱."""
+    global _executor
+    shutdown_parse_pool()
+    if workers <= 0:
+        return
+    # 이벤트 루프·DB 스레드가 떠 있는 상태에서 fork하지 않도록 spawn 사용
+    _executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    logger.info("파싱 프로세스 풀 시작: workers=%d", workers)
+
+
+def shutdown_parse_pool() -> None:
+    global _executor
+    if _executor is None:
+        return
+    _executor.shutdown(wait=True, cancel_futures=True)
+    _executor = None
+
+
+@contextmanager
+def parse_pool(workers: int) -> Iterator[None]:
+    """with 블록 동안 파싱 프로세스 풀을 연다."""
+    configure_parse_pool(workers)
+    try:
+        yield
+    finally:
+        shutdown_parse_pool()
+
+
+async def run_parse(fn: Callable[..., T], *args) -> T:
+    """fn(*args)를 파싱 풀에서 실행한다. fn·args·반환값은 pickle 가능해야 한다."""
+    if _executor is None:
+        return fn(*args)
+    return await asyncio.get_running_loop().run_in_executor(_executor, fn, *args)
@@ -1,8 +1,15 @@
-"""Shopify product_type/title 기반 경량 분류기."""
+"""Shopify product_type/title 기반 경량 분류기.
+
+키워드 전체를 정규식 하나로 import 시점에 컴파일해 텍스트를 한 번만 훑고
+gender·subcategory를 함께 결정한다. 영문 키워드는 단어 경계(복수형 s/es 허용)로만
+매칭해 "woman" 안의 "man", "capsule" 안의 "cap" 같은 부분 문자열 오탐을 막는다.
+한글 키워드는 조사·복합어("남성용", "아동화")가 붙어 쓰이므로 부분 문자열로 매칭한다.
+"""
 
 from __future__ import annotations
 
 import re
+from typing import Iterable
 
 _GENDER_KEYWORDS: dict[str, tuple[str, ...]] = {
     "men": ("men", "mens", "man", "남성", "맨즈"),
@@ -12,17 +19,60 @@ _GENDER_KEYWORDS: dict[str, tuple[str, ...]] = {
 
 _SUBCATEGORY_KEYWORDS: dict[str, tuple[str, ...]] = {
     "shoes": ("shoe", "sneaker", "runner", "boot", "loafer", "sandals", "신발", "슈즈"),
-    "outer": ("jacket", "coat", "parka", "blouson", "윈드브레이커", "아우터"),
-    "top": ("tee", "t-shirt", "shirt", "knit", "sweat", "hoodie", "셔츠", "상의"),
-    "bottom": ("pants", "jean", "trouser", "shorts", "skirt", "하의"),
+    "outer": ("jacket", "coat", "overcoat", "parka", "blouson", "윈드브레이커", "아우터"),
+    "top": (
+        "tee", "t-shirt", "tshirt", "shirt", "overshirt", "knit", "knitwear",
+        "sweat", "sweatshirt", "hoodie", "셔츠", "상의",
+    ),
+    "bottom": ("pants", "sweatpant", "jean", "trouser", "shorts", "skirt", "하의"),
     "bag": ("bag", "backpack", "tote", "pouch", "가방"),
     "cap": ("cap", "hat", "beanie", "모자"),
-    "accessory": ("accessory", "belt", "socks", "wallet", "ring", "bracelet", "액세서리"),
+    "accessory": (
+        "accessory", "accessories", "belt", "socks", "wallet", "ring", "earring",
+        "bracelet", "액세서리",
+    ),
 }
 
+_GENDER_ORDER = {key: idx for idx, key in enumerate(_GENDER_KEYWORDS)}
+_SUBCATEGORY_ORDER = {key: idx for idx, key in enumerate(_SUBCATEGORY_KEYWORDS)}
+
+
+def _build_matcher() -> tuple[re.Pattern[str], dict[str, tuple[str, str]]]:
+    """키워드 → (kind, key) 표와 단일 alternation 정규식 생성."""
+    lookup: dict[str, tuple[str, str]] = {}
+    for kind, table in (("gender", _GENDER_KEYWORDS), ("subcategory", _SUBCATEGORY_KEYWORDS)):
+        for key, words in table.items():
+            for word in words:
+                lookup.setdefault(word, (kind, key))
+
+    def _alternation(words: Iterable[str]) -> str:
+        # 긴 키워드 우선 — 같은 위치에서 "t-shirt"가 "tee"/"shirt"보다 먼저 잡히도록
+        return "|".join(re.escape(w) for w in sorted(words, key=len, reverse=True))
 
-def _normalize(text: str) -> str:
-    return re.sub(r"\s+", " ", text.strip().lower())
+    latin = [w for w in lookup if w.isascii()]
+    hangul = [w for w in lookup if not w.isascii()]
+    pattern = (
+        rf"(?<![0-9a-z])(?P<latin>{_alternation(latin)})(?:e?s)?(?![0-9a-z])"
+        rf"|(?P<hangul>{_alternation(hangul)})"
+    )
+    return re.compile(pattern), lookup
+
+
+_KEYWORD_RE, _KEYWORD_LOOKUP = _build_matcher()
+
+
+def _classify_text(basis: str) -> tuple[str | None, str | None]:
+    gender: str | None = None
+    subcategory: str | None = None
+    for m in _KEYWORD_RE.finditer(basis):
+        kind, key = _KEYWORD_LOOKUP[m.group("latin") or m.group("hangul")]
+        # 여러 키워드가 잡히면 사전 정의 순서가 앞선 값 우선 (기존 규칙과 동일)
+        if kind == "gender":
+            if gender is None or _GENDER_ORDER[key] < _GENDER_ORDER[gender]:
+                gender = key
+        elif subcategory is None or _SUBCATEGORY_ORDER[key] < _SUBCATEGORY_ORDER[subcategory]:
+            subcategory = key
+    return gender or "unisex", subcategory
 
 
 def classify_gender_and_subcategory(
@@ -30,20 +80,15 @@ def classify_gender_and_subcategory(
     title: str,
     tags: str | None = None,
 ) -> tuple[str | None, str | None]:
-    basis = _normalize(" ".join([product_type or "", title or "", tags or ""]))
+    return _classify_text(" ".join([product_type or "", title or "", tags or ""]).lower())
 
-    gender: str | None = None
-    for key, words in _GENDER_KEYWORDS.items():
-        if any(word in basis for word in words):
-            gender = key
-            break
-    if gender is None:
-        gender = "unisex"
-
-    subcategory: str | None = None
-    for key, words in _SUBCATEGORY_KEYWORDS.items():
-        if any(word in basis for word in words):
-            subcategory = key
-            break
 
-    return gender, subcategory
+def classify_many(
+    rows: Iterable[tuple[str | None, str, str | None]],
+) -> list[tuple[str | None, str | None]]:
+    """(product_type, title, tags) 여러 건을 한 번에 분류 — 재분류 배치용."""
+    classify = _classify_text
+    return [
+        classify(" ".join([product_type or "", title or "", tags or ""]).lower())
+        for product_type, title, tags in rows
+    ]
@@ -5,23 +5,47 @@ Shopify /products.json (공개 REST API) 기반으로 제품 목록과 가격을
 Playwright 불필요 — httpx 직접 사용.
 """
 import asyncio
+import hashlib
 import json
 import logging
 import random
 import re
-from dataclasses import dataclass, field
+import time
+from contextlib import aclosing, asynccontextmanager, suppress
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import AsyncIterator
 from urllib.parse import urljoin, urlparse
 
 import httpx
-from bs4 import BeautifulSoup
 from slugify import slugify
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception
 
+from fashion_engine.crawler import product_classifier
+from fashion_engine.crawler.html_parser import make_soup
+from fashion_engine.crawler.parse_pool import run_parse
+from fashion_engine.crawler.http_cache import PageValidator, PageValidatorCache
+from fashion_engine.crawler.http_pool import build_http_client
 from fashion_engine.crawler.product_classifier import classify_gender_and_subcategory
+from fashion_engine.services.brand_cache import vendor_slug
 
 logger = logging.getLogger(__name__)
 
 
+def _parser_fingerprint() -> str:
+    """파싱 결과(ProductInfo)를 만드는 코드 — 이 모듈의 파서·정규화 규칙과 분류기 — 의 해시."""
+    digest = hashlib.sha1()
+    for path in (__file__, product_classifier.__file__):
+        digest.update(Path(path).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+# 페이지 캐시(http_cache)는 파싱된 제품을 저장하므로 파서·분류 규칙이 바뀌면 무효화한다
+PARSER_VERSION = _parser_fingerprint()
+
+
 def _is_retryable(exc: BaseException) -> bool:
     """429/503은 재시도 대상; 일반 HTTPError도 재시도."""
     if isinstance(exc, httpx.HTTPStatusError):
@@ -29,6 +53,14 @@ def _is_retryable(exc: BaseException) -> bool:
     return isinstance(exc, httpx.HTTPError)
 
 
+def _count_retry(retry_state) -> None:
+    """tenacity before_sleep 훅 — 재시도 횟수를 크롤러 단계 통계에 기록."""
+    crawler = retry_state.args[0] if retry_state.args else None
+    stats = getattr(crawler, "stats", None)
+    if stats is not None:
+        stats.retry_count += 1
+
+
 # 국가 코드 → 통화 코드 매핑
 COUNTRY_CURRENCY: dict[str, str] = {
     "KR": "KRW",
@@ -53,6 +85,9 @@ COUNTRY_CURRENCY: dict[str, str] = {
 
 # Shopify 제품 크롤 시 최대 페이지 수 (250개/페이지 × 16 = 최대 4000개)
 SHOPIFY_MAX_PAGES = 40
+# 증분 크롤 시 high-water mark에서 뒤로 겹쳐 조회하는 구간 (시계 오차·동일 시각 갱신 대비)
+SHOPIFY_INCREMENTAL_OVERLAP = timedelta(minutes=10)
+_STREAM_QUEUE_SIZE = 8  # Cafe24 카테고리 병렬 순회 → 저장 사이 배치 큐 크기
 
 _BROWSER_HEADERS: dict[str, str] = {
     "Accept": "application/json, text/html, */*;q=0.8",
@@ -64,9 +99,6 @@ _BROWSER_HEADERS: dict[str, str] = {
     "Pragma": "no-cache",
 }
 
-_SHOPIFY_GLOBAL_SEM: asyncio.Semaphore | None = None
-_CAFE24_CATEGORY_SEM: asyncio.Semaphore | None = None
-
 _URL_PLATFORM_MAP: dict[str, str] = {
     "shop-pro.jp": "makeshop",
     "buyshop.jp": "stores-jp",
@@ -80,18 +112,154 @@ _URL_PLATFORM_MAP: dict[str, str] = {
 }
 
 
-def _get_shopify_sem() -> asyncio.Semaphore:
-    global _SHOPIFY_GLOBAL_SEM
-    if _SHOPIFY_GLOBAL_SEM is None:
-        _SHOPIFY_GLOBAL_SEM = asyncio.Semaphore(2)
-    return _SHOPIFY_GLOBAL_SEM
+# ── host별 적응형 rate limiter ─────────────────────────────────────────
+# 전역 세마포어 대신 host마다 토큰 버킷을 두고, 429/Retry-After·5xx·지연시간에 따라
+# AIMD(성공 시 가산 증가, 차단 시 승산 감소)로 안전한 요청 속도를 학습한다.
+# 서로 다른 host는 독립적으로 동작하므로 채널 동시 처리 수를 늘려도 같은 스토어에
+# 요청이 몰리지 않는다.
+
 
+@dataclass(frozen=True)
+class _RateProfile:
+    initial_rate: float     # 초당 요청 수 시작값
+    min_rate: float
+    max_rate: float
+    max_concurrency: int    # host당 동시 요청 수
+    increase_step: float    # 성공 1회당 가산 증가량
+    slow_latency: float     # 이 값(초)을 넘는 응답은 감속 신호로 취급
+
+
+_RATE_PROFILES: dict[str, _RateProfile] = {
+    "shopify": _RateProfile(
+        initial_rate=2.0, min_rate=0.2, max_rate=4.0,
+        max_concurrency=2, increase_step=0.1, slow_latency=5.0,
+    ),
+    "cafe24": _RateProfile(
+        initial_rate=4.0, min_rate=0.5, max_rate=8.0,
+        max_concurrency=5, increase_step=0.2, slow_latency=5.0,
+    ),
+    "default": _RateProfile(
+        initial_rate=2.0, min_rate=0.2, max_rate=4.0,
+        max_concurrency=2, increase_step=0.1, slow_latency=5.0,
+    ),
+}
+
+
+def _parse_shop_timestamp(value: str | None) -> datetime | None:
+    """Shopify ISO8601 타임스탬프 → UTC naive datetime (DB 컬럼 규약)."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _parse_retry_after(value: str | None, default: float) -> float:
+    """Retry-After 헤더(초 또는 HTTP-date)를 대기 초로 변환."""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class HostRateLimiter:
+    """단일 host용 토큰 버킷 + 동시성 제한."""
+
+    def __init__(self, host: str, profile: _RateProfile, platform: str = "default"):
+        self.host = host
+        self.platform = platform
+        self._profile = profile
+        self.rate = profile.initial_rate
+        self._tokens = 1.0
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+        self._sem = asyncio.Semaphore(profile.max_concurrency)
+
+    def switch_profile(self, platform: str, profile: _RateProfile) -> None:
+        """플랫폼 확정 시 프로파일만 바꾼다 — 학습한 rate·Retry-After 차단·세마포어는 유지.
+        rate는 새 프로파일 범위로 맞추고, 동시성 상한은 늘리기만 한다 (진행 중 요청이 쥔 슬롯은 그대로)."""
+        extra = profile.max_concurrency - self._profile.max_concurrency
+        for _ in range(max(0, extra)):
+            self._sem.release()
+        self.rate = min(profile.max_rate, max(profile.min_rate, self.rate))
+        self._profile = profile
+        self.platform = platform
+
+    async def _acquire_token(self) -> None:
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                else:
+                    self._tokens = min(1.0, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1.0:
+                        self._tokens -= 1.0
+                        return
+                    wait = (1.0 - self._tokens) / self.rate
+            await asyncio.sleep(wait)
+
+    @asynccontextmanager
+    async def slot(self):
+        async with self._sem:
+            await self._acquire_token()
+            yield
+
+    def record(self, status_code: int | None, latency: float, retry_after: float | None = None) -> None:
+        """응답 결과를 반영해 요청 속도를 조정한다."""
+        profile = self._profile
+        prev_rate = self.rate
+        if status_code == 429 or status_code == 503:
+            self.rate = max(profile.min_rate, self.rate * 0.5)
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+            logger.warning(
+                "host rate 감소 [%s] status=%s %.2f → %.2f req/s (retry_after=%s)",
+                self.host, status_code, prev_rate, self.rate, retry_after,
+            )
+        elif status_code is None or latency > profile.slow_latency:
+            self.rate = max(profile.min_rate, self.rate * 0.8)
+        else:
+            self.rate = min(profile.max_rate, self.rate + profile.increase_step)
+
+
+_HOST_LIMITERS: dict[str, HostRateLimiter] = {}
+
+
+def get_host_limiter(
+    url: str, platform: str = "default", probe: bool = False
+) -> HostRateLimiter:
+    """URL host별 limiter (프로세스 전역, host당 1개).
+
+    probe=True(플랫폼 탐지 요청)는 기존 limiter를 그대로 쓰고, 없을 때만 platform 프로파일로 만든다.
+    플랫폼이 확정된 요청(probe=False)의 platform이 기존 limiter와 다르면 프로파일만 교체한다.
+    예: Cafe24 스토어에 Shopify 탐지 요청이 먼저 가도 Cafe24 목록 수집부터는 cafe24 프로파일 사용.
+    """
+    host = urlparse(url).netloc.lower()
+    profile = _RATE_PROFILES.get(platform, _RATE_PROFILES["default"])
+    limiter = _HOST_LIMITERS.get(host)
+    if limiter is None:
+        limiter = HostRateLimiter(host, profile, platform)
+        _HOST_LIMITERS[host] = limiter
+    elif not probe and limiter.platform != platform:
+        limiter.switch_profile(platform, profile)
+    return limiter
 
-def _get_cafe24_category_sem() -> asyncio.Semaphore:
-    global _CAFE24_CATEGORY_SEM
-    if _CAFE24_CATEGORY_SEM is None:
-        _CAFE24_CATEGORY_SEM = asyncio.Semaphore(5)
-    return _CAFE24_CATEGORY_SEM
 
 # ── 모델코드 추출용 정규식 ──────────────────────────────────────────────
 # 3자리 이상 숫자 포함 (M2002R, DD9336, GZ6094, NMD_R1 등)
@@ -132,6 +300,17 @@ _PRODUCT_TYPE_DENYLIST: frozenset[str] = frozenset({
     "warranty",
 })
 
+# 크롤 전략 cascade 순서 — ChannelProductResult.crawl_strategy / CrawlChannelLog.strategy 값
+CRAWL_STRATEGIES: tuple[str, ...] = (
+    "shopify-api",
+    "cafe24-html",
+    "cafe24-single-brand",
+    "woocommerce-api",
+    "makeshop-html",
+    "stores-jp-html",
+    "ochanoko-html",
+)
+
 USER_AGENTS = [
     (
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -175,6 +354,7 @@ class ProductInfo:
     subcategory: str | None = None
     normalized_key: str | None = None    # "brand-slug:model-code" 교차채널 매칭용
     match_confidence: float | None = None  # normalized_key 생성 신뢰도 (0.0~1.0)
+    shop_updated_at: str | None = None   # Shopify updated_at 원문 (증분 크롤 high-water mark용)
 
 
 @dataclass
@@ -184,37 +364,135 @@ class ChannelProductResult:
     error: str | None = None
     error_type: str | None = None
     crawl_strategy: str = "unknown"
+    truncated: bool = False  # 페이지 상한·중도 실패로 카탈로그 일부만 수집됨 (아카이브 정리 생략)
+    incremental: bool = False  # updated_since 이후 변경분만 수집 (아카이브 정리 생략)
+    max_updated_at: datetime | None = None  # 수집 제품 중 최신 Shopify updated_at (UTC naive)
+    discovered_categories: list[tuple[str, str]] = field(default_factory=list)  # 이번 크롤에서 자동 탐지한 Cafe24 카테고리
+
+
+@dataclass
+class CrawlStageStats:
+    """크롤러 인스턴스(채널) 단위 HTTP·파싱 계측. 저장 단계는 crawl_products.py가 따로 잰다."""
+    fetch_seconds: float = 0.0  # 응답 수신까지 걸린 시간 (limiter 대기·페이지 간 지연 제외)
+    parse_seconds: float = 0.0  # run_parse 경유 파싱 시간 (풀 사용 시 대기 포함)
+    request_count: int = 0
+    retry_count: int = 0  # 429/503/전송 오류 후 재요청 수
+    bytes_downloaded: int = 0  # 압축 해제 전 전송 바이트
 
 
 class ProductCrawler:
     """Shopify 채널 제품·가격 크롤러"""
 
-    def __init__(self, request_delay: float = 1.0, timeout: float = 15.0):
+    def __init__(
+        self,
+        request_delay: float = 1.0,
+        timeout: float = 15.0,
+        page_cache: PageValidatorCache | None = None,
+        client: httpx.AsyncClient | None = None,
+        record_dir: str | None = None,
+        replay_dir: str | None = None,
+    ):
         self._delay = request_delay
         self._timeout = timeout
-        self._client: httpx.AsyncClient | None = None
+        self._client: httpx.AsyncClient | None = client
+        self._owns_client = client is None
+        # 녹화/재생 모드 — client를 직접 만들 때만 적용 (공유 client는 만든 쪽이 설정)
+        self._record_dir = record_dir
+        self._replay_dir = replay_dir
+        # 304는 본문이 없어 녹화·재생할 수 없으므로 페이지 캐시를 끈다
+        self._page_cache = None if (record_dir or replay_dir) else page_cache
+        # 채널(크롤러 인스턴스) 단위 고정 헤더 — 공유 클라이언트에서도 요청마다 적용
+        self._headers: dict[str, str] = {
+            "User-Agent": random.choice(USER_AGENTS),
+            "Accept": "application/json",
+        }
+        self.stats = CrawlStageStats()
 
     async def __aenter__(self) -> "ProductCrawler":
-        self._client = httpx.AsyncClient(
-            headers={
-                "User-Agent": random.choice(USER_AGENTS),
-                "Accept": "application/json",
-            },
-            follow_redirects=True,
-            timeout=httpx.Timeout(connect=10.0, read=30.0, write=10.0, pool=5.0),
-        )
+        if self._client is None:
+            self._client = build_http_client(
+                record_dir=self._record_dir,
+                replay_dir=self._replay_dir,
+            )
+            self._owns_client = True
         return self
 
     async def __aexit__(self, *args) -> None:
-        if self._client:
+        if self._client and self._owns_client:
             await self._client.aclose()
+            self._client = None
+
+    async def _get(
+        self,
+        url: str,
+        timeout: float | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """채널 헤더를 붙여 GET. timeout=None이면 클라이언트 기본 timeout 사용."""
+        assert self._client is not None
+        merged = {**self._headers, **headers} if headers else self._headers
+        self.stats.request_count += 1
+        started = time.perf_counter()
+        try:
+            response = await self._client.get(
+                url,
+                headers=merged,
+                timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+            )
+        finally:
+            self.stats.fetch_seconds += time.perf_counter() - started
+        self.stats.bytes_downloaded += response.num_bytes_downloaded
+        return response
+
+    async def _limited_get(
+        self,
+        url: str,
+        platform: str,
+        *,
+        timeout: float | None = None,
+        headers: dict[str, str] | None = None,
+        probe: bool = False,
+        retry_after_default: float = 5.0,
+        attempts: int = 3,
+    ) -> httpx.Response:
+        """host limiter 슬롯 안에서 GET하고 결과를 limiter에 반영한다 (스토어 요청 공통 경로).
+        429/503이면 Retry-After(없으면 retry_after_default)만큼 해당 host 요청 전체를 멈추고
+        attempts 회까지 다시 요청한다 (다음 시도는 slot에서 차단이 풀릴 때까지 대기)."""
+        limiter = get_host_limiter(url, platform, probe=probe)
+        for attempt in range(attempts):
+            async with limiter.slot():
+                started = time.monotonic()
+                try:
+                    response = await self._get(url, timeout=timeout, headers=headers)
+                except httpx.TransportError:
+                    limiter.record(None, time.monotonic() - started)
+                    raise
+            if response.status_code not in (429, 503):
+                limiter.record(response.status_code, time.monotonic() - started)
+                break
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"), retry_after_default)
+            logger.warning("%s from %s — waiting %.1fs", response.status_code, url, retry_after)
+            limiter.record(response.status_code, time.monotonic() - started, retry_after)
+            if attempt + 1 < attempts:
+                self.stats.retry_count += 1
+        return response
+
+    async def _parse(self, fn, *args):
+        """run_parse + 파싱 시간 계측."""
+        started = time.perf_counter()
+        try:
+            return await run_parse(fn, *args)
+        finally:
+            self.stats.parse_seconds += time.perf_counter() - started
 
     # ── 공개 인터페이스 ──────────────────────────────────────────────────
 
     async def _get_shopify_currency(self, base_url: str) -> str | None:
         """Shopify /shop.json에서 실제 통화 코드 조회."""
         try:
-            resp = await self._fetch_with_retry(f"{base_url.rstrip('/')}/shop.json", timeout=8)
+            resp = await self._fetch_with_retry(
+                f"{base_url.rstrip('/')}/shop.json", timeout=8, probe=True
+            )
             if resp.status_code == 200:
                 data = resp.json()
                 return data.get("shop", {}).get("currency")
@@ -226,17 +504,28 @@ class ProductCrawler:
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=1, max=5),
         retry=retry_if_exception(_is_retryable),
+        before_sleep=_count_retry,
         reraise=True,
     )
-    async def _fetch_with_retry(self, url: str, timeout: float | None = None) -> httpx.Response:
+    async def _fetch_with_retry(
+        self,
+        url: str,
+        timeout: float | None = None,
+        extra_headers: dict[str, str] | None = None,
+        probe: bool = False,
+    ) -> httpx.Response:
+        """Shopify 요청. probe=True는 Shopify 여부가 확정되기 전 탐지 요청 (get_host_limiter 참고)."""
         assert self._client is not None
         headers = {"User-Agent": random.choice(USER_AGENTS), **_BROWSER_HEADERS}
-        response = await self._client.get(url, headers=headers, timeout=timeout)
-        # 429 Rate Limit — Retry-After 헤더 준수
-        if response.status_code == 429:
-            retry_after = float(response.headers.get("Retry-After", "5"))
-            logger.warning("Rate limited by %s — waiting %.1fs", url, retry_after)
-            await asyncio.sleep(retry_after)
+        if extra_headers:
+            headers.update(extra_headers)
+        # 429/503은 _limited_get이 host limiter에 반영하고, raise_for_status → tenacity 재시도
+        response = await self._limited_get(
+            url, "shopify", timeout=timeout, headers=headers, probe=probe, attempts=1
+        )
+        # 304 Not Modified — 조건부 요청 성공 (캐시 재사용)
+        if response.status_code == 304:
+            return response
         response.raise_for_status()
         return response
 
@@ -282,138 +571,302 @@ class ProductCrawler:
         country: str | None = None,
         cafe24_brand_categories: list[tuple[str, str]] | None = None,
     ) -> ChannelProductResult:
-        """채널 URL에서 전체 제품 목록 수집."""
+        """채널 URL에서 전체 제품 목록 수집 (iter_channel_batches 결과를 모아 반환)."""
+        result = ChannelProductResult(channel_url=channel_url)
+        async for batch in self.iter_channel_batches(
+            channel_url,
+            country=country,
+            cafe24_brand_categories=cafe24_brand_categories,
+            result=result,
+        ):
+            result.products.extend(batch)
+        return result
+
+    async def iter_channel_batches(
+        self,
+        channel_url: str,
+        country: str | None = None,
+        cafe24_brand_categories: list[tuple[str, str]] | None = None,
+        result: ChannelProductResult | None = None,
+        updated_since: datetime | None = None,
+        preferred_strategy: str | None = None,
+        cached_cafe24_categories: list[tuple[str, str]] | None = None,
+    ) -> AsyncIterator[list[ProductInfo]]:
+        """채널 제품을 페이지(배치) 단위로 스트리밍한다.
+
+        result를 넘기면 crawl_strategy / error / error_type / truncated / max_updated_at이 채워진다.
+        result.products는 채우지 않으므로 호출 측이 배치마다 저장해 메모리를 일정하게 유지한다.
+        updated_since(UTC naive)를 주면 Shopify 채널은 그 이후 변경된 제품만 수집한다.
+        preferred_strategy(지난 크롤 성공 전략)를 주면 그 전략부터 시도하고, 실패 시에만
+        전체 cascade로 돌아간다. cached_cafe24_categories는 그 첫 시도에서만 탐지 대신 사용한다.
+        """
+        if result is None:
+            result = ChannelProductResult(channel_url=channel_url)
         await asyncio.sleep(random.uniform(0, 3))
         currency = self._infer_currency(channel_url, country)
-        result = ChannelProductResult(channel_url=channel_url)
 
-        try:
-            shopify_currency = await self._get_shopify_currency(channel_url)
-            if shopify_currency:
-                currency = shopify_currency.upper()
-            products = await self._try_shopify_products(channel_url, currency)
-            if products:
-                result.products = products
-                result.crawl_strategy = "shopify-api"
-            else:
-                categories = list(cafe24_brand_categories or [])
-                if not categories:
-                    categories = await self._discover_cafe24_brand_categories(channel_url)
-                cafe24_products: list[ProductInfo] = []
-                if categories:
-                    sem = _get_cafe24_category_sem()
-
-                    async def _fetch_one(brand_name: str, cate_no: str) -> list[ProductInfo]:
-                        async with sem:
-                            return await self._try_cafe24_products(
-                                channel_url=channel_url,
-                                cate_no=cate_no,
-                                brand_name=brand_name,
-                                currency=currency,
-                            )
+        attempts: list[tuple[str, bool]] = []  # (전략, 캐시 사용 여부)
+        if preferred_strategy in CRAWL_STRATEGIES:
+            attempts.append((preferred_strategy, True))
+        for strategy in CRAWL_STRATEGIES:
+            # 캐시된 카테고리로 실패한 cafe24-html은 재탐지로 한 번 더 시도
+            if strategy == preferred_strategy and not (
+                strategy == "cafe24-html"
+                and cached_cafe24_categories
+                and not cafe24_brand_categories
+            ):
+                continue
+            attempts.append((strategy, False))
 
-                    gathered = await asyncio.gather(
-                        *[_fetch_one(name, cate_no) for name, cate_no in categories],
-                        return_exceptions=True,
-                    )
-                    for row in gathered:
-                        if isinstance(row, list):
-                            cafe24_products.extend(row)
-                if cafe24_products:
-                    dedup: dict[str, ProductInfo] = {}
-                    for p in cafe24_products:
-                        dedup[p.product_url] = p
-                    result.products = list(dedup.values())
-                    result.crawl_strategy = "cafe24-html"
-                else:
-                    detected_platform = self._detect_platform_from_url(channel_url)
-                    single_brand_products = await self._try_cafe24_single_brand(
-                        channel_url=channel_url,
-                        currency=currency,
-                    )
-                    if single_brand_products:
-                        result.products = single_brand_products
-                        result.crawl_strategy = "cafe24-single-brand"
-                        return result
-                    if await self._try_woocommerce_detect(channel_url):
-                        wc_products = await self._try_woocommerce_products(channel_url, currency)
-                        if wc_products:
-                            result.products = wc_products
-                            result.crawl_strategy = "woocommerce-api"
-                        else:
-                            result.error = (
-                                "No products found "
-                                "(non-Shopify/Cafe24/WooCommerce/MakeShop/STORES.jp or empty store)"
-                            )
-                            result.error_type = "not_supported"
-                    else:
-                        extra_products: list[ProductInfo] = []
-                        extra_strategy = "unknown"
-                        if detected_platform == "makeshop":
-                            extra_products = await self._try_makeshop_products(channel_url, currency)
-                            extra_strategy = "makeshop-html"
-                        elif detected_platform == "stores-jp":
-                            extra_products = await self._try_stores_jp_products(channel_url, currency)
-                            extra_strategy = "stores-jp-html"
-                        elif detected_platform == "ochanoko":
-                            extra_products = await self._try_ochanoko_products(channel_url, currency)
-                            extra_strategy = "ochanoko-html"
-
-                        if extra_products:
-                            result.products = extra_products
-                            result.crawl_strategy = extra_strategy
-                        else:
-                            result.error = (
-                                "No products found "
-                                "(non-Shopify/Cafe24/WooCommerce/MakeShop/STORES.jp or empty store)"
-                            )
-                            result.error_type = "not_supported"
+        try:
+            for strategy, use_cache in attempts:
+                yielded = False
+                try:
+                    async for batch in self._iter_strategy_batches(
+                        strategy,
+                        channel_url,
+                        currency,
+                        result,
+                        cafe24_brand_categories=(
+                            cafe24_brand_categories
+                            or (cached_cafe24_categories if use_cache else None)
+                        ),
+                        updated_since=updated_since,
+                    ):
+                        result.crawl_strategy = strategy
+                        yielded = True
+                        yield batch
+                except Exception as e:
+                    if yielded or not use_cache:
+                        raise
+                    logger.info(f"저장된 크롤 전략 실패 [{channel_url}] {strategy}: {e} → 전체 탐색")
+                if yielded or (strategy == "shopify-api" and result.incremental):
+                    # 증분 모드는 변경분이 0개여도 Shopify 응답이 정상이면 종료
+                    result.crawl_strategy = strategy
+                    return
+                # 수집 0개로 끝난 시도의 잘림 표시는 다음 전략에 넘기지 않는다
+                result.truncated = False
+                result.discovered_categories = []
+
+            result.error = (
+                "No products found "
+                "(non-Shopify/Cafe24/WooCommerce/MakeShop/STORES.jp or empty store)"
+            )
+            result.error_type = "not_supported"
         except Exception as e:
             result.error = str(e)[:200]
             http_status = e.response.status_code if isinstance(e, httpx.HTTPStatusError) else None
             result.error_type = self._classify_error(e, http_status)
             logger.warning(f"제품 크롤 실패 [{channel_url}]: {e}")
 
-        return result
+    async def _iter_strategy_batches(
+        self,
+        strategy: str,
+        channel_url: str,
+        currency: str,
+        result: ChannelProductResult,
+        cafe24_brand_categories: list[tuple[str, str]] | None = None,
+        updated_since: datetime | None = None,
+    ) -> AsyncIterator[list[ProductInfo]]:
+        """전략 1개로 제품 배치를 수집한다. 해당 플랫폼이 아니면 아무것도 내보내지 않는다."""
+        if strategy == "shopify-api":
+            shopify_currency = await self._get_shopify_currency(channel_url)
+            if shopify_currency:
+                currency = shopify_currency.upper()
+            async for batch in self._iter_shopify_pages(
+                channel_url, currency, result, updated_since=updated_since
+            ):
+                yield batch
+            return
+
+        if strategy == "cafe24-html":
+            categories = list(cafe24_brand_categories or [])
+            if not categories:
+                categories = await self._discover_cafe24_brand_categories(channel_url)
+                result.discovered_categories = categories
+            if not categories:
+                return
+            seen_urls: set[str] = set()
+            async with aclosing(
+                self._iter_cafe24_category_batches(channel_url, categories, currency, result)
+            ) as batches:
+                async for batch in batches:
+                    # 여러 카테고리에 걸친 동일 제품은 첫 배치에서만 내보낸다
+                    fresh = [p for p in batch if p.product_url not in seen_urls]
+                    if not fresh:
+                        continue
+                    seen_urls.update(p.product_url for p in fresh)
+                    yield fresh
+            return
+
+        if strategy == "cafe24-single-brand":
+            async for batch in self._iter_cafe24_single_brand_pages(channel_url, currency, result):
+                yield batch
+            return
+
+        products: list[ProductInfo] = []
+        detected_platform = self._detect_platform_from_url(channel_url)
+        if strategy == "woocommerce-api":
+            if await self._try_woocommerce_detect(channel_url):
+                products = await self._try_woocommerce_products(channel_url, currency)
+        elif strategy == "makeshop-html" and detected_platform == "makeshop":
+            products = await self._try_makeshop_products(channel_url, currency)
+        elif strategy == "stores-jp-html" and detected_platform == "stores-jp":
+            products = await self._try_stores_jp_products(channel_url, currency)
+        elif strategy == "ochanoko-html" and detected_platform == "ochanoko":
+            products = await self._try_ochanoko_products(channel_url, currency)
+        if products:
+            yield products
 
     # ── Shopify 전략 ─────────────────────────────────────────────────────
 
     async def _try_shopify_products(
         self, channel_url: str, currency: str
     ) -> list[ProductInfo]:
+        products: list[ProductInfo] = []
+        async for batch in self._iter_shopify_pages(channel_url, currency):
+            products.extend(batch)
+        return products
+
+    async def _iter_shopify_pages(
+        self,
+        channel_url: str,
+        currency: str,
+        result: ChannelProductResult | None = None,
+        updated_since: datetime | None = None,
+    ) -> AsyncIterator[list[ProductInfo]]:
         """
-        Shopify /products.json?limit=100&page=N 순회.
+        Shopify /products.json?limit=100&page=N 순회 — 페이지마다 제품 배치를 yield.
         최대 SHOPIFY_MAX_PAGES 페이지.
+        page_cache가 있으면 ETag/Last-Modified 조건부 요청을 보내고,
+        304 또는 본문 해시 일치 시 파싱 없이 캐시된 제품을 재사용한다.
+
+        updated_since가 있으면 증분 모드: updated_at 내림차순 + updated_at_min을 요청하고
+        since 이전 제품은 파싱 없이 버린다. 스토어가 정렬을 지켜준 경우에만
+        since 이전 제품이 나온 페이지에서 순회를 멈춘다 (정렬 무시 스토어는 끝까지 순회).
         """
         assert self._client is not None
         base = channel_url.rstrip("/")
-        products: list[ProductInfo] = []
-        shopify_sem = _get_shopify_sem()
+        incremental = updated_since is not None
+        # 증분 URL은 매 런 달라지므로 페이지 캐시는 전체 순회에서만 사용
+        page_cache = (
+            self._page_cache.open_channel(base)
+            if self._page_cache and not incremental
+            else None
+        )
+        query = "limit=100"
+        if updated_since is not None:
+            since_param = (updated_since - SHOPIFY_INCREMENTAL_OVERLAP).strftime("%Y-%m-%dT%H:%M:%SZ")
+            query += f"&order=updated_at+desc&updated_at_min={since_param}"
+        ordered_desc = True
+        prev_updated: datetime | None = None
+        completed = False
+        yielded = False
 
-        for page in range(1, SHOPIFY_MAX_PAGES + 1):
-            url = f"{base}/products.json?limit=100&page={page}"
-            try:
-                async with shopify_sem:
-                    resp = await self._fetch_with_retry(url)
-                    data = resp.json()
-            except Exception:
-                break
+        try:
+            for page in range(1, SHOPIFY_MAX_PAGES + 1):
+                url = f"{base}/products.json?{query}&page={page}"
+                cached = page_cache.get(url, currency) if page_cache else None
+                try:
+                    resp = await self._fetch_with_retry(
+                        url,
+                        extra_headers=cached.conditional_headers() if cached else None,
+                        # 첫 페이지는 Shopify 탐지를 겸한다
+                        probe=page == 1,
+                    )
+                    content_hash = (
+                        hashlib.sha1(resp.content).hexdigest()
+                        if resp.status_code != 304
+                        else None
+                    )
+                    if cached and (
+                        resp.status_code == 304 or content_hash == cached.content_hash
+                    ):
+                        data = None
+                    elif resp.status_code == 304:
+                        break
+                    else:
+                        data = resp.json()
+                except Exception:
+                    break
 
-            page_products = data.get("products", [])
-            if not page_products:
-                break
+                if data is None:
+                    # 변경 없는 페이지 — _parse_product 생략
+                    assert cached is not None and page_cache is not None
+                    page_cache.hits += 1
+                    page_cache.put(url, cached)
+                    page_infos = [ProductInfo(**row) for row in cached.products]
+                    item_count = cached.item_count
+                else:
+                    page_products = data.get("products", [])
+                    item_count = len(page_products)
+                    if incremental and result is not None:
+                        result.incremental = True
+                    reached_since = False
+                    if updated_since is not None:
+                        fresh_products = []
+                        for p in page_products:
+                            item_updated = _parse_shop_timestamp(p.get("updated_at"))
+                            if item_updated is not None:
+                                if prev_updated is not None and item_updated > prev_updated:
+                                    ordered_desc = False
+                                prev_updated = item_updated
+                                if item_updated < updated_since - SHOPIFY_INCREMENTAL_OVERLAP:
+                                    reached_since = True
+                                    continue
+                            fresh_products.append(p)
+                        page_products = fresh_products
+                    page_infos = await self._parse(parse_shopify_items, page_products, base, currency)
+                    if page_cache is not None and content_hash:
+                        page_cache.misses += 1
+                        page_cache.put(
+                            url,
+                            PageValidator(
+                                etag=resp.headers.get("ETag"),
+                                last_modified=resp.headers.get("Last-Modified"),
+                                content_hash=content_hash,
+                                currency=currency,
+                                item_count=item_count,
+                                products=[asdict(info) for info in page_infos],
+                            ),
+                        )
 
-            for p in page_products:
-                info = self._parse_product(p, base, currency)
-                if info:
-                    products.append(info)
+                if result is not None:
+                    for info in page_infos:
+                        info_updated = _parse_shop_timestamp(info.shop_updated_at)
+                        if info_updated and (
+                            result.max_updated_at is None or info_updated > result.max_updated_at
+                        ):
+                            result.max_updated_at = info_updated
 
-            await asyncio.sleep(self._delay)
+                if page_infos:
+                    yielded = True
+                    yield page_infos
 
-            if len(page_products) < 100:
-                break
+                if not item_count:
+                    completed = True
+                    break
+                if incremental and reached_since and ordered_desc:
+                    completed = True
+                    break
 
-        return products
+                await asyncio.sleep(self._delay)
+
+                if item_count < 100:
+                    completed = True
+                    break
+        finally:
+            if result is not None and (yielded or result.incremental) and not completed:
+                result.truncated = True
+            if page_cache is not None:
+                if page_cache.hits:
+                    logger.info(
+                        "Shopify 페이지 캐시 [%s]: hit=%d miss=%d",
+                        base,
+                        page_cache.hits,
+                        page_cache.misses,
+                    )
+                page_cache.save(complete=completed)
 
     async def _discover_cafe24_brand_categories(
         self,
@@ -433,24 +886,31 @@ class ProductCrawler:
         found_by_cate: dict[str, str] = {}
         for url in candidates:
             try:
-                resp = await self._client.get(url, timeout=self._timeout)
+                resp = await self._limited_get(url, "cafe24", timeout=self._timeout, probe=True)
                 if resp.status_code != 200:
                     continue
             except Exception:
                 continue
-            soup = BeautifulSoup(resp.text, "html.parser")
-            for a in soup.select("a[href*='cate_no=']:not([href*='product_no='])"):
-                href = a.get("href") or ""
-                m = re.search(r"cate_no=(\d+)", href)
-                if not m:
-                    continue
-                cate_no = m.group(1)
-                name = a.get_text(" ", strip=True)
-                if not name:
-                    continue
-                found_by_cate[cate_no] = name
+            found_by_cate.update(await self._parse(extract_cafe24_categories, resp.text))
         return [(name, cate_no) for cate_no, name in found_by_cate.items()]
 
+    @staticmethod
+    def _extract_cafe24_categories(html: str) -> dict[str, str]:
+        """브랜드/카테고리 페이지 HTML에서 {cate_no: 카테고리명} 추출."""
+        found_by_cate: dict[str, str] = {}
+        soup = make_soup(html)
+        for a in soup.select("a[href*='cate_no=']:not([href*='product_no='])"):
+            href = a.get("href") or ""
+            m = re.search(r"cate_no=(\d+)", href)
+            if not m:
+                continue
+            cate_no = m.group(1)
+            name = a.get_text(" ", strip=True)
+            if not name:
+                continue
+            found_by_cate[cate_no] = name
+        return found_by_cate
+
     async def _try_cafe24_products(
         self,
         channel_url: str,
@@ -458,51 +918,96 @@ class ProductCrawler:
         brand_name: str,
         currency: str,
     ) -> list[ProductInfo]:
-        """Cafe24 카테고리 목록 페이지를 순회해 제품 정보를 파싱한다."""
+        products: list[ProductInfo] = []
+        async for batch in self._iter_cafe24_category_pages(
+            channel_url, cate_no, brand_name, currency
+        ):
+            products.extend(batch)
+        return products
+
+    async def _iter_cafe24_category_batches(
+        self,
+        channel_url: str,
+        categories: list[tuple[str, str]],
+        currency: str,
+        result: ChannelProductResult | None = None,
+    ) -> AsyncIterator[list[ProductInfo]]:
+        """여러 Cafe24 카테고리를 동시에 순회하며 도착 순서대로 페이지 배치를 yield.
+
+        큐 크기를 제한해 저장이 느리면 카테고리 순회도 함께 멈춘다(backpressure).
+        """
+        queue: asyncio.Queue[list[ProductInfo] | None] = asyncio.Queue(
+            maxsize=_STREAM_QUEUE_SIZE
+        )
+        sem = asyncio.Semaphore(_RATE_PROFILES["cafe24"].max_concurrency)
+
+        async def _pump(brand_name: str, cate_no: str) -> None:
+            async with sem:
+                try:
+                    async for batch in self._iter_cafe24_category_pages(
+                        channel_url, cate_no, brand_name, currency, result
+                    ):
+                        await queue.put(batch)
+                except Exception as exc:
+                    logger.warning("Cafe24 카테고리 수집 실패 [%s cate_no=%s]: %s", channel_url, cate_no, exc)
+                    if result is not None:
+                        result.truncated = True
+
+        async def _run() -> None:
+            await asyncio.gather(*[_pump(name, cate_no) for name, cate_no in categories])
+            await queue.put(None)
+
+        runner = asyncio.create_task(_run())
+        try:
+            while True:
+                batch = await queue.get()
+                if batch is None:
+                    break
+                yield batch
+        finally:
+            if not runner.done():
+                runner.cancel()
+            with suppress(asyncio.CancelledError):
+                await runner
+
+    async def _iter_cafe24_category_pages(
+        self,
+        channel_url: str,
+        cate_no: str,
+        brand_name: str,
+        currency: str,
+        result: ChannelProductResult | None = None,
+    ) -> AsyncIterator[list[ProductInfo]]:
+        """Cafe24 카테고리 목록 페이지를 순회해 페이지마다 제품 배치를 yield."""
         assert self._client is not None
         base = channel_url.rstrip("/")
-        brand_slug = slugify(brand_name) if brand_name else "unknown"
-        products: list[ProductInfo] = []
         seen: set[str] = set()
 
         for page in range(1, 80):
             list_url = f"{base}/product/list.html?cate_no={cate_no}&page={page}"
             try:
-                resp: httpx.Response | None = None
-                for attempt in range(3):
-                    resp = await self._client.get(list_url, timeout=self._timeout)
-                    if resp.status_code == 429:
-                        retry_after = int(resp.headers.get("Retry-After", "10"))
-                        logger.warning("Cafe24 429: %s, retry after %ss", list_url, retry_after)
-                        await asyncio.sleep(retry_after)
-                        continue
-                    if resp.status_code == 503:
-                        wait = 5 * (attempt + 1)
-                        logger.warning("Cafe24 503: %s, retry after %ss", list_url, wait)
-                        await asyncio.sleep(wait)
-                        continue
-                    break
-                if resp is None or resp.status_code != 200:
+                resp = await self._limited_get(
+                    list_url, "cafe24", timeout=self._timeout, retry_after_default=10.0
+                )
+                if resp.status_code != 200:
+                    if result is not None and page > 1:
+                        result.truncated = True
                     break
             except Exception:
+                if result is not None and page > 1:
+                    result.truncated = True
                 break
 
-            page_products = self._parse_cafe24_product_list(
-                html=resp.text,
-                channel_url=channel_url,
-                currency=currency,
-                brand_name=brand_name,
-                seen_product_nos=seen,
+            page_products, seen = await self._parse(
+                parse_cafe24_list_page, resp.text, channel_url, currency, brand_name, seen
             )
-            page_count = len(page_products)
-            if page_count:
-                products.extend(page_products)
-
-            if page_count == 0:
+            if not page_products:
                 break
+            yield page_products
             await asyncio.sleep(self._delay)
-
-        return products
+        else:
+            if result is not None:
+                result.truncated = True
 
     def _parse_cafe24_product_list(
         self,
@@ -516,10 +1021,10 @@ class ProductCrawler:
         """Cafe24 목록 페이지 HTML 공통 파서."""
         base = channel_url.rstrip("/")
         vendor = (brand_name or urlparse(channel_url).netloc.replace("www.", "")).strip() or "unknown"
-        brand_slug = slugify(vendor) if vendor else "unknown"
+        brand_slug = vendor_slug(vendor) if vendor else "unknown"
         seen = seen_product_nos if seen_product_nos is not None else set()
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         cards = soup.select(
             "li[id^='anchorBoxId_'], ul.prdList > li, .xans-product-listnormal li, "
             ".xans-product-listitem li, .prdList.grid4 > li"
@@ -623,7 +1128,18 @@ class ProductCrawler:
         channel_url: str,
         currency: str,
     ) -> list[ProductInfo]:
-        """Cafe24 단일 브랜드 스토어 목록(/product/list.html) 전략."""
+        products: list[ProductInfo] = []
+        async for batch in self._iter_cafe24_single_brand_pages(channel_url, currency):
+            products.extend(batch)
+        return products
+
+    async def _iter_cafe24_single_brand_pages(
+        self,
+        channel_url: str,
+        currency: str,
+        result: ChannelProductResult | None = None,
+    ) -> AsyncIterator[list[ProductInfo]]:
+        """Cafe24 단일 브랜드 스토어 목록(/product/list.html) 전략 — 페이지마다 배치 yield."""
         assert self._client is not None
         base = channel_url.rstrip("/")
         candidates = [
@@ -636,7 +1152,7 @@ class ProductCrawler:
         for candidate in candidates:
             page1 = f"{candidate}&page=1" if "?" in candidate else f"{candidate}?page=1"
             try:
-                resp = await self._client.get(page1, timeout=self._timeout)
+                resp = await self._limited_get(page1, "cafe24", timeout=self._timeout, probe=True)
             except Exception:
                 continue
             if resp.status_code != 200:
@@ -646,30 +1162,29 @@ class ProductCrawler:
                 working_base = candidate
                 break
         if not working_base:
-            return []
+            return
 
         seen: set[str] = set()
-        products: list[ProductInfo] = []
         for page in range(1, 101):
             page_url = f"{working_base}&page={page}" if "?" in working_base else f"{working_base}?page={page}"
             try:
-                resp = await self._client.get(page_url, timeout=self._timeout)
+                resp = await self._limited_get(page_url, "cafe24", timeout=self._timeout)
             except Exception:
+                resp = None
+            if resp is None or resp.status_code != 200:
+                if result is not None and page > 1:
+                    result.truncated = True
                 break
-            if resp.status_code != 200:
-                break
-            page_products = self._parse_cafe24_product_list(
-                html=resp.text,
-                channel_url=channel_url,
-                currency=currency,
-                brand_name=None,
-                seen_product_nos=seen,
+            page_products, seen = await self._parse(
+                parse_cafe24_list_page, resp.text, channel_url, currency, None, seen
             )
             if not page_products:
                 break
-            products.extend(page_products)
+            yield page_products
             await asyncio.sleep(self._delay)
-        return products
+        else:
+            if result is not None:
+                result.truncated = True
 
     # ── WooCommerce 전략 ─────────────────────────────────────────────────
 
@@ -678,7 +1193,7 @@ class ProductCrawler:
         assert self._client is not None
         url = f"{base_url.rstrip('/')}/wp-json/wc/v3/"
         try:
-            resp = await self._client.get(url, timeout=8)
+            resp = await self._limited_get(url, "woocommerce", timeout=8, probe=True)
             return resp.status_code in (200, 401)
         except Exception:
             return False
@@ -698,7 +1213,7 @@ class ProductCrawler:
         while True:
             url = f"{api_base}?per_page={per_page}&page={page}&status=publish"
             try:
-                resp = await self._client.get(url, timeout=self._timeout)
+                resp = await self._limited_get(url, "woocommerce", timeout=self._timeout)
             except httpx.HTTPError:
                 break
 
@@ -714,10 +1229,9 @@ class ProductCrawler:
             if not isinstance(data, list) or not data:
                 break
 
-            for item in data:
-                info = self._parse_woocommerce_product(item, channel_url, currency)
-                if info:
-                    products.append(info)
+            products.extend(
+                await self._parse(parse_woocommerce_items, data, channel_url, currency)
+            )
 
             try:
                 total_pages = int(resp.headers.get("X-WP-TotalPages", "1"))
@@ -754,6 +1268,181 @@ class ProductCrawler:
             for v in node:
                 ProductCrawler._collect_jsonld_products(v, out)
 
+    def _parse_generic_product_cards(
+        self,
+        html: str,
+        page_url: str,
+        channel_url: str,
+        currency: str,
+        *,
+        platform_prefix: str,
+        item_selector: str,
+        link_selector: str,
+        title_selector: str,
+        price_selector: str,
+        seen_urls: set[str],
+    ) -> list[ProductInfo]:
+        """범용 카드형 목록 페이지 1장 파싱 (parse_generic_product_page 경유로 파싱 풀에서 실행)."""
+        base = channel_url.rstrip("/")
+        host_slug = urlparse(base).netloc.lower().replace("www.", "") or "unknown"
+        products: list[ProductInfo] = []
+        soup = make_soup(html)
+        cards = soup.select(item_selector)
+        if not cards:
+            # 카드 구조가 없는 스킨은 JSON-LD Product 메타데이터를 사용한다.
+            jsonld_products: list[dict] = []
+            for script in soup.select("script[type='application/ld+json']"):
+                raw = (script.string or script.get_text() or "").strip()
+                if not raw:
+                    continue
+                try:
+                    parsed = json.loads(raw)
+                except Exception:
+                    continue
+                self._collect_jsonld_products(parsed, jsonld_products)
+
+            for obj in jsonld_products:
+                title = str(obj.get("name") or "").strip()
+                if not title or self._is_title_denied(title):
+                    continue
+                offers = obj.get("offers") or {}
+                if isinstance(offers, list):
+                    offers = offers[0] if offers else {}
+                price = self._extract_price_from_text(str(offers.get("price") or ""))
+                if price is None:
+                    continue
+                raw_url = str(obj.get("url") or "").strip()
+                product_url = urljoin(base + "/", raw_url) if raw_url else page_url
+                if product_url in seen_urls:
+                    continue
+                seen_urls.add(product_url)
+
+                image = obj.get("image")
+                image_url: str | None = None
+                if isinstance(image, list) and image:
+                    image_url = str(image[0])
+                elif isinstance(image, str):
+                    image_url = image
+                if image_url:
+                    image_url = urljoin(base + "/", image_url)
+
+                fallback_handle = slugify(urlparse(product_url).path, max_length=70)
+                handle = slugify(title, max_length=70) or fallback_handle or "item"
+                vendor_obj = obj.get("brand") or {}
+                vendor = (
+                    str(vendor_obj.get("name") or "").strip()
+                    if isinstance(vendor_obj, dict)
+                    else str(vendor_obj or "").strip()
+                ) or host_slug
+                brand_slug = vendor_slug(vendor) if vendor else "unknown"
+                normalized_key, match_confidence = self._build_normalized_key(
+                    brand_slug=brand_slug,
+                    sku=None,
+                    title=title,
+                    tags=[],
+                )
+                gender, subcategory = classify_gender_and_subcategory(
+                    product_type=None,
+                    title=title,
+                    tags="",
+                )
+                products.append(
+                    ProductInfo(
+                        title=title,
+                        vendor=vendor,
+                        handle=handle,
+                        product_type=None,
+                        price=price,
+                        compare_at_price=None,
+                        currency=currency,
+                        sku=None,
+                        image_url=image_url,
+                        tags=None,
+                        product_url=product_url,
+                        product_key=f"{platform_prefix}:{host_slug}:{handle}",
+                        is_available=True,
+                        gender=gender,
+                        subcategory=subcategory,
+                        normalized_key=normalized_key,
+                        match_confidence=match_confidence,
+                    )
+                )
+            return products
+
+        for card in cards:
+            a = card.select_one(link_selector) or card.select_one("a[href]")
+            if not a:
+                continue
+            href = (a.get("href") or "").strip()
+            if not href:
+                continue
+            product_url = urljoin(base + "/", href)
+            if product_url in seen_urls:
+                continue
+            seen_urls.add(product_url)
+
+            title_node = card.select_one(title_selector)
+            title = (
+                title_node.get_text(" ", strip=True)
+                if title_node
+                else a.get_text(" ", strip=True)
+            )
+            if not title or self._is_title_denied(title):
+                continue
+
+            price_node = card.select_one(price_selector)
+            price_text = (
+                price_node.get_text(" ", strip=True)
+                if price_node
+                else card.get_text(" ", strip=True)
+            )
+            price = self._extract_price_from_text(price_text)
+            if price is None:
+                continue
+
+            image = card.select_one("img")
+            image_url = image.get("src") if image else None
+            if image_url:
+                image_url = urljoin(base + "/", image_url)
+
+            fallback_handle = slugify(urlparse(product_url).path, max_length=70)
+            handle = slugify(title, max_length=70) or fallback_handle or "item"
+            vendor = host_slug
+            brand_slug = vendor_slug(vendor) if vendor else "unknown"
+            normalized_key, match_confidence = self._build_normalized_key(
+                brand_slug=brand_slug,
+                sku=None,
+                title=title,
+                tags=[],
+            )
+            gender, subcategory = classify_gender_and_subcategory(
+                product_type=None,
+                title=title,
+                tags="",
+            )
+            products.append(
+                ProductInfo(
+                    title=title,
+                    vendor=vendor,
+                    handle=handle,
+                    product_type=None,
+                    price=price,
+                    compare_at_price=None,
+                    currency=currency,
+                    sku=None,
+                    image_url=image_url,
+                    tags=None,
+                    product_url=product_url,
+                    product_key=f"{platform_prefix}:{host_slug}:{handle}",
+                    is_available=True,
+                    gender=gender,
+                    subcategory=subcategory,
+                    normalized_key=normalized_key,
+                    match_confidence=match_confidence,
+                )
+            )
+        return products
+
     async def _crawl_generic_product_cards(
         self,
         channel_url: str,
@@ -769,7 +1458,6 @@ class ProductCrawler:
     ) -> list[ProductInfo]:
         assert self._client is not None
         base = channel_url.rstrip("/")
-        host_slug = urlparse(base).netloc.lower().replace("www.", "") or "unknown"
         products: list[ProductInfo] = []
         seen_urls: set[str] = set()
 
@@ -779,180 +1467,29 @@ class ProductCrawler:
             for page in range(1, max_pages + 1):
                 page_url = f"{entry_url}?page={page}" if page > 1 else entry_url
                 try:
-                    resp = await self._client.get(page_url, timeout=self._timeout)
+                    resp = await self._limited_get(
+                        page_url, platform_prefix, timeout=self._timeout, probe=page == 1
+                    )
                 except Exception:
                     break
                 if resp.status_code != 200:
                     break
-                soup = BeautifulSoup(resp.text, "html.parser")
-                cards = soup.select(item_selector)
-                if not cards:
-                # 카드 구조가 없는 스킨은 JSON-LD Product 메타데이터를 사용한다.
-                    jsonld_products: list[dict] = []
-                    for script in soup.select("script[type='application/ld+json']"):
-                        raw = (script.string or script.get_text() or "").strip()
-                        if not raw:
-                            continue
-                        try:
-                            parsed = json.loads(raw)
-                        except Exception:
-                            continue
-                        self._collect_jsonld_products(parsed, jsonld_products)
-
-                    if not jsonld_products:
-                        break
-
-                    page_count = 0
-                    for obj in jsonld_products:
-                        title = str(obj.get("name") or "").strip()
-                        if not title or self._is_title_denied(title):
-                            continue
-                        offers = obj.get("offers") or {}
-                        if isinstance(offers, list):
-                            offers = offers[0] if offers else {}
-                        price = self._extract_price_from_text(str(offers.get("price") or ""))
-                        if price is None:
-                            continue
-                        raw_url = str(obj.get("url") or "").strip()
-                        product_url = urljoin(base + "/", raw_url) if raw_url else page_url
-                        if product_url in seen_urls:
-                            continue
-                        seen_urls.add(product_url)
-
-                        image = obj.get("image")
-                        image_url: str | None = None
-                        if isinstance(image, list) and image:
-                            image_url = str(image[0])
-                        elif isinstance(image, str):
-                            image_url = image
-                        if image_url:
-                            image_url = urljoin(base + "/", image_url)
-
-                        fallback_handle = slugify(urlparse(product_url).path, max_length=70)
-                        handle = slugify(title, max_length=70) or fallback_handle or "item"
-                        vendor_obj = obj.get("brand") or {}
-                        vendor = (
-                            str(vendor_obj.get("name") or "").strip()
-                            if isinstance(vendor_obj, dict)
-                            else str(vendor_obj or "").strip()
-                        ) or host_slug
-                        brand_slug = slugify(vendor) if vendor else "unknown"
-                        normalized_key, match_confidence = self._build_normalized_key(
-                            brand_slug=brand_slug,
-                            sku=None,
-                            title=title,
-                            tags=[],
-                        )
-                        gender, subcategory = classify_gender_and_subcategory(
-                            product_type=None,
-                            title=title,
-                            tags="",
-                        )
-                        products.append(
-                            ProductInfo(
-                                title=title,
-                                vendor=vendor,
-                                handle=handle,
-                                product_type=None,
-                                price=price,
-                                compare_at_price=None,
-                                currency=currency,
-                                sku=None,
-                                image_url=image_url,
-                                tags=None,
-                                product_url=product_url,
-                                product_key=f"{platform_prefix}:{host_slug}:{handle}",
-                                is_available=True,
-                                gender=gender,
-                                subcategory=subcategory,
-                                normalized_key=normalized_key,
-                                match_confidence=match_confidence,
-                            )
-                        )
-                        page_count += 1
-
-                    if page_count == 0:
-                        break
-                    await asyncio.sleep(self._delay)
-                    continue
-
-                page_count = 0
-                for card in cards:
-                    a = card.select_one(link_selector) or card.select_one("a[href]")
-                    if not a:
-                        continue
-                    href = (a.get("href") or "").strip()
-                    if not href:
-                        continue
-                    product_url = urljoin(base + "/", href)
-                    if product_url in seen_urls:
-                        continue
-                    seen_urls.add(product_url)
-
-                    title_node = card.select_one(title_selector)
-                    title = (
-                        title_node.get_text(" ", strip=True)
-                        if title_node
-                        else a.get_text(" ", strip=True)
-                    )
-                    if not title or self._is_title_denied(title):
-                        continue
-
-                    price_node = card.select_one(price_selector)
-                    price_text = (
-                        price_node.get_text(" ", strip=True)
-                        if price_node
-                        else card.get_text(" ", strip=True)
-                    )
-                    price = self._extract_price_from_text(price_text)
-                    if price is None:
-                        continue
-
-                    image = card.select_one("img")
-                    image_url = image.get("src") if image else None
-                    if image_url:
-                        image_url = urljoin(base + "/", image_url)
-
-                    fallback_handle = slugify(urlparse(product_url).path, max_length=70)
-                    handle = slugify(title, max_length=70) or fallback_handle or "item"
-                    vendor = host_slug
-                    brand_slug = slugify(vendor) if vendor else "unknown"
-                    normalized_key, match_confidence = self._build_normalized_key(
-                        brand_slug=brand_slug,
-                        sku=None,
-                        title=title,
-                        tags=[],
-                    )
-                    gender, subcategory = classify_gender_and_subcategory(
-                        product_type=None,
-                        title=title,
-                        tags="",
-                    )
-                    products.append(
-                        ProductInfo(
-                            title=title,
-                            vendor=vendor,
-                            handle=handle,
-                            product_type=None,
-                            price=price,
-                            compare_at_price=None,
-                            currency=currency,
-                            sku=None,
-                            image_url=image_url,
-                            tags=None,
-                            product_url=product_url,
-                            product_key=f"{platform_prefix}:{host_slug}:{handle}",
-                            is_available=True,
-                            gender=gender,
-                            subcategory=subcategory,
-                            normalized_key=normalized_key,
-                            match_confidence=match_confidence,
-                        )
-                    )
-                    page_count += 1
-
-                if page_count == 0:
+                page_products, seen_urls = await self._parse(
+                    parse_generic_product_page,
+                    resp.text,
+                    page_url,
+                    channel_url,
+                    currency,
+                    platform_prefix,
+                    item_selector,
+                    link_selector,
+                    title_selector,
+                    price_selector,
+                    seen_urls,
+                )
+                if not page_products:
                     break
+                products.extend(page_products)
                 await asyncio.sleep(self._delay)
 
         return products
@@ -1130,7 +1667,7 @@ class ProductCrawler:
         image_url: str | None = images[0]["src"] if images else None
 
         product_url = f"{base_url}/products/{handle}"
-        brand_slug = slugify(vendor) if vendor else "unknown"
+        brand_slug = vendor_slug(vendor) if vendor else "unknown"
         product_key = f"{brand_slug}:{handle}"
         tags = p.get("tags") or []
         if isinstance(tags, list):
@@ -1171,6 +1708,7 @@ class ProductCrawler:
             subcategory=subcategory,
             normalized_key=normalized_key,
             match_confidence=match_confidence,
+            shop_updated_at=p.get("updated_at"),
         )
 
     def _parse_woocommerce_product(
@@ -1229,7 +1767,7 @@ class ProductCrawler:
         tags_json = json.dumps(tags_list, ensure_ascii=False) if tags_list else None
         tags_text = ", ".join(tags_list)
         is_available = str(item.get("stock_status") or "").lower() != "outofstock"
-        brand_slug = slugify(vendor) if vendor and vendor != "unknown" else "unknown"
+        brand_slug = vendor_slug(vendor) if vendor and vendor != "unknown" else "unknown"
         normalized_key, match_confidence = self._build_normalized_key(
             brand_slug=brand_slug,
             sku=sku,
@@ -1285,3 +1823,90 @@ class ProductCrawler:
         if isinstance(exc, (json.JSONDecodeError, ValueError, KeyError)):
             return "parse_error"
         return "parse_error"
+
+
+# ── 파싱 워커 함수 (parse_pool 프로세스에서도 실행되므로 모듈 레벨·picklable 인자만) ──
+
+_worker_parser: ProductCrawler | None = None
+
+
+def _parser() -> ProductCrawler:
+    """파싱 전용 ProductCrawler (HTTP 클라이언트 없음) — 프로세스당 1개."""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = ProductCrawler()
+    return _worker_parser
+
+
+def parse_shopify_items(items: list[dict], base: str, currency: str) -> list[ProductInfo]:
+    """Shopify products.json 항목 목록 → ProductInfo 목록."""
+    parser = _parser()
+    out: list[ProductInfo] = []
+    for item in items:
+        info = parser._parse_product(item, base, currency)
+        if info:
+            out.append(info)
+    return out
+
+
+def parse_woocommerce_items(items: list[dict], channel_url: str, currency: str) -> list[ProductInfo]:
+    """WooCommerce products API 항목 목록 → ProductInfo 목록."""
+    parser = _parser()
+    out: list[ProductInfo] = []
+    for item in items:
+        info = parser._parse_woocommerce_product(item, channel_url, currency)
+        if info:
+            out.append(info)
+    return out
+
+
+def parse_cafe24_list_page(
+    html: str,
+    channel_url: str,
+    currency: str,
+    brand_name: str | None,
+    seen_product_nos: set[str],
+) -> tuple[list[ProductInfo], set[str]]:
+    """Cafe24 목록 페이지 파싱. 워커에서는 seen 집합이 복사본이므로 갱신본을 함께 반환한다."""
+    seen = set(seen_product_nos)
+    products = _parser()._parse_cafe24_product_list(
+        html=html,
+        channel_url=channel_url,
+        currency=currency,
+        brand_name=brand_name,
+        seen_product_nos=seen,
+    )
+    return products, seen
+
+
+def parse_generic_product_page(
+    html: str,
+    page_url: str,
+    channel_url: str,
+    currency: str,
+    platform_prefix: str,
+    item_selector: str,
+    link_selector: str,
+    title_selector: str,
+    price_selector: str,
+    seen_urls: set[str],
+) -> tuple[list[ProductInfo], set[str]]:
+    """범용 카드형 목록 페이지 파싱. 워커에서는 seen 집합이 복사본이므로 갱신본을 함께 반환한다."""
+    seen = set(seen_urls)
+    products = _parser()._parse_generic_product_cards(
+        html,
+        page_url,
+        channel_url,
+        currency,
+        platform_prefix=platform_prefix,
+        item_selector=item_selector,
+        link_selector=link_selector,
+        title_selector=title_selector,
+        price_selector=price_selector,
+        seen_urls=seen,
+    )
+    return products, seen
+
+
+def extract_cafe24_categories(html: str) -> dict[str, str]:
+    return ProductCrawler._extract_cafe24_categories(html)
@@ -0,0 +1,136 @@
+"""
+크롤 응답 녹화/재생 transport.
+
+- 녹화(RecordingTransport): 실제 응답을 받아 그대로 돌려주면서 본문·헤더를
+  `<dir>/<host>/<url 해시>/<UTC 시각>.json.gz`로 저장한다.
+- 재생(ReplayTransport): 네트워크 없이 저장된 응답을 돌려준다. 같은 URL이 여러 번
+  녹화됐으면 가장 최근 것(replay_at을 주면 그 시각 이전 중 최신)을 사용한다.
+  녹화가 없는 URL은 404 + `X-Replay-Miss: 1`.
+
+httpx transport 계층에서 동작하므로 ProductCrawler·crawl_products.py의 파싱/저장 경로는
+그대로 실행된다 — 규칙 변경 후 ProductInfo 재생성, 결정적 파서/저장 벤치마크에 사용.
+조건부 요청(304)은 본문이 없어 재생에 쓸 수 없으므로 녹화·재생 시 페이지 캐시를 끈다.
+키가 URL 전체라 Shopify 증분 URL(updated_at_min)은 재현되지 않으므로 녹화·재생 시 전체 순회를 강제하고,
+재생은 저장 경로를 그대로 실행하므로 별도 DB(crawl_products.py --replay-database-url)에서만 허용한다.
+"""
+from __future__ import annotations
+
+import base64
+import gzip
+import hashlib
+import json
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+_RECORD_VERSION = 1
+_TIMESTAMP_FORMAT = "%Y%m%dT%H%M%S%fZ"
+# 본문은 디코딩된 상태로 저장하므로 전송 인코딩 관련 헤더는 버린다
+_DROP_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+def _entry_dir(root: Path, method: str, url: httpx.URL) -> Path:
+    host = url.host or "unknown"
+    safe_host = "".join(ch if ch.isalnum() or ch in ".-" else "_" for ch in host)
+    digest = hashlib.sha1(f"{method.upper()} {url}".encode("utf-8")).hexdigest()[:20]
+    return root / safe_host / digest
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """inner transport 응답을 녹화 디렉터리에 저장하는 래퍼."""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, record_dir: str | Path):
+        self._inner = inner
+        self._root = Path(record_dir)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self._inner.handle_async_request(request)
+        try:
+            # aread()는 Content-Encoding을 풀어 준 본문을 반환한다
+            content = await response.aread()
+        finally:
+            await response.aclose()
+        headers = [
+            (key, value)
+            for key, value in response.headers.multi_items()
+            if key.lower() not in _DROP_HEADERS
+        ]
+        self._save(request, response.status_code, headers, content)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=headers,
+            content=content,
+            request=request,
+            extensions=response.extensions,
+        )
+
+    def _save(
+        self,
+        request: httpx.Request,
+        status_code: int,
+        headers: list[tuple[str, str]],
+        content: bytes,
+    ) -> None:
+        recorded_at = datetime.now(timezone.utc)
+        payload = {
+            "version": _RECORD_VERSION,
+            "method": request.method,
+            "url": str(request.url),
+            "status_code": status_code,
+            "headers": headers,
+            "recorded_at": recorded_at.isoformat(),
+            "body": base64.b64encode(content).decode("ascii"),
+        }
+        path = _entry_dir(self._root, request.method, request.url) / (
+            recorded_at.strftime(_TIMESTAMP_FORMAT) + ".json.gz"
+        )
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(path, "wt", encoding="utf-8") as fh:
+                json.dump(payload, fh, ensure_ascii=False, separators=(",", ":"))
+        except OSError as exc:
+            logger.warning("응답 녹화 실패 [%s]: %s", request.url, exc)
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """녹화 디렉터리의 응답만으로 요청을 처리하는 transport (네트워크 없음)."""
+
+    def __init__(self, replay_dir: str | Path, replay_at: datetime | None = None):
+        self._root = Path(replay_dir)
+        if replay_at is not None and replay_at.tzinfo is not None:
+            replay_at = replay_at.astimezone(timezone.utc)
+        # replay_at(naive는 UTC로 간주) 이전 녹화만 사용 — 파일명이 UTC 시각이라 문자열 비교
+        self._cutoff = replay_at.strftime(_TIMESTAMP_FORMAT) if replay_at else None
+        self.hits = 0
+        self.misses = 0
+
+    def _find(self, request: httpx.Request) -> Path | None:
+        entry_dir = _entry_dir(self._root, request.method, request.url)
+        if not entry_dir.is_dir():
+            return None
+        candidates = sorted(entry_dir.glob("*.json.gz"))
+        if self._cutoff:
+            candidates = [p for p in candidates if p.name[: -len(".json.gz")] <= self._cutoff]
+        return candidates[-1] if candidates else None
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        path = self._find(request)
+        if path is None:
+            self.misses += 1
+            return httpx.Response(404, headers={"X-Replay-Miss": "1"}, request=request)
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            payload = json.load(fh)
+        self.hits += 1
+        return httpx.Response(
+            status_code=payload["status_code"],
+            headers=[tuple(pair) for pair in payload["headers"]],
+            content=base64.b64decode(payload["body"]),
+            request=request,
+        )
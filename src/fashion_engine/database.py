@@ -29,5 +29,9 @@ async def init_db() -> None:
     """로컬 SQLite 개발용 테이블 자동 생성. 운영/Railway에서는 Alembic을 사용한다."""
     # 모든 모델이 임포트된 상태에서 호출해야 함
     import fashion_engine.models  # noqa: F401 — 모든 모델 등록
+    from fashion_engine.services.search_service import create_sqlite_fts
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        if conn.dialect.name == "sqlite":
+            await conn.run_sync(create_sqlite_fts)
@@ -5,6 +5,7 @@ from fashion_engine.models.channel_brand import ChannelBrand
 from fashion_engine.models.category import Category
 from fashion_engine.models.price_history import PriceHistory
 from fashion_engine.models.product import Product
+from fashion_engine.models.product_latest_price import ProductLatestPrice
 from fashion_engine.models.brand_collaboration import BrandCollaboration
 from fashion_engine.models.fashion_news import FashionNews
 from fashion_engine.models.exchange_rate import ExchangeRate
@@ -15,6 +16,7 @@ from fashion_engine.models.brand_director import BrandDirector
 from fashion_engine.models.crawl_run import CrawlRun, CrawlChannelLog
 from fashion_engine.models.product_catalog import ProductCatalog
 from fashion_engine.models.channel_note import ChannelNote
+from fashion_engine.models.search_suggestion import SearchSuggestion
 from fashion_engine.models.intel import (
     IntelEvent,
     IntelEventSource,
@@ -24,12 +26,14 @@ from fashion_engine.models.intel import (
 
 __all__ = [
     "Channel", "Brand", "ChannelBrand", "Category", "PriceHistory", "Product",
+    "ProductLatestPrice",
     "BrandCollaboration", "FashionNews", "ExchangeRate",
     "Purchase", "WatchListItem", "Drop",
     "BrandDirector",
     "CrawlRun", "CrawlChannelLog",
     "ProductCatalog",
     "ChannelNote",
+    "SearchSuggestion",
     "IntelEvent",
     "IntelEventSource",
     "IntelIngestRun",
@@ -25,6 +25,10 @@ class Channel(Base):
     description: Mapped[str | None] = mapped_column(Text)
     instagram_url: Mapped[str | None] = mapped_column(String(500))
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+    shopify_updated_hwm: Mapped[datetime | None] = mapped_column(DateTime)           # 증분 크롤 기준 (수집된 Shopify updated_at 최대값)
+    last_full_crawl_at: Mapped[datetime | None] = mapped_column(DateTime)            # 마지막 전체 순회 완료 시각
+    crawl_strategy: Mapped[str | None] = mapped_column(String(50))                   # 마지막 성공 크롤 전략 ('shopify-api', 'cafe24-html', ...)
+    crawl_hints: Mapped[str | None] = mapped_column(Text)                            # 전략별 캐시 JSON 문자열 (자동 탐지한 Cafe24 카테고리 등)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from fashion_engine.database import Base
@@ -42,10 +42,21 @@ class CrawlChannelLog(Base):
     products_found: Mapped[int] = mapped_column(Integer, default=0)
     products_new: Mapped[int] = mapped_column(Integer, default=0)
     products_updated: Mapped[int] = mapped_column(Integer, default=0)
+    price_changes: Mapped[int | None] = mapped_column(Integer, nullable=True)  # 가격/재고 변경으로 기록된 PriceHistory 행 수
     error_msg: Mapped[str | None] = mapped_column(String(500), nullable=True)
     error_type: Mapped[str | None] = mapped_column(String(30), nullable=True)
     strategy: Mapped[str | None] = mapped_column(String(50), nullable=True)
     duration_ms: Mapped[int] = mapped_column(Integer, default=0)
+    # 단계별 소요 시간(ms) — fetch/parse는 채널 크롤러, 나머지는 배치 저장 누적
+    fetch_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    parse_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    brand_lookup_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    upsert_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    history_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    commit_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    bytes_downloaded: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    request_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    retry_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
     crawled_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
     run: Mapped["CrawlRun"] = relationship(back_populates="logs")
@@ -8,10 +8,12 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -25,6 +27,15 @@ if TYPE_CHECKING:
 
 class IntelEvent(Base):
     __tablename__ = "intel_events"
+    __table_args__ = (
+        # 목록 API 정렬/keyset 커서: coalesce(event_time, detected_at) DESC, id DESC
+        Index(
+            "ix_intel_events_active_sort_time",
+            "is_active",
+            text("coalesce(event_time, detected_at) DESC"),
+            text("id DESC"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     event_type: Mapped[str] = mapped_column(String(30), index=True, nullable=False)
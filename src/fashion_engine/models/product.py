@@ -40,6 +40,7 @@ class Product(Base):
     is_new: Mapped[bool] = mapped_column(Boolean, default=False)                     # 신상품 여부
     is_sale: Mapped[bool] = mapped_column(Boolean, default=False)                    # 세일 여부
     archived_at: Mapped[datetime | None] = mapped_column(DateTime)
+    last_seen_at: Mapped[datetime | None] = mapped_column(DateTime)                  # 마지막으로 크롤에서 확인된 시각
 
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -0,0 +1,51 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from sqlalchemy import ForeignKey, DateTime, Numeric, String, Boolean, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from fashion_engine.database import Base
+
+if TYPE_CHECKING:
+    from fashion_engine.models.product import Product
+
+
+class ProductLatestPrice(Base):
+    """
+    제품별 최신 가격 (price_history의 product_id별 마지막 행).
+
+    크롤 저장 시 PriceHistory insert와 같은 트랜잭션에서 upsert된다.
+    조회 API는 파티션 전체를 max(crawled_at)로 훑는 대신 이 테이블을 조인한다.
+    """
+
+    __tablename__ = "product_latest_price"
+    __table_args__ = (
+        Index("ix_product_latest_price_sale_discount", "is_sale", "discount_rate"),
+    )
+
+    product_id: Mapped[int] = mapped_column(
+        ForeignKey("products.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    price: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+    original_price: Mapped[Decimal | None] = mapped_column(Numeric(12, 2))           # 정가 (세일 중일 때)
+    currency: Mapped[str] = mapped_column(String(10), default="KRW")
+    is_sale: Mapped[bool] = mapped_column(Boolean, default=False)
+    discount_rate: Mapped[int | None] = mapped_column()                              # 할인율 (%)
+
+    crawled_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)  # 해당 PriceHistory 기록 시각
+
+    # 원 통화 가격 — 외화 채널의 실제 가격 변경과 환율 변동을 구분 (refresh_latest_prices 재계산 시 NULL)
+    source_price: Mapped[Decimal | None] = mapped_column(Numeric(12, 2))
+    source_original_price: Mapped[Decimal | None] = mapped_column(Numeric(12, 2))
+    source_currency: Mapped[str | None] = mapped_column(String(10))
+
+    # 마지막 가격 변경 — price가 바뀐 기록에서만 갱신 (heartbeat·재고 전환 행은 유지). 가격 하락 랭킹용
+    previous_price: Mapped[Decimal | None] = mapped_column(Numeric(12, 2))
+    price_changed_at: Mapped[datetime | None] = mapped_column(DateTime)
+
+    product: Mapped["Product"] = relationship()
+
+    def __repr__(self) -> str:
+        return f"<ProductLatestPrice product={self.product_id} price={self.price} {self.currency}>"
@@ -0,0 +1,23 @@
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from fashion_engine.database import Base
+
+
+class SearchSuggestion(Base):
+    """
+    연관검색어 사전 집계 인덱스 (search_suggestion_service.rebuild_search_suggestions).
+
+    term은 제품명 토큰(소문자) 또는 토큰의 1~3글자 접두어.
+    PK (term, kind, suggestion) 순서라 term 단건/범위 조회가 인덱스 하나로 끝난다.
+    """
+
+    __tablename__ = "search_suggestions"
+
+    term: Mapped[str] = mapped_column(String(64), primary_key=True)
+    kind: Mapped[str] = mapped_column(String(10), primary_key=True)  # brand | token
+    suggestion: Mapped[str] = mapped_column(String(255), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False)      # 함께 등장한 활성 제품 수
+
+    def __repr__(self) -> str:
+        return f"<SearchSuggestion {self.term!r} {self.kind}={self.suggestion!r} x{self.count}>"
@@ -0,0 +1,92 @@
+"""
+vendor → brand slug → Brand.id 프로세스 공용 캐시.
+
+- vendor_slug: slugify는 순수 함수라 bounded LRU로 memoize (채널 내 vendor 반복이 많음)
+- slug → BrandRef: find_brands_by_vendors의 DB 조회를 줄이는 bounded LRU.
+  '없음' 결과도 캐시하므로 brand_service.upsert_brand가 새 브랜드를 만들면 무효화한다.
+  다른 프로세스(crawl_brands 등)의 브랜드 추가는 TTL이 지나면 반영된다.
+
+ORM 객체는 세션을 넘어 재사용할 수 없으므로 (id, slug)만 보관한다.
+"""
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+
+from slugify import slugify
+
+_BRAND_CACHE_MAX = 50_000
+_BRAND_CACHE_TTL_SECONDS = 600.0
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class BrandRef:
+    id: int
+    slug: str
+
+
+@lru_cache(maxsize=20_000)
+def vendor_slug(vendor: str) -> str:
+    """vendor명 → brand slug (slugify memoized)."""
+    return slugify(vendor)
+
+
+class _BrandSlugCache:
+    def __init__(self, maxsize: int, ttl: float):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple[BrandRef | None, float]] = OrderedDict()
+
+    def get(self, slug: str) -> BrandRef | None | object:
+        """캐시된 BrandRef(없는 브랜드면 None). 캐시 미스면 _MISSING."""
+        entry = self._entries.get(slug)
+        if entry is None:
+            return _MISSING
+        ref, expires_at = entry
+        if expires_at < time.monotonic():
+            del self._entries[slug]
+            return _MISSING
+        self._entries.move_to_end(slug)
+        return ref
+
+    def put(self, slug: str, ref: BrandRef | None) -> None:
+        self._entries[slug] = (ref, time.monotonic() + self._ttl)
+        self._entries.move_to_end(slug)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, slug: str | None = None) -> None:
+        if slug is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(slug, None)
+
+
+_brand_slug_cache = _BrandSlugCache(_BRAND_CACHE_MAX, _BRAND_CACHE_TTL_SECONDS)
+
+
+def get_cached_brands(slugs: list[str]) -> tuple[dict[str, BrandRef | None], list[str]]:
+    """slug 목록 → (캐시 적중 {slug: BrandRef|None}, DB 조회가 필요한 slug 목록)."""
+    hits: dict[str, BrandRef | None] = {}
+    misses: list[str] = []
+    for slug in slugs:
+        ref = _brand_slug_cache.get(slug)
+        if ref is _MISSING:
+            misses.append(slug)
+        else:
+            hits[slug] = ref  # type: ignore[assignment]
+    return hits, misses
+
+
+def cache_brands(refs: dict[str, BrandRef | None]) -> None:
+    for slug, ref in refs.items():
+        _brand_slug_cache.put(slug, ref)
+
+
+def invalidate_brand_cache(slug: str | None = None) -> None:
+    """브랜드 추가·slug 변경 시 호출. slug 없으면 전체 비움."""
+    _brand_slug_cache.invalidate(slug)
@@ -1,13 +1,15 @@
 from datetime import datetime
 
 from slugify import slugify
-from sqlalchemy import case, func, select, or_
+from sqlalchemy import case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from fashion_engine.models.brand import Brand
 from fashion_engine.models.channel import Channel
 from fashion_engine.models.channel_brand import ChannelBrand
 from fashion_engine.models.product import Product
+from fashion_engine.services.brand_cache import invalidate_brand_cache
+from fashion_engine.services.search_service import text_match, text_rank
 
 
 async def get_all_brands(db: AsyncSession) -> list[Brand]:
@@ -29,11 +31,10 @@ async def get_brand_by_slug(db: AsyncSession, slug: str) -> Brand | None:
 
 
 async def search_brands(db: AsyncSession, query: str) -> list[Brand]:
-    q = f"%{query}%"
     result = await db.execute(
         select(Brand)
-        .where(or_(Brand.name.ilike(q), Brand.name_ko.ilike(q)))
-        .order_by(Brand.name)
+        .where(text_match(db, [Brand.name, Brand.name_ko], query))
+        .order_by(*text_rank(db, Brand.name, query), Brand.name)
         .limit(50)
     )
     return list(result.scalars().all())
@@ -124,6 +125,8 @@ async def upsert_brand(db: AsyncSession, name: str, name_ko: str | None = None)
         db.add(brand)
         await db.commit()
         await db.refresh(brand)
+        # '브랜드 없음'으로 캐시된 slug가 남아 있으면 새 브랜드 매칭이 막힌다
+        invalidate_brand_cache(slug)
 
     return brand
 
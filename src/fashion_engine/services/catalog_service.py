@@ -71,21 +71,9 @@ def _catalog_sql(since: datetime | None, dialect_name: str) -> tuple[str, dict]:
             GROUP BY k.nkey
         ),
         latest_price AS (
-            SELECT x.product_id, x.price, x.is_sale
-            FROM (
-                SELECT
-                    ph.product_id,
-                    ph.price,
-                    ph.is_sale,
-                    ph.currency,
-                    ROW_NUMBER() OVER (
-                        PARTITION BY ph.product_id
-                        ORDER BY ph.crawled_at DESC, ph.id DESC
-                    ) AS rn
-                FROM price_history ph
-            ) x
-            WHERE x.rn = 1
-              AND x.currency = 'KRW'
+            SELECT lp.product_id, lp.price, lp.is_sale
+            FROM product_latest_price lp
+            WHERE lp.currency = 'KRW'
         ),
         price_agg AS (
             SELECT
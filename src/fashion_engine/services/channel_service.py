@@ -1,3 +1,6 @@
+import json
+from datetime import datetime
+
 from sqlalchemy import case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -109,3 +112,61 @@ async def update_platform(db: AsyncSession, channel_id: int, platform: str) -> b
         return False
     channel.platform = platform
     return True
+
+
+async def update_crawl_watermark(
+    db: AsyncSession,
+    channel_id: int,
+    max_updated_at: datetime | None,
+    full_sweep_at: datetime | None = None,
+) -> None:
+    """증분 크롤 high-water mark 전진 (역행하지 않음) + 전체 순회 완료 시각 기록."""
+    channel = (
+        await db.execute(select(Channel).where(Channel.id == channel_id))
+    ).scalar_one_or_none()
+    if not channel:
+        return
+    if max_updated_at and (
+        channel.shopify_updated_hwm is None or max_updated_at > channel.shopify_updated_hwm
+    ):
+        channel.shopify_updated_hwm = max_updated_at
+    if full_sweep_at:
+        channel.last_full_crawl_at = full_sweep_at
+
+
+def get_cached_cafe24_categories(channel: Channel) -> list[tuple[str, str]]:
+    """crawl_hints에 저장된 자동 탐지 Cafe24 카테고리 [(brand_name, cate_no), ...]."""
+    if not channel.crawl_hints:
+        return []
+    try:
+        hints = json.loads(channel.crawl_hints)
+    except ValueError:
+        return []
+    rows = hints.get("cafe24_categories") if isinstance(hints, dict) else None
+    return [
+        (str(row[0]), str(row[1]))
+        for row in rows or []
+        if isinstance(row, list) and len(row) == 2 and row[0] and row[1]
+    ]
+
+
+async def update_crawl_fingerprint(
+    db: AsyncSession,
+    channel_id: int,
+    strategy: str,
+    cafe24_categories: list[tuple[str, str]] | None = None,
+) -> None:
+    """성공한 크롤 전략을 기록한다. 새로 탐지한 Cafe24 카테고리가 있으면 함께 캐시."""
+    channel = (
+        await db.execute(select(Channel).where(Channel.id == channel_id))
+    ).scalar_one_or_none()
+    if not channel:
+        return
+    channel.crawl_strategy = strategy
+    if cafe24_categories:
+        channel.crawl_hints = json.dumps(
+            {"cafe24_categories": [list(row) for row in cafe24_categories]},
+            ensure_ascii=False,
+        )
+    elif strategy != "cafe24-html":
+        channel.crawl_hints = None
@@ -0,0 +1,198 @@
+"""
+채널 변경 빈도 기반 적응형 크롤 스케줄.
+
+채널별 최근 CrawlChannelLog(신규 제품 + 가격/재고 변경 수)로 시간당 변경률을 추정하고,
+"크롤 1회에 변경 _TARGET_CHANGES_PER_CRAWL건"이 되도록 재방문 간격을 정한다.
+- 변경이 잦은 채널: 최소 간격(settings.crawler_min_interval_hours)까지 자주 크롤
+- 변경이 없는 채널: 최대 간격(settings.crawler_max_interval_hours)마다 한 번
+- 크롤 이력이 1건 이하인 채널: 기존 일일 크롤과 같은 24시간 간격
+
+간격이 지난(due) 채널은 "지난 크롤 이후 놓친 것으로 추정되는 변경 수" 순으로 뽑고,
+최근 24시간 요청 수(CrawlChannelLog.request_count 합)가 전역 일일 예산을 넘지 않게 자른다.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from fashion_engine.config import settings
+from fashion_engine.models.channel import Channel
+from fashion_engine.models.crawl_run import CrawlChannelLog
+
+_HISTORY_WINDOW = 8  # 변경률 추정에 쓰는 채널별 최근 로그 수
+_TARGET_CHANGES_PER_CRAWL = 10.0
+_DEFAULT_INTERVAL_HOURS = 24.0
+_DEFAULT_REQUEST_ESTIMATE = 10
+_PRODUCTS_PER_REQUEST = 100  # request_count가 없는 과거 로그의 요청 수 추정용 (Shopify 페이지 크기)
+
+
+@dataclass
+class ChannelCrawlPlan:
+    channel_id: int
+    channel_name: str
+    changes_per_hour: float | None  # None = 이력 부족
+    interval_hours: float
+    hours_since_crawl: float | None  # None = 크롤 이력 없음
+    estimated_requests: int
+    priority: float
+
+
+@dataclass
+class AdaptiveCrawlPlan:
+    selected: list[ChannelCrawlPlan]
+    due_count: int
+    deferred_count: int  # due지만 예산 초과로 다음 틱으로 미룬 채널 수
+    request_budget: int
+    requests_used_24h: int
+    estimated_requests: int
+
+    @property
+    def channel_ids(self) -> list[int]:
+        return [plan.channel_id for plan in self.selected]
+
+
+def _interval_hours(changes_per_hour: float | None) -> float:
+    if changes_per_hour is None:
+        return _DEFAULT_INTERVAL_HOURS
+    if changes_per_hour <= 0:
+        return settings.crawler_max_interval_hours
+    return min(
+        settings.crawler_max_interval_hours,
+        max(settings.crawler_min_interval_hours, _TARGET_CHANGES_PER_CRAWL / changes_per_hour),
+    )
+
+
+def _estimate_changes_per_hour(logs: list[CrawlChannelLog]) -> float | None:
+    """최신순 로그 → 시간당 변경 수. 크롤 1회의 변경은 직전 크롤 이후 구간에 귀속된다."""
+    observed = [log for log in logs if log.status != "failed"]
+    if len(observed) < 2:
+        return None
+    span_hours = (observed[0].crawled_at - observed[-1].crawled_at).total_seconds() / 3600
+    if span_hours <= 0:
+        return None
+    # 가장 오래된 로그의 변경은 구간 밖(그 이전 크롤 이후)에 속하므로 제외
+    changes = sum(
+        (log.products_new or 0) + (log.price_changes or 0) for log in observed[:-1]
+    )
+    return changes / span_hours
+
+
+def _estimate_requests(logs: list[CrawlChannelLog]) -> int:
+    counted = [log.request_count for log in logs if log.request_count]
+    if counted:
+        return max(1, round(sum(counted) / len(counted)))
+    found = [log.products_found for log in logs if log.products_found]
+    if found:
+        return math.ceil(max(found) / _PRODUCTS_PER_REQUEST) + 2
+    return _DEFAULT_REQUEST_ESTIMATE
+
+
+async def plan_adaptive_crawl(
+    db: AsyncSession,
+    *,
+    now: datetime | None = None,
+    tick_minutes: int | None = None,
+    daily_request_budget: int | None = None,
+    exclude_channel_types: set[str] | frozenset[str] = frozenset(),
+) -> AdaptiveCrawlPlan:
+    """이번 스케줄 틱에 크롤할 채널 선정.
+
+    틱 예산은 일일 예산의 틱 비율 2배까지 허용해(밀린 due 채널 흡수) 24시간 누적 예산 안에서 쓴다.
+    due 채널이 하나라도 있고 24시간 예산이 남아 있으면 최소 1개 채널은 선정한다.
+    """
+    now = now or datetime.utcnow()
+    tick_minutes = tick_minutes or settings.crawler_schedule_tick_minutes
+    budget = daily_request_budget if daily_request_budget is not None else settings.crawler_daily_request_budget
+
+    channels = list(
+        (
+            await db.execute(
+                select(Channel).where(Channel.is_active == True)  # noqa: E712
+            )
+        ).scalars().all()
+    )
+    channels = [c for c in channels if c.channel_type not in exclude_channel_types]
+
+    ranked = (
+        select(
+            CrawlChannelLog,
+            func.row_number()
+            .over(
+                partition_by=CrawlChannelLog.channel_id,
+                order_by=(CrawlChannelLog.crawled_at.desc(), CrawlChannelLog.id.desc()),
+            )
+            .label("rn"),
+        )
+        .where(CrawlChannelLog.channel_id.in_([c.id for c in channels]))
+        .subquery()
+    )
+    recent_log = aliased(CrawlChannelLog, ranked)
+    logs_by_channel: dict[int, list[CrawlChannelLog]] = {}
+    if channels:
+        recent_logs = await db.execute(
+            select(recent_log)
+            .where(ranked.c.rn <= _HISTORY_WINDOW)
+            .order_by(ranked.c.channel_id, ranked.c.rn)
+        )
+        for log in recent_logs.scalars().all():
+            logs_by_channel.setdefault(log.channel_id, []).append(log)
+
+    requests_used = int(
+        (
+            await db.execute(
+                select(func.coalesce(func.sum(CrawlChannelLog.request_count), 0)).where(
+                    CrawlChannelLog.crawled_at >= now - timedelta(hours=24)
+                )
+            )
+        ).scalar_one()
+    )
+
+    due: list[ChannelCrawlPlan] = []
+    for channel in channels:
+        logs = logs_by_channel.get(channel.id, [])
+        rate = _estimate_changes_per_hour(logs)
+        interval = _interval_hours(rate)
+        hours_since = (now - logs[0].crawled_at).total_seconds() / 3600 if logs else None
+        if hours_since is not None and hours_since < interval:
+            continue
+        if hours_since is None:
+            priority = math.inf  # 한 번도 크롤하지 않은 채널 우선
+        else:
+            # 놓친 변경 추정치 + 초과 비율(변경률 0인 채널끼리도 오래된 순으로)
+            priority = (rate or 0.0) * hours_since + hours_since / interval
+        due.append(
+            ChannelCrawlPlan(
+                channel_id=channel.id,
+                channel_name=channel.name,
+                changes_per_hour=rate,
+                interval_hours=interval,
+                hours_since_crawl=hours_since,
+                estimated_requests=_estimate_requests(logs),
+                priority=priority,
+            )
+        )
+    due.sort(key=lambda plan: plan.priority, reverse=True)
+
+    remaining = max(0, budget - requests_used)
+    tick_budget = min(remaining, math.ceil(budget * tick_minutes / 1440) * 2)
+    selected: list[ChannelCrawlPlan] = []
+    spent = 0
+    for plan in due:
+        if spent + plan.estimated_requests > tick_budget and (selected or remaining <= 0):
+            continue
+        selected.append(plan)
+        spent += plan.estimated_requests
+
+    return AdaptiveCrawlPlan(
+        selected=selected,
+        due_count=len(due),
+        deferred_count=len(due) - len(selected),
+        request_budget=budget,
+        requests_used_24h=requests_used,
+        estimated_requests=spent,
+    )
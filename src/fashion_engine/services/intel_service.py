@@ -8,7 +8,7 @@ from datetime import datetime, timedelta, timezone
 from urllib.parse import urlparse
 
 import httpx
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import Integer, String, and_, case, cast, func, literal, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -17,9 +17,13 @@ from fashion_engine.models.brand import Brand
 from fashion_engine.models.channel import Channel
 from fashion_engine.models.intel import IntelEvent
 from fashion_engine.models.product import Product
+from fashion_engine.services.search_service import text_match
 
 DEFAULT_LIMIT = 100
 MAX_LIMIT = 300
+TOTAL_COUNT_CAP = 10000  # 첫 페이지 total은 이 값까지만 센다 (전체 스캔 방지)
+MAX_MAP_POINTS = 2000
+_CLUSTER_CELLS_PER_TILE = 4
 CONFIDENCE_ORDER = {"low": 1, "medium": 2, "high": 3}
 SEVERITY_ORDER = {"low": 1, "medium": 2, "high": 3, "critical": 4}
 logger = logging.getLogger(__name__)
@@ -157,60 +161,52 @@ def event_sort_time(event: IntelEvent) -> datetime:
     return event.event_time or event.detected_at
 
 
-def _rank_ok(value: str | None, min_value: str | None, order: dict[str, int]) -> bool:
-    if not min_value:
-        return True
-    return order.get((value or "").lower(), 0) >= order.get(min_value.lower(), 0)
+# ix_intel_events_active_sort_time 인덱스와 같은 식이어야 인덱스 순서로 LIMIT을 읽는다
+EVENT_SORT_TIME = func.coalesce(IntelEvent.event_time, IntelEvent.detected_at)
 
 
-async def list_intel_events(
+def _rank_values(min_value: str | None, order: dict[str, int]) -> list[str] | None:
+    """min_value 이상 등급 값 목록. 필터가 필요 없으면(미지정·알 수 없는 등급) None."""
+    min_rank = order.get((min_value or "").lower(), 0)
+    if min_rank <= 0:
+        return None
+    return [value for value, rank in order.items() if rank >= min_rank]
+
+
+def _event_filters(
     db: AsyncSession,
     *,
     layers: list[str] | None = None,
-    brand_slug: str | None = None,
     channel_id: int | None = None,
     country: str | None = None,
     q: str | None = None,
     min_confidence: str | None = None,
     min_severity: str | None = None,
     time_range: str = "7d",
-    cursor: str | None = None,
-    limit: int = DEFAULT_LIMIT,
     bbox: tuple[float, float, float, float] | None = None,
-) -> dict:
-    limit = max(1, min(limit, MAX_LIMIT))
-    stmt = (
-        select(IntelEvent)
-        .options(
-            selectinload(IntelEvent.brand),
-            selectinload(IntelEvent.channel),
-            selectinload(IntelEvent.product),
-        )
-        .where(IntelEvent.is_active == True)
-    )
+) -> list:
+    """목록·타임라인·지도 공통 WHERE 조건."""
+    filters = [IntelEvent.is_active == True]
 
     cutoff = build_time_cutoff(time_range)
     if cutoff:
-        stmt = stmt.where(
+        filters.append(
             or_(
                 IntelEvent.event_time >= cutoff,
                 IntelEvent.detected_at >= cutoff,
             )
         )
     if layers:
-        stmt = stmt.where(IntelEvent.layer.in_(layers))
+        filters.append(IntelEvent.layer.in_(layers))
     if country:
-        stmt = stmt.where(IntelEvent.geo_country == country.upper())
+        filters.append(IntelEvent.geo_country == country.upper())
     if channel_id:
-        stmt = stmt.where(IntelEvent.channel_id == channel_id)
+        filters.append(IntelEvent.channel_id == channel_id)
     if q:
-        like = f"%{q}%"
-        stmt = stmt.where(
-            (IntelEvent.title.ilike(like)) | (IntelEvent.summary.ilike(like))
-        )
+        filters.append(text_match(db, [IntelEvent.title, IntelEvent.summary], q))
     if bbox:
         min_lng, min_lat, max_lng, max_lat = bbox
-        stmt = stmt.where(
+        filters.append(
             and_(
                 IntelEvent.geo_lng.is_not(None),
                 IntelEvent.geo_lat.is_not(None),
@@ -220,43 +216,88 @@ async def list_intel_events(
                 IntelEvent.geo_lat <= max_lat,
             )
         )
+    confidence_values = _rank_values(min_confidence, CONFIDENCE_ORDER)
+    if confidence_values:
+        filters.append(func.lower(IntelEvent.confidence).in_(confidence_values))
+    severity_values = _rank_values(min_severity, SEVERITY_ORDER)
+    if severity_values:
+        filters.append(func.lower(IntelEvent.severity).in_(severity_values))
+    return filters
+
+
+async def list_intel_events(
+    db: AsyncSession,
+    *,
+    layers: list[str] | None = None,
+    brand_slug: str | None = None,
+    channel_id: int | None = None,
+    country: str | None = None,
+    q: str | None = None,
+    min_confidence: str | None = None,
+    min_severity: str | None = None,
+    time_range: str = "7d",
+    cursor: str | None = None,
+    limit: int = DEFAULT_LIMIT,
+    bbox: tuple[float, float, float, float] | None = None,
+) -> dict:
+    limit = max(1, min(limit, MAX_LIMIT))
+    filters = _event_filters(
+        db,
+        layers=layers,
+        channel_id=channel_id,
+        country=country,
+        q=q,
+        min_confidence=min_confidence,
+        min_severity=min_severity,
+        time_range=time_range,
+        bbox=bbox,
+    )
     if brand_slug:
         brand_id = (
             await db.execute(select(Brand.id).where(Brand.slug == brand_slug))
         ).scalar_one_or_none()
         if not brand_id:
-            return {"items": [], "next_cursor": None, "total": 0}
-        stmt = stmt.where(IntelEvent.brand_id == brand_id)
-
-    stmt = stmt.order_by(
-        func.coalesce(IntelEvent.event_time, IntelEvent.detected_at).desc(),
-        IntelEvent.id.desc(),
-    )
-
-    rows = list((await db.execute(stmt)).scalars().all())
-    filtered = [
-        e
-        for e in rows
-        if _rank_ok(e.confidence, min_confidence, CONFIDENCE_ORDER)
-        and _rank_ok(e.severity, min_severity, SEVERITY_ORDER)
-    ]
+            return {"items": [], "next_cursor": None, "total": 0, "total_capped": False}
+        filters.append(IntelEvent.brand_id == brand_id)
 
+    page_filters = list(filters)
     if cursor:
         cursor_time, cursor_id = decode_cursor(cursor)
-        filtered = [
-            e
-            for e in filtered
-            if (event_sort_time(e), e.id) < (cursor_time, cursor_id)
-        ]
+        page_filters.append(tuple_(EVENT_SORT_TIME, IntelEvent.id) < tuple_(cursor_time, cursor_id))
 
-    page = filtered[:limit]
+    stmt = (
+        select(IntelEvent)
+        .options(
+            selectinload(IntelEvent.brand),
+            selectinload(IntelEvent.channel),
+            selectinload(IntelEvent.product),
+        )
+        .where(*page_filters)
+        .order_by(EVENT_SORT_TIME.desc(), IntelEvent.id.desc())
+        .limit(limit + 1)
+    )
+    rows = list((await db.execute(stmt)).scalars().all())
+    page = rows[:limit]
     next_cursor = (
-        encode_cursor(event_sort_time(page[-1]), page[-1].id) if len(filtered) > limit else None
+        encode_cursor(event_sort_time(page[-1]), page[-1].id) if len(rows) > limit else None
     )
+
+    # total은 첫 페이지에서만, TOTAL_COUNT_CAP건까지만 센다 (다음 페이지는 None)
+    total: int | None = None
+    total_capped = False
+    if not cursor:
+        if len(rows) <= limit:
+            total = len(rows)
+        else:
+            capped = select(IntelEvent.id).where(*filters).limit(TOTAL_COUNT_CAP + 1).subquery()
+            total = int((await db.execute(select(func.count()).select_from(capped))).scalar_one())
+            total_capped = total > TOTAL_COUNT_CAP
+            total = min(total, TOTAL_COUNT_CAP)
     return {
         "items": [serialize_event_row(e) for e in page],
         "next_cursor": next_cursor,
-        "total": len(filtered),
+        "total": total,
+        "total_capped": total_capped,
     }
 
 
@@ -299,31 +340,115 @@ async def get_map_points(
     bbox: tuple[float, float, float, float] | None = None,
     limit: int = 1000,
 ) -> list[dict]:
-    payload = await list_intel_events(
-        db,
-        layers=layers,
-        time_range=time_range,
-        bbox=bbox,
-        limit=min(limit, 2000),
+    """좌표 있는 최신 이벤트 — 지도에 필요한 컬럼만 조회 (관계 로딩·직렬화 없음)."""
+    filters = _event_filters(db, layers=layers, time_range=time_range, bbox=bbox)
+    rows = (
+        await db.execute(
+            select(
+                IntelEvent.id,
+                IntelEvent.layer,
+                IntelEvent.severity,
+                IntelEvent.confidence,
+                IntelEvent.geo_lat,
+                IntelEvent.geo_lng,
+                IntelEvent.title,
+                EVENT_SORT_TIME.label("sort_time"),
+                IntelEvent.geo_precision,
+            )
+            .where(
+                *filters,
+                IntelEvent.geo_lat.is_not(None),
+                IntelEvent.geo_lng.is_not(None),
+            )
+            .order_by(EVENT_SORT_TIME.desc(), IntelEvent.id.desc())
+            .limit(max(1, min(limit, MAX_MAP_POINTS)))
+        )
+    ).all()
+    return [
+        {
+            "id": row.id,
+            "layer": row.layer,
+            "severity": row.severity,
+            "confidence": row.confidence,
+            "lat": row.geo_lat,
+            "lng": row.geo_lng,
+            "title": row.title,
+            "event_time": _as_datetime(row.sort_time).isoformat(),
+            "geo_precision": row.geo_precision,
+        }
+        for row in rows
+    ]
+
+
+def _as_datetime(value: datetime | str) -> datetime:
+    # SQLite는 식(coalesce/strftime) 결과를 문자열로 돌려준다
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
+
+def _cluster_cell_degrees(zoom: int) -> float:
+    """줌 레벨별 격자 크기(도). 256px 타일 하나를 _CLUSTER_CELLS_PER_TILE칸으로 나눈다."""
+    return 360.0 / (2 ** max(0, min(zoom, 20))) / _CLUSTER_CELLS_PER_TILE
+
+
+async def get_map_clusters(
+    db: AsyncSession,
+    *,
+    zoom: int,
+    layers: list[str] | None = None,
+    time_range: str = "7d",
+    bbox: tuple[float, float, float, float] | None = None,
+) -> list[dict]:
+    """줌 레벨 격자 단위 서버측 클러스터 — 셀별 이벤트 수·평균 좌표·최고 severity."""
+    cell = _cluster_cell_degrees(zoom)
+    filters = _event_filters(db, layers=layers, time_range=time_range, bbox=bbox)
+    # 음수 좌표도 같은 방향으로 내림되도록 +90/+180 이동 후 정수 셀 번호
+    lat_cell = _floor_int(db, (IntelEvent.geo_lat + 90.0) / cell)
+    lng_cell = _floor_int(db, (IntelEvent.geo_lng + 180.0) / cell)
+    severity_rank = case(
+        {value: rank for value, rank in SEVERITY_ORDER.items()},
+        value=func.lower(IntelEvent.severity),
+        else_=0,
     )
-    points = []
-    for item in payload["items"]:
-        if item["geo_lat"] is None or item["geo_lng"] is None:
-            continue
-        points.append(
-            {
-                "id": item["id"],
-                "layer": item["layer"],
-                "severity": item["severity"],
-                "confidence": item["confidence"],
-                "lat": item["geo_lat"],
-                "lng": item["geo_lng"],
-                "title": item["title"],
-                "event_time": item["event_time"] or item["detected_at"],
-                "geo_precision": item["geo_precision"],
-            }
+    rows = (
+        await db.execute(
+            select(
+                lat_cell.label("lat_cell"),
+                lng_cell.label("lng_cell"),
+                func.count().label("count"),
+                func.avg(IntelEvent.geo_lat).label("lat"),
+                func.avg(IntelEvent.geo_lng).label("lng"),
+                func.max(severity_rank).label("severity_rank"),
+                func.min(IntelEvent.id).label("sample_id"),
+            )
+            .where(
+                *filters,
+                IntelEvent.geo_lat.is_not(None),
+                IntelEvent.geo_lng.is_not(None),
+            )
+            .group_by(lat_cell, lng_cell)
+            .order_by(func.count().desc())
+            .limit(MAX_MAP_POINTS)
         )
-    return points
+    ).all()
+    severity_by_rank = {rank: value for value, rank in SEVERITY_ORDER.items()}
+    return [
+        {
+            "key": f"{zoom}:{row.lat_cell}:{row.lng_cell}",
+            "lat": float(row.lat),
+            "lng": float(row.lng),
+            "count": int(row.count),
+            "max_severity": severity_by_rank.get(int(row.severity_rank or 0)),
+            "sample_id": row.sample_id,
+        }
+        for row in rows
+    ]
+
+
+def _floor_int(db: AsyncSession, expr):
+    if db.get_bind().dialect.name == "postgresql":
+        return func.floor(expr).cast(Integer)
+    # SQLite CAST는 0 방향 절사 — 호출부에서 양수로 이동시켜 floor와 같게 만든다
+    return cast(expr, Integer)
 
 
 def _bucket_label(dt: datetime, granularity: str) -> str:
@@ -335,6 +460,20 @@ def _bucket_label(dt: datetime, granularity: str) -> str:
     return dt.strftime("%Y-%m-%d")
 
 
+def _bucket_start(db: AsyncSession, granularity: str):
+    """sort time → 버킷 시작 시각 SQL 식 (week는 월요일 00:00)."""
+    unit = granularity if granularity in ("hour", "week") else "day"
+    if db.get_bind().dialect.name == "postgresql":
+        return func.date_trunc(unit, EVENT_SORT_TIME)
+    if unit == "hour":
+        return func.strftime("%Y-%m-%d %H:00:00", EVENT_SORT_TIME)
+    if unit == "week":
+        # %w: 일요일=0 → 월요일까지 되돌아갈 일수 (w+6)%7
+        days_back = (cast(func.strftime("%w", EVENT_SORT_TIME), Integer) + 6) % 7
+        return func.date(EVENT_SORT_TIME, literal("-") + cast(days_back, String) + literal(" days"))
+    return func.date(EVENT_SORT_TIME)
+
+
 async def get_timeline(
     db: AsyncSession,
     *,
@@ -342,19 +481,21 @@ async def get_timeline(
     time_range: str = "30d",
     granularity: str = "day",
 ) -> dict:
-    payload = await list_intel_events(
-        db,
-        layers=layers,
-        time_range=time_range,
-        limit=20000,
-    )
+    filters = _event_filters(db, layers=layers, time_range=time_range)
+    bucket_start = _bucket_start(db, granularity).label("bucket_start")
+    rows = (
+        await db.execute(
+            select(bucket_start, IntelEvent.layer, func.count().label("count"))
+            .where(*filters)
+            .group_by(bucket_start, IntelEvent.layer)
+        )
+    ).all()
+
     buckets: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
-    for row in payload["items"]:
-        when = row["event_time"] or row["detected_at"]
-        dt = datetime.fromisoformat(when)
-        label = _bucket_label(dt, granularity)
-        buckets[label][row["layer"]] += 1
-        buckets[label]["_total"] += 1
+    for row in rows:
+        label = _bucket_label(_as_datetime(row.bucket_start), granularity)
+        buckets[label][row.layer] += row.count
+        buckets[label]["_total"] += row.count
 
     timeline = []
     for bucket in sorted(buckets.keys()):
@@ -1,9 +1,11 @@
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from decimal import Decimal
 import logging
 
-from slugify import slugify
-from sqlalchemy import select, func, desc, cast, String
+from sqlalchemy import bindparam, case, insert, select, func, desc, cast, String, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -13,9 +15,22 @@ from fashion_engine.models.channel import Channel
 from fashion_engine.models.exchange_rate import ExchangeRate
 from fashion_engine.models.price_history import PriceHistory
 from fashion_engine.models.product import Product
+from fashion_engine.models.product_latest_price import ProductLatestPrice
+from fashion_engine.services.brand_cache import (
+    BrandRef,
+    cache_brands,
+    get_cached_brands,
+    vendor_slug,
+)
+from fashion_engine.services.search_service import text_match, text_rank
 
 logger = logging.getLogger(__name__)
 
+# 가격 변동이 없어도 이 주기마다 PriceHistory를 1건 남긴다
+PRICE_HISTORY_HEARTBEAT = timedelta(days=7)
+# 외화 채널: 환율 변동으로 인한 KRW 환산가 흔들림은 변경으로 보지 않는다
+PRICE_CHANGE_FX_TOLERANCE = 0.03
+
 # ── 환율 조회 ────────────────────────────────────────────────────────────
 
 _FALLBACK_RATES: dict[str, float] = {
@@ -73,7 +88,7 @@ async def get_rate_to_krw(db: AsyncSession, currency: str) -> float | None:
 
 async def find_brand_by_vendor(db: AsyncSession, vendor: str) -> Brand | None:
     """Shopify vendor 이름으로 Brand 찾기 (slug 기반)."""
-    slug = slugify(vendor)
+    slug = vendor_slug(vendor)
     return (
         await db.execute(select(Brand).where(Brand.slug == slug))
     ).scalar_one_or_none()
@@ -82,25 +97,24 @@ async def find_brand_by_vendor(db: AsyncSession, vendor: str) -> Brand | None:
 async def find_brands_by_vendors(
     db: AsyncSession,
     vendors: list[str],
-) -> dict[str, Brand | None]:
-    """vendor 목록을 slug로 정규화해 일괄 조회한다."""
-    slug_to_vendor: dict[str, str] = {}
-    for vendor in vendors:
-        if not vendor:
-            continue
-        slug = slugify(vendor)
-        if slug:
-            slug_to_vendor.setdefault(slug, vendor)
-
-    if not slug_to_vendor:
+) -> dict[str, BrandRef | None]:
+    """vendor 목록을 slug로 정규화해 일괄 조회한다 (slug → BrandRef 프로세스 캐시 우선)."""
+    slugs = sorted({vendor_slug(vendor) for vendor in vendors if vendor} - {""})
+    if not slugs:
         return {}
 
-    rows = (
-        await db.execute(select(Brand).where(Brand.slug.in_(list(slug_to_vendor.keys()))))
-    ).scalars().all()
-    brand_by_slug = {brand.slug: brand for brand in rows}
+    ref_by_slug, missing = get_cached_brands(slugs)
+    if missing:
+        rows = (
+            await db.execute(select(Brand.id, Brand.slug).where(Brand.slug.in_(missing)))
+        ).all()
+        fetched: dict[str, BrandRef | None] = {slug: None for slug in missing}
+        fetched.update({row.slug: BrandRef(id=row.id, slug=row.slug) for row in rows})
+        cache_brands(fetched)
+        ref_by_slug.update(fetched)
+
     return {
-        vendor: brand_by_slug.get(slugify(vendor))
+        vendor: ref_by_slug.get(vendor_slug(vendor))
         for vendor in vendors
         if vendor
     }
@@ -121,38 +135,63 @@ async def get_existing_products_by_urls(
     return {row.url: row for row in rows}
 
 
-async def get_prev_prices_by_product_ids(
+@dataclass(frozen=True)
+class LatestPriceState:
+    """제품별 직전 PriceHistory 요약 (변경 감지용)."""
+
+    price: int
+    original_price: int | None
+    is_sale: bool
+    crawled_at: datetime
+    source_price: Decimal | None = None  # 원 통화 가격 (없으면 KRW 환산가로만 비교)
+    source_original_price: Decimal | None = None
+
+
+async def get_latest_price_states_by_product_ids(
     db: AsyncSession,
     product_ids: list[int],
-) -> dict[int, int]:
-    """제품별 최신 KRW 가격을 한 번에 조회한다."""
+) -> dict[int, LatestPriceState]:
+    """제품별 최신 KRW 가격을 product_latest_price에서 한 번에 조회한다."""
     clean_ids = [pid for pid in product_ids if pid]
     if not clean_ids:
         return {}
 
-    latest_ph = (
-        select(
-            PriceHistory.product_id,
-            func.max(PriceHistory.crawled_at).label("latest"),
-        )
-        .where(
-            PriceHistory.currency == "KRW",
-            PriceHistory.product_id.in_(clean_ids),
-        )
-        .group_by(PriceHistory.product_id)
-        .subquery()
-    )
     rows = (
         await db.execute(
-            select(PriceHistory.product_id, PriceHistory.price)
-            .join(
-                latest_ph,
-                (PriceHistory.product_id == latest_ph.c.product_id)
-                & (PriceHistory.crawled_at == latest_ph.c.latest),
+            select(
+                ProductLatestPrice.product_id,
+                ProductLatestPrice.price,
+                ProductLatestPrice.original_price,
+                ProductLatestPrice.is_sale,
+                ProductLatestPrice.crawled_at,
+                ProductLatestPrice.source_price,
+                ProductLatestPrice.source_original_price,
+            ).where(
+                ProductLatestPrice.currency == "KRW",
+                ProductLatestPrice.product_id.in_(clean_ids),
             )
         )
     ).all()
-    return {int(product_id): int(price) for product_id, price in rows}
+    return {
+        int(row.product_id): LatestPriceState(
+            price=int(row.price),
+            original_price=int(row.original_price) if row.original_price is not None else None,
+            is_sale=bool(row.is_sale),
+            crawled_at=row.crawled_at,
+            source_price=row.source_price,
+            source_original_price=row.source_original_price,
+        )
+        for row in rows
+    }
+
+
+async def get_prev_prices_by_product_ids(
+    db: AsyncSession,
+    product_ids: list[int],
+) -> dict[int, int]:
+    """제품별 최신 KRW 가격을 한 번에 조회한다."""
+    states = await get_latest_price_states_by_product_ids(db, product_ids)
+    return {product_id: state.price for product_id, state in states.items()}
 
 
 # ── 제품 upsert ───────────────────────────────────────────────────────────
@@ -202,6 +241,7 @@ def build_product_upsert_row(
                 "is_active": info.is_available,
                 "is_sale": is_sale,
                 "archived_at": archived_at,
+                "last_seen_at": row_now,
                 "updated_at": row_now,
             },
             False,
@@ -227,6 +267,7 @@ def build_product_upsert_row(
             "is_active": info.is_available,
             "is_sale": is_sale,
             "archived_at": None if info.is_available else row_now,
+            "last_seen_at": row_now,
             "created_at": row_now,
             "updated_at": row_now,
         },
@@ -236,6 +277,38 @@ def build_product_upsert_row(
     )
 
 
+# 크롤마다 바뀌는 타임스탬프 — 내용 비교에서 제외
+_PRODUCT_TOUCH_COLUMNS = frozenset({"last_seen_at", "updated_at", "created_at"})
+_TOUCH_CHUNK_SIZE = 1000
+
+
+def product_row_unchanged(existing: Product | None, row: dict) -> bool:
+    """기존 Product와 upsert row의 내용이 같은지 (last_seen_at·updated_at 제외)."""
+    if existing is None:
+        return False
+    return all(
+        getattr(existing, key) == value
+        for key, value in row.items()
+        if key not in _PRODUCT_TOUCH_COLUMNS
+    )
+
+
+async def touch_products_last_seen(
+    db: AsyncSession,
+    product_ids: list[int],
+    seen_at: datetime,
+) -> None:
+    """내용이 그대로인 제품은 전체 upsert 대신 last_seen_at만 집합 UPDATE로 갱신한다."""
+    for idx in range(0, len(product_ids), _TOUCH_CHUNK_SIZE):
+        await db.execute(
+            update(Product)
+            .where(Product.id.in_(product_ids[idx:idx + _TOUCH_CHUNK_SIZE]))
+            # updated_at은 onupdate로 바뀌지 않게 현재 값 유지 — 내용 변경 시각으로 남긴다
+            .values(last_seen_at=seen_at, updated_at=Product.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+
+
 def build_price_history_row(
     product_id: int,
     info: ProductInfo,
@@ -280,6 +353,144 @@ def build_price_history_row(
         "crawled_at": crawled_at or datetime.utcnow(),
     }
 
+
+def _source_amount(value: float | Decimal | None) -> Decimal | None:
+    # product_latest_price.source_* (Numeric(12, 2))와 같은 자릿수로 맞춰 비교
+    if value is None:
+        return None
+    return Decimal(str(value)).quantize(Decimal("0.01"))
+
+
+def latest_price_row(price_row: dict, info: ProductInfo) -> dict:
+    """product_latest_price upsert용 row — PriceHistory row + 원 통화 가격."""
+    return {
+        **price_row,
+        "source_price": _source_amount(info.price),
+        "source_original_price": _source_amount(info.compare_at_price),
+        "source_currency": info.currency,
+    }
+
+
+def price_row_changed(
+    price_row: dict,
+    latest: LatestPriceState | None,
+    info: ProductInfo,
+    availability_changed: bool = False,
+) -> bool:
+    """
+    직전 PriceHistory 대비 기록할 가치가 있는지 판단한다.
+    - 세일 여부·정가 유무·재고 전환은 항상 기록
+    - KRW 채널은 가격이 1원이라도 바뀌면 기록
+    - 외화 채널은 원 통화 가격이 바뀌면 기록하고, 원 통화 가격이 같을 때(환율 변동만)는
+      KRW 환산가가 PRICE_CHANGE_FX_TOLERANCE 초과로 움직인 경우에만 기록
+      (원 통화 가격이 없는 과거 행은 환산가 허용오차로만 비교)
+    - 변경이 없어도 PRICE_HISTORY_HEARTBEAT가 지나면 1건 기록 (기간 필터 조회가 비지 않도록)
+    """
+    if latest is None or availability_changed:
+        return True
+    if bool(price_row["is_sale"]) != latest.is_sale:
+        return True
+    original = price_row["original_price"]
+    if (original is None) != (latest.original_price is None):
+        return True
+    crawled_at = price_row["crawled_at"]
+    if crawled_at - latest.crawled_at >= PRICE_HISTORY_HEARTBEAT:
+        return True
+
+    if info.currency == "KRW":
+        tolerance = 0.0
+    else:
+        if latest.source_price is not None and (
+            _source_amount(info.price) != latest.source_price
+            or _source_amount(info.compare_at_price) != latest.source_original_price
+        ):
+            return True
+        tolerance = PRICE_CHANGE_FX_TOLERANCE
+    pairs = [(int(price_row["price"]), latest.price)]
+    if original is not None and latest.original_price is not None:
+        pairs.append((int(original), latest.original_price))
+    for current, previous in pairs:
+        if previous <= 0:
+            return True
+        if abs(current - previous) / previous > tolerance:
+            return True
+    return False
+
+
+_LATEST_PRICE_CHUNK_SIZE = 1000
+_PRICE_HISTORY_COLUMNS = (
+    "product_id",
+    "price",
+    "original_price",
+    "currency",
+    "is_sale",
+    "discount_rate",
+    "crawled_at",
+)
+
+
+async def bulk_insert_price_history(db: AsyncSession, rows: list[dict]) -> None:
+    """
+    PriceHistory 대량 적재.
+    PostgreSQL(asyncpg)은 부모 price_history로 COPY 스트리밍하고,
+    그 외(SQLite 등)는 executemany INSERT로 처리한다.
+    """
+    if not rows:
+        return
+    bind = db.get_bind()
+    if bind.dialect.name != "postgresql" or bind.dialect.driver != "asyncpg":
+        await db.execute(insert(PriceHistory), rows)
+        return
+
+    # 부모 테이블로 COPY해 PostgreSQL이 crawled_at 월 파티션으로 라우팅하게 한다.
+    # 파티션은 부모의 identity(id)를 상속하지 않으므로 파티션에 직접 COPY하면 id가 NULL이 된다.
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        "price_history",
+        records=[tuple(row[col] for col in _PRICE_HISTORY_COLUMNS) for row in rows],
+        columns=list(_PRICE_HISTORY_COLUMNS),
+    )
+
+
+async def upsert_latest_prices(db: AsyncSession, price_rows: list[dict]) -> None:
+    """PriceHistory에 기록한 행(latest_price_row)으로 product_latest_price를 갱신한다 (호출 측 트랜잭션 안에서)."""
+    if not price_rows:
+        return
+    # 같은 배치에 product_id가 중복되면 마지막 행 기준
+    latest_by_product = {row["product_id"]: row for row in price_rows}
+    rows = list(latest_by_product.values())
+    insert_fn = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    for idx in range(0, len(rows), _LATEST_PRICE_CHUNK_SIZE):
+        stmt = insert_fn(ProductLatestPrice).values(rows[idx:idx + _LATEST_PRICE_CHUNK_SIZE])
+        excluded = stmt.excluded
+        price_changed = excluded.price != ProductLatestPrice.price
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[ProductLatestPrice.product_id],
+                set_={
+                    "previous_price": case(
+                        (price_changed, ProductLatestPrice.price),
+                        else_=ProductLatestPrice.previous_price,
+                    ),
+                    "price_changed_at": case(
+                        (price_changed, excluded.crawled_at),
+                        else_=ProductLatestPrice.price_changed_at,
+                    ),
+                    "price": excluded.price,
+                    "original_price": excluded.original_price,
+                    "currency": excluded.currency,
+                    "is_sale": excluded.is_sale,
+                    "discount_rate": excluded.discount_rate,
+                    "crawled_at": excluded.crawled_at,
+                    "source_price": excluded.source_price,
+                    "source_original_price": excluded.source_original_price,
+                    "source_currency": excluded.source_currency,
+                },
+            )
+        )
+
+
 async def upsert_product(
     db: AsyncSession,
     channel_id: int,
@@ -317,6 +528,68 @@ async def upsert_product(
     return product, is_new, sale_just_started, availability_transition
 
 
+async def refresh_latest_prices(
+    db: AsyncSession,
+    product_ids: list[int] | None = None,
+) -> None:
+    """price_history에서 product_latest_price를 다시 계산한다 (가격 이력 정리 후 등).
+    product_ids가 None이면 전체 재계산."""
+    params: dict = {}
+    scope = ""
+    if product_ids is not None:
+        if not product_ids:
+            return
+        scope = "WHERE product_id IN :pids"
+        params["pids"] = list(product_ids)
+
+    delete_sql = text(f"DELETE FROM product_latest_price {scope}")
+    # previous_price/price_changed_at: 가격이 바뀐 마지막 행(직전 행과 price가 다른 행) 기준
+    insert_sql = text(
+        f"""
+        WITH ordered AS (
+            SELECT
+                ph.id, ph.product_id, ph.price, ph.original_price, ph.currency,
+                ph.is_sale, ph.discount_rate, ph.crawled_at,
+                LAG(ph.price) OVER (
+                    PARTITION BY ph.product_id
+                    ORDER BY ph.crawled_at, ph.id
+                ) AS prev_price,
+                ROW_NUMBER() OVER (
+                    PARTITION BY ph.product_id
+                    ORDER BY ph.crawled_at DESC, ph.id DESC
+                ) AS rn
+            FROM price_history ph
+            {scope.replace("product_id", "ph.product_id")}
+        ),
+        changes AS (
+            SELECT
+                product_id, prev_price, crawled_at,
+                ROW_NUMBER() OVER (
+                    PARTITION BY product_id
+                    ORDER BY crawled_at DESC, id DESC
+                ) AS crn
+            FROM ordered
+            WHERE prev_price IS NOT NULL AND prev_price <> price
+        )
+        INSERT INTO product_latest_price (
+            product_id, price, original_price, currency, is_sale, discount_rate, crawled_at,
+            previous_price, price_changed_at
+        )
+        SELECT
+            o.product_id, o.price, o.original_price, COALESCE(o.currency, 'KRW'),
+            o.is_sale, o.discount_rate, o.crawled_at, c.prev_price, c.crawled_at
+        FROM ordered o
+        LEFT JOIN changes c ON c.product_id = o.product_id AND c.crn = 1
+        WHERE o.rn = 1
+        """
+    )
+    if product_ids is not None:
+        delete_sql = delete_sql.bindparams(bindparam("pids", expanding=True))
+        insert_sql = insert_sql.bindparams(bindparam("pids", expanding=True))
+    await db.execute(delete_sql, params)
+    await db.execute(insert_sql, params)
+
+
 async def record_price(
     db: AsyncSession,
     product_id: int,
@@ -333,9 +606,55 @@ async def record_price(
 
     ph = PriceHistory(**row)
     db.add(ph)
+    await upsert_latest_prices(db, [latest_price_row(row, info)])
     return ph
 
 
+async def archive_unseen_channel_products(
+    db: AsyncSession,
+    channel_id: int,
+    seen_since: datetime,
+    max_unseen_ratio: float = 0.5,
+) -> int:
+    """
+    채널 크롤 종료 후 정리 단계 — 이번 크롤에서 확인되지 않은(last_seen_at < seen_since)
+    활성 제품을 품절/삭제로 보고 아카이브한다.
+    미확인 비율이 max_unseen_ratio를 넘으면 부분 수집으로 의심해 건너뛴다.
+    반환: 아카이브한 제품 수
+    """
+    active_total, unseen = (
+        await db.execute(
+            select(
+                func.count(Product.id),
+                func.count(Product.id).filter(Product.last_seen_at < seen_since),
+            ).where(Product.channel_id == channel_id, Product.is_active == True)
+        )
+    ).one()
+    if not unseen:
+        return 0
+    if active_total and unseen / active_total > max_unseen_ratio:
+        logger.warning(
+            "미확인 제품 비율 과다 → 아카이브 스킵 (channel_id=%d, %d/%d)",
+            channel_id,
+            unseen,
+            active_total,
+        )
+        return 0
+
+    now = datetime.utcnow()
+    await db.execute(
+        update(Product)
+        .where(
+            Product.channel_id == channel_id,
+            Product.is_active == True,
+            Product.last_seen_at < seen_since,
+        )
+        .values(is_active=False, archived_at=now, updated_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    return int(unseen)
+
+
 # ── 조회 함수 ─────────────────────────────────────────────────────────────
 
 async def get_sale_products(
@@ -350,31 +669,12 @@ async def get_sale_products(
     offset: int = 0,
 ) -> list[Product]:
     """세일 중인 제품 목록 (최신 가격 기준 할인율 내림차순)."""
-    # 최신 PriceHistory subquery
-    latest_ph = (
-        select(
-            PriceHistory.product_id,
-            func.max(PriceHistory.crawled_at).label("latest"),
-        )
-        .group_by(PriceHistory.product_id)
-        .subquery()
-    )
-    latest_price = (
-        select(PriceHistory)
-        .join(
-            latest_ph,
-            (PriceHistory.product_id == latest_ph.c.product_id)
-            & (PriceHistory.crawled_at == latest_ph.c.latest),
-        )
-        .subquery()
-    )
-
     query = (
         select(Product)
-        .join(latest_price, Product.id == latest_price.c.product_id)
+        .join(ProductLatestPrice, Product.id == ProductLatestPrice.product_id)
         .options(selectinload(Product.channel), selectinload(Product.brand))
         .where(Product.is_sale == True, Product.is_active == True)
-        .order_by(desc(latest_price.c.discount_rate))
+        .order_by(desc(ProductLatestPrice.discount_rate))
         .limit(limit)
         .offset(offset)
     )
@@ -392,9 +692,9 @@ async def get_sale_products(
     if category:
         query = query.where(Product.subcategory == category)
     if min_price is not None:
-        query = query.where(latest_price.c.price >= min_price)
+        query = query.where(ProductLatestPrice.price >= min_price)
     if max_price is not None:
-        query = query.where(latest_price.c.price <= max_price)
+        query = query.where(ProductLatestPrice.price <= max_price)
 
     return list((await db.execute(query)).scalars().all())
 
@@ -402,13 +702,12 @@ async def get_sale_products(
 async def search_products(
     db: AsyncSession, q: str, limit: int = 30
 ) -> list[Product]:
-    """제품명 검색."""
-    pct = f"%{q}%"
+    """제품명 검색 (관련도 순)."""
     result = await db.execute(
         select(Product)
         .options(selectinload(Product.channel), selectinload(Product.brand))
-        .where(Product.name.ilike(pct), Product.is_active == True)
-        .order_by(Product.name)
+        .where(text_match(db, [Product.name], q), Product.is_active == True)
+        .order_by(*text_rank(db, Product.name, q), Product.name)
         .limit(limit)
     )
     return list(result.scalars().all())
@@ -424,24 +723,11 @@ async def get_sale_highlights(
     offset: int = 0,
 ) -> list[dict]:
     """세일 제품 하이라이트 (product_key 기준 최저가 1건 + 채널 수)."""
-    latest_sub = (
-        select(
-            PriceHistory.product_id,
-            func.max(PriceHistory.crawled_at).label("latest"),
-        )
-        .group_by(PriceHistory.product_id)
-        .subquery()
-    )
 
     dedup_key = func.coalesce(Product.product_key, cast(Product.id, String))
     ranked = (
-        select(Product, PriceHistory, Channel)
-        .join(latest_sub, Product.id == latest_sub.c.product_id)
-        .join(
-            PriceHistory,
-            (PriceHistory.product_id == Product.id)
-            & (PriceHistory.crawled_at == latest_sub.c.latest),
-        )
+        select(Product, ProductLatestPrice, Channel)
+        .join(ProductLatestPrice, ProductLatestPrice.product_id == Product.id)
         .join(Channel, Product.channel_id == Channel.id)
         .where(Product.is_sale == True, Product.is_active == True)
         .with_only_columns(
@@ -454,14 +740,14 @@ async def get_sale_highlights(
             Product.is_active.label("is_active"),
             Channel.name.label("channel_name"),
             Channel.country.label("channel_country"),
-            PriceHistory.price.label("price_krw"),
-            PriceHistory.original_price.label("original_price_krw"),
-            PriceHistory.discount_rate.label("discount_rate"),
+            ProductLatestPrice.price.label("price_krw"),
+            ProductLatestPrice.original_price.label("original_price_krw"),
+            ProductLatestPrice.discount_rate.label("discount_rate"),
             func.count(Product.id).over(partition_by=dedup_key).label("total_channels"),
             func.row_number()
             .over(
                 partition_by=dedup_key,
-                order_by=(PriceHistory.price.asc(), Product.id.asc()),
+                order_by=(ProductLatestPrice.price.asc(), Product.id.asc()),
             )
             .label("price_rank"),
         )
@@ -471,9 +757,9 @@ async def get_sale_highlights(
     if category:
         ranked = ranked.where(Product.subcategory == category)
     if min_price is not None:
-        ranked = ranked.where(PriceHistory.price >= min_price)
+        ranked = ranked.where(ProductLatestPrice.price >= min_price)
     if max_price is not None:
-        ranked = ranked.where(PriceHistory.price <= max_price)
+        ranked = ranked.where(ProductLatestPrice.price <= max_price)
 
     ranked_sub = ranked.subquery()
     rows = (
@@ -523,22 +809,9 @@ async def get_sale_products_count_filtered(
     min_price: int | None = None,
     max_price: int | None = None,
 ) -> int:
-    latest_sub = (
-        select(
-            PriceHistory.product_id,
-            func.max(PriceHistory.crawled_at).label("latest"),
-        )
-        .group_by(PriceHistory.product_id)
-        .subquery()
-    )
     query = (
         select(func.count(Product.id))
-        .join(latest_sub, Product.id == latest_sub.c.product_id)
-        .join(
-            PriceHistory,
-            (PriceHistory.product_id == Product.id)
-            & (PriceHistory.crawled_at == latest_sub.c.latest),
-        )
+        .join(ProductLatestPrice, ProductLatestPrice.product_id == Product.id)
         .where(Product.is_sale == True, Product.is_active == True)
     )
     if gender:
@@ -546,94 +819,14 @@ async def get_sale_products_count_filtered(
     if category:
         query = query.where(Product.subcategory == category)
     if min_price is not None:
-        query = query.where(PriceHistory.price >= min_price)
+        query = query.where(ProductLatestPrice.price >= min_price)
     if max_price is not None:
-        query = query.where(PriceHistory.price <= max_price)
+        query = query.where(ProductLatestPrice.price <= max_price)
 
     result = await db.execute(query)
     return int(result.scalar_one() or 0)
 
 
-async def get_related_searches(
-    db: AsyncSession, q: str, limit: int = 8
-) -> list[str]:
-    """
-    검색어 기준 연관검색어 생성.
-    - 매칭 제품의 브랜드명 상위
-    - 매칭 제품명에서 자주 등장한 키워드
-    """
-    query = q.strip().lower()
-    if not query:
-        return []
-
-    rows = (
-        await db.execute(
-            select(Product.name, Brand.name)
-            .join(Brand, Product.brand_id == Brand.id, isouter=True)
-            .where(Product.name.ilike(f"%{query}%"), Product.is_active == True)
-            .limit(300)
-        )
-    ).all()
-
-    if not rows:
-        brand_rows = (
-            await db.execute(
-                select(Brand.name)
-                .where((Brand.name.ilike(f"%{query}%")) | (Brand.slug.ilike(f"%{query}%")))
-                .limit(limit)
-            )
-        ).all()
-        return [name for (name,) in brand_rows if name][:limit]
-
-    suggestions: list[str] = []
-    seen: set[str] = set()
-
-    # 1) 브랜드명 기반
-    brand_freq: dict[str, int] = {}
-    for _, brand_name in rows:
-        if not brand_name:
-            continue
-        key = brand_name.strip()
-        if not key:
-            continue
-        brand_freq[key] = brand_freq.get(key, 0) + 1
-
-    for brand_name, _ in sorted(brand_freq.items(), key=lambda x: x[1], reverse=True):
-        if brand_name.lower() == query:
-            continue
-        if brand_name.lower() in seen:
-            continue
-        suggestions.append(brand_name)
-        seen.add(brand_name.lower())
-        if len(suggestions) >= limit:
-            return suggestions
-
-    # 2) 제품명 키워드 기반
-    token_freq: dict[str, int] = {}
-    for product_name, _ in rows:
-        for token in product_name.replace("/", " ").replace("-", " ").split():
-            cleaned = token.strip("()[]{}.,:;!?'\"").lower()
-            if len(cleaned) < 2:
-                continue
-            if cleaned == query:
-                continue
-            if query in cleaned:
-                continue
-            token_freq[cleaned] = token_freq.get(cleaned, 0) + 1
-
-    for token, _ in sorted(token_freq.items(), key=lambda x: x[1], reverse=True):
-        keyword = f"{q} {token}"
-        key = keyword.lower()
-        if key in seen:
-            continue
-        suggestions.append(keyword)
-        seen.add(key)
-        if len(suggestions) >= limit:
-            break
-
-    return suggestions[:limit]
-
-
 async def get_price_comparison(
     db: AsyncSession, product_key: str
 ) -> dict | None:
@@ -641,32 +834,15 @@ async def get_price_comparison(
     동일 product_key를 가진 모든 채널 제품의 최신 가격 비교.
     KRW 기준 오름차순 정렬.
     """
-    # 각 product별 최신 PriceHistory
-    latest_sub = (
-        select(
-            PriceHistory.product_id,
-            func.max(PriceHistory.crawled_at).label("latest"),
-        )
-        .group_by(PriceHistory.product_id)
-        .subquery()
-    )
 
     rows = (
         await db.execute(
-            select(Product, PriceHistory, Channel, Brand)
-            .join(
-                latest_sub,
-                (Product.id == latest_sub.c.product_id),
-            )
-            .join(
-                PriceHistory,
-                (PriceHistory.product_id == Product.id)
-                & (PriceHistory.crawled_at == latest_sub.c.latest),
-            )
+            select(Product, ProductLatestPrice, Channel, Brand)
+            .join(ProductLatestPrice, ProductLatestPrice.product_id == Product.id)
             .join(Channel, Product.channel_id == Channel.id)
             .join(Brand, Product.brand_id == Brand.id, isouter=True)
             .where(Product.product_key == product_key, Product.is_active == True)
-            .order_by(PriceHistory.price)
+            .order_by(ProductLatestPrice.price)
         )
     ).all()
 
@@ -758,24 +934,10 @@ async def get_price_badge(
     days: int = 90,
 ) -> dict | None:
     """현재 최저가와 기간 내 historical low/high를 계산한다."""
-    latest_sub = (
-        select(
-            PriceHistory.product_id,
-            func.max(PriceHistory.crawled_at).label("latest"),
-        )
-        .group_by(PriceHistory.product_id)
-        .subquery()
-    )
-
     current_min = (
         await db.execute(
-            select(func.min(PriceHistory.price))
-            .join(latest_sub, latest_sub.c.product_id == PriceHistory.product_id)
-            .join(
-                Product,
-                (Product.id == PriceHistory.product_id)
-                & (PriceHistory.crawled_at == latest_sub.c.latest),
-            )
+            select(func.min(ProductLatestPrice.price))
+            .join(Product, Product.id == ProductLatestPrice.product_id)
             .where(Product.product_key == product_key, Product.is_active == True)
         )
     ).scalar_one_or_none()
@@ -865,14 +1027,6 @@ async def get_product_ranking(
     ranking_type: str,
     limit: int = 100,
 ) -> list[dict]:
-    latest_sub = (
-        select(
-            PriceHistory.product_id,
-            func.max(PriceHistory.crawled_at).label("latest"),
-        )
-        .group_by(PriceHistory.product_id)
-        .subquery()
-    )
     channel_count_sub = (
         select(
             Product.product_key.label("product_key"),
@@ -894,23 +1048,18 @@ async def get_product_ranking(
                 Channel.name.label("channel_name"),
                 Channel.country.label("channel_country"),
                 Product.url.label("product_url"),
-                PriceHistory.price.label("price_krw"),
-                PriceHistory.original_price.label("original_price_krw"),
-                PriceHistory.discount_rate.label("discount_rate"),
+                ProductLatestPrice.price.label("price_krw"),
+                ProductLatestPrice.original_price.label("original_price_krw"),
+                ProductLatestPrice.discount_rate.label("discount_rate"),
                 func.coalesce(channel_count_sub.c.total_channels, 1).label("total_channels"),
                 func.row_number()
                 .over(
                     partition_by=dedup_key,
-                    order_by=(PriceHistory.price.asc(), Product.id.asc()),
+                    order_by=(ProductLatestPrice.price.asc(), Product.id.asc()),
                 )
                 .label("product_rank"),
             )
-            .join(latest_sub, Product.id == latest_sub.c.product_id)
-            .join(
-                PriceHistory,
-                (PriceHistory.product_id == Product.id)
-                & (PriceHistory.crawled_at == latest_sub.c.latest),
-            )
+            .join(ProductLatestPrice, ProductLatestPrice.product_id == Product.id)
             .join(Channel, Channel.id == Product.channel_id)
             .join(Brand, Brand.id == Product.brand_id, isouter=True)
             .join(channel_count_sub, channel_count_sub.c.product_key == Product.product_key, isouter=True)
@@ -949,72 +1098,41 @@ async def get_product_ranking(
         ]
 
     if ranking_type == "price_drop":
+        # 가격 이력은 변경 시에만 기록되므로 직전 가격은 product_latest_price.previous_price에서 읽는다
         threshold = datetime.utcnow() - timedelta(days=7)
-        recent_sub = (
+        drop_krw = ProductLatestPrice.previous_price - ProductLatestPrice.price
+        drop_expr = drop_krw * 100.0 / ProductLatestPrice.previous_price
+        ranked = (
             select(
-                Product.id.label("product_id"),
                 Product.product_key.label("product_key"),
                 Product.name.label("product_name"),
-                Product.url.label("product_url"),
+                Brand.name.label("brand_name"),
                 Product.image_url.label("image_url"),
                 Channel.name.label("channel_name"),
                 Channel.country.label("channel_country"),
-                Brand.name.label("brand_name"),
-                PriceHistory.price.label("price_krw"),
-                PriceHistory.original_price.label("original_price_krw"),
-                PriceHistory.discount_rate.label("discount_rate"),
+                Product.url.label("product_url"),
+                ProductLatestPrice.price.label("price_krw"),
+                ProductLatestPrice.original_price.label("original_price_krw"),
+                ProductLatestPrice.discount_rate.label("discount_rate"),
+                func.coalesce(channel_count_sub.c.total_channels, 1).label("total_channels"),
+                drop_expr.label("price_drop_pct"),
+                drop_krw.label("price_drop_krw"),
                 func.row_number()
                 .over(
-                    partition_by=Product.id,
-                    order_by=PriceHistory.crawled_at.desc(),
+                    partition_by=Product.product_key,
+                    order_by=(drop_expr.desc(), ProductLatestPrice.price.asc()),
                 )
-                .label("rn"),
+                .label("product_rank"),
             )
-            .join(Product, Product.id == PriceHistory.product_id)
+            .join(ProductLatestPrice, ProductLatestPrice.product_id == Product.id)
             .join(Channel, Channel.id == Product.channel_id)
             .join(Brand, Brand.id == Product.brand_id, isouter=True)
+            .join(channel_count_sub, channel_count_sub.c.product_key == Product.product_key, isouter=True)
             .where(
                 Product.is_active == True,
                 Product.product_key.isnot(None),
-                PriceHistory.crawled_at >= threshold,
-            )
-            .subquery()
-        )
-        latest = recent_sub.alias("latest")
-        prev = recent_sub.alias("prev")
-        drop_expr = ((prev.c.price_krw - latest.c.price_krw) * 100.0 / prev.c.price_krw)
-        ranked = (
-            select(
-                latest.c.product_key,
-                latest.c.product_name,
-                latest.c.brand_name,
-                latest.c.image_url,
-                latest.c.channel_name,
-                latest.c.channel_country,
-                latest.c.product_url,
-                latest.c.price_krw,
-                latest.c.original_price_krw,
-                latest.c.discount_rate,
-                func.coalesce(channel_count_sub.c.total_channels, 1).label("total_channels"),
-                drop_expr.label("price_drop_pct"),
-                (prev.c.price_krw - latest.c.price_krw).label("price_drop_krw"),
-                func.row_number()
-                .over(
-                    partition_by=latest.c.product_key,
-                    order_by=(drop_expr.desc(), latest.c.price_krw.asc()),
-                )
-                .label("product_rank"),
-            )
-            .join(
-                prev,
-                (prev.c.product_id == latest.c.product_id) & (prev.c.rn == 2),
-            )
-            .join(channel_count_sub, channel_count_sub.c.product_key == latest.c.product_key, isouter=True)
-            .where(
-                latest.c.rn == 1,
-                prev.c.price_krw.isnot(None),
-                latest.c.price_krw.isnot(None),
-                prev.c.price_krw > latest.c.price_krw,
+                ProductLatestPrice.price_changed_at >= threshold,
+                ProductLatestPrice.previous_price > ProductLatestPrice.price,
             )
             .subquery()
         )
@@ -1055,14 +1173,6 @@ async def get_brand_sale_ranking(
     db: AsyncSession,
     limit: int = 50,
 ) -> list[dict]:
-    latest_sub = (
-        select(
-            PriceHistory.product_id,
-            func.max(PriceHistory.crawled_at).label("latest"),
-        )
-        .group_by(PriceHistory.product_id)
-        .subquery()
-    )
     rows = (
         await db.execute(
             select(
@@ -1072,22 +1182,17 @@ async def get_brand_sale_ranking(
                 Brand.tier.label("tier"),
                 Brand.origin_country.label("origin_country"),
                 func.count(Product.id).label("sale_product_count"),
-                func.avg(PriceHistory.discount_rate).label("avg_discount_rate"),
-                func.max(PriceHistory.discount_rate).label("max_discount_rate"),
+                func.avg(ProductLatestPrice.discount_rate).label("avg_discount_rate"),
+                func.max(ProductLatestPrice.discount_rate).label("max_discount_rate"),
                 func.count(func.distinct(Product.channel_id)).label("active_channel_count"),
             )
             .join(Product, Product.brand_id == Brand.id)
-            .join(latest_sub, latest_sub.c.product_id == Product.id)
-            .join(
-                PriceHistory,
-                (PriceHistory.product_id == Product.id)
-                & (PriceHistory.crawled_at == latest_sub.c.latest),
-            )
+            .join(ProductLatestPrice, ProductLatestPrice.product_id == Product.id)
             .where(Product.is_sale == True, Product.is_active == True)
             .group_by(Brand.id, Brand.name, Brand.slug, Brand.tier, Brand.origin_country)
             .order_by(
                 desc(func.count(Product.id)),
-                desc(func.avg(PriceHistory.discount_rate)),
+                desc(func.avg(ProductLatestPrice.discount_rate)),
                 Brand.name.asc(),
             )
             .limit(limit)
@@ -1157,23 +1262,10 @@ async def get_multi_channel_products(
     sort: str = "spread",
 ) -> list[dict]:
     """멀티채널에서 판매되는 product_key 집계 목록."""
-    latest_sub = (
-        select(
-            PriceHistory.product_id,
-            func.max(PriceHistory.crawled_at).label("latest"),
-        )
-        .group_by(PriceHistory.product_id)
-        .subquery()
-    )
     latest_price = (
         select(
-            PriceHistory.product_id.label("product_id"),
-            PriceHistory.price.label("price_krw"),
-        )
-        .join(
-            latest_sub,
-            (PriceHistory.product_id == latest_sub.c.product_id)
-            & (PriceHistory.crawled_at == latest_sub.c.latest),
+            ProductLatestPrice.product_id.label("product_id"),
+            ProductLatestPrice.price.label("price_krw"),
         )
         .subquery()
     )
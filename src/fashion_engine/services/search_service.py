@@ -0,0 +1,117 @@
+"""
+제품·카탈로그·브랜드·인텔 공용 텍스트 검색.
+
+기존 `ILIKE '%q%'` 의미(부분 문자열, 대소문자 무시)를 유지하면서 인덱스를 타게 한다.
+- PostgreSQL: pg_trgm GIN 인덱스(alembic 7182930415b6)가 `ILIKE '%q%'`를 인덱스 스캔으로 처리.
+  정렬은 similarity() 사용.
+- SQLite(로컬): FTS5 trigram 가상 테이블(init_db에서 생성, 트리거로 원본 테이블과 동기화)로
+  후보 rowid를 찾는다. trigram 토크나이저는 3글자 미만 검색어를 매칭하지 못하므로 LIKE로 처리.
+
+정렬 공통 규칙: 완전일치 > 접두일치 > 부분일치, 다음은 유사도(PG) 또는 짧은 이름 순.
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from sqlalchemy import case, column, func, literal, literal_column, or_, select, table
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.elements import ColumnElement
+
+_TRIGRAM_MIN_CHARS = 3
+
+# 원본 테이블 → FTS5 색인 컬럼 (PG trigram 인덱스 대상과 동일)
+FTS_COLUMNS: dict[str, tuple[str, ...]] = {
+    "products": ("name",),
+    "product_catalog": ("canonical_name",),
+    "brands": ("name", "name_ko", "slug"),
+    "intel_events": ("title", "summary"),
+}
+
+
+def _fts_table(source: str) -> str:
+    return f"{source}_fts"
+
+
+def _fts_phrase(q: str) -> str:
+    # 문구(phrase) 하나로 묶어 FTS5 연산자·특수문자를 리터럴로 취급
+    return '"' + q.replace('"', '""') + '"'
+
+
+def text_match(
+    db: AsyncSession,
+    columns: Sequence[InstrumentedAttribute],
+    q: str,
+) -> ColumnElement[bool]:
+    """columns 중 하나라도 q를 부분 문자열로 포함하는 행 (대소문자 무시)."""
+    q = q.strip()
+    source = columns[0].class_.__tablename__
+    names = [col.key for col in columns]
+    if (
+        db.get_bind().dialect.name == "sqlite"
+        and len(q) >= _TRIGRAM_MIN_CHARS
+        and set(names) <= set(FTS_COLUMNS.get(source, ()))
+    ):
+        fts_name = _fts_table(source)
+        fts = table(fts_name, column("rowid"))
+        match = literal("{" + " ".join(names) + "}: " + _fts_phrase(q))
+        pk = columns[0].class_.id
+        return pk.in_(
+            select(fts.c.rowid).where(literal_column(fts_name).op("MATCH")(match))
+        )
+    pattern = f"%{q}%"
+    return or_(*(col.ilike(pattern) for col in columns))
+
+
+def text_rank(
+    db: AsyncSession,
+    col: InstrumentedAttribute,
+    q: str,
+) -> list[ColumnElement]:
+    """관련도 정렬식 목록 — order_by(*text_rank(...), 기존 정렬)로 사용."""
+    lowered = q.strip().lower()
+    tier = case(
+        (func.lower(col) == lowered, 0),
+        (func.lower(col).like(f"{lowered}%"), 1),
+        else_=2,
+    )
+    if db.get_bind().dialect.name == "postgresql":
+        return [tier, func.similarity(col, q).desc()]
+    return [tier, func.length(col)]
+
+
+def create_sqlite_fts(conn: Connection) -> None:
+    """FTS5 trigram 테이블·동기화 트리거 생성. 새로 만든 테이블은 기존 행으로 채운다."""
+    existing = {
+        row[0]
+        for row in conn.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type = 'table'"
+        )
+    }
+    for source, cols in FTS_COLUMNS.items():
+        if source not in existing:
+            continue
+        fts = _fts_table(source)
+        col_list = ", ".join(cols)
+        new_values = ", ".join(f"new.{c}" for c in cols)
+        old_values = ", ".join(f"old.{c}" for c in cols)
+        conn.exec_driver_sql(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+            f"{col_list}, content='{source}', content_rowid='id', tokenize='trigram')"
+        )
+        conn.exec_driver_sql(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {source} BEGIN "
+            f"INSERT INTO {fts}(rowid, {col_list}) VALUES (new.id, {new_values}); END"
+        )
+        conn.exec_driver_sql(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {source} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {col_list}) VALUES ('delete', old.id, {old_values}); END"
+        )
+        conn.exec_driver_sql(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {col_list} ON {source} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {col_list}) VALUES ('delete', old.id, {old_values}); "
+            f"INSERT INTO {fts}(rowid, {col_list}) VALUES (new.id, {new_values}); END"
+        )
+        if fts not in existing:
+            conn.exec_driver_sql(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
@@ -0,0 +1,197 @@
+"""
+연관검색어 사전 집계 인덱스 (search_suggestions).
+
+빌드: 활성 제품명 토큰 → 함께 등장한 브랜드·토큰별 제품 수를 세어 term별 상위 _TOP_PER_KIND개만 저장.
+- term은 길이 _PREFIX_KEY_MAX 초과 토큰 전체 + 모든 토큰의 1~_PREFIX_KEY_MAX글자 접두어.
+  짧은 입력(키 입력 초반)은 접두어 행 단건 조회, 긴 입력은 PK 범위 조회로 끝난다.
+- 크롤 후처리(crawl_products.run_post_commit_pipeline) 또는 scripts/build_search_suggestions.py로 전체 재빌드.
+  테이블이 비어 있으면(마이그레이션 직후) API 시작 시 한 번 채운다 (ensure_search_suggestions).
+
+조회: 한 단어 검색어는 인덱스를 접두어로 조회한다. 인덱스는 단어 하나 기준 집계라
+여러 단어("nike air")는 전체 문구가 들어간 제품명에서 직접 집계한다 (trigram/FTS 인덱스 사용).
+둘 다 결과가 없으면 브랜드명 검색으로 대체.
+"""
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+
+from sqlalchemy import and_, case, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fashion_engine.models.brand import Brand
+from fashion_engine.models.product import Product
+from fashion_engine.models.search_suggestion import SearchSuggestion
+from fashion_engine.services.search_service import text_match, text_rank
+
+_PREFIX_KEY_MAX = 3
+_MAX_TERM_LEN = 64
+_TOP_PER_KIND = 15
+_INSERT_BATCH = 5000
+_TOKEN_STRIP = "()[]{}.,:;!?'\""
+
+
+def _split_words(text: str) -> list[str]:
+    return [
+        word.strip(_TOKEN_STRIP).lower()
+        for word in text.replace("/", " ").replace("-", " ").split()
+    ]
+
+
+def tokenize_name(name: str) -> list[str]:
+    """제품명 → 키워드 토큰 (2글자 이상, 순서 유지·중복 제거)."""
+    tokens = [w for w in _split_words(name) if 2 <= len(w) <= _MAX_TERM_LEN]
+    return list(dict.fromkeys(tokens))
+
+
+def _index_terms(token: str) -> list[str]:
+    terms = [token[:n] for n in range(1, min(len(token), _PREFIX_KEY_MAX) + 1)]
+    if len(token) > _PREFIX_KEY_MAX:
+        terms.append(token)
+    return terms
+
+
+async def ensure_search_suggestions(db: AsyncSession) -> int | None:
+    """인덱스가 비어 있을 때만 재빌드. 이미 채워져 있으면 None."""
+    if (await db.execute(select(SearchSuggestion.term).limit(1))).first() is not None:
+        return None
+    return await rebuild_search_suggestions(db)
+
+
+async def rebuild_search_suggestions(db: AsyncSession) -> int:
+    """search_suggestions 전체 재빌드 (단일 트랜잭션). 저장한 행 수 반환."""
+    rows = (
+        await db.execute(
+            select(Product.name, Brand.name, func.count())
+            .join(Brand, Product.brand_id == Brand.id, isouter=True)
+            .where(Product.is_active == True)  # noqa: E712
+            .group_by(Product.name, Brand.name)
+        )
+    ).all()
+
+    brand_counts: dict[str, Counter[str]] = defaultdict(Counter)
+    token_counts: dict[str, Counter[str]] = defaultdict(Counter)
+    for product_name, brand_name, n in rows:
+        tokens = tokenize_name(product_name or "")
+        brand = (brand_name or "").strip()
+        # 한 제품에서 같은 term(예: nike·nikelab의 접두어 "ni")은 1회만 센다
+        for term in {term for token in tokens for term in _index_terms(token)}:
+            if brand:
+                brand_counts[term][brand] += n
+            for other in tokens:
+                if not other.startswith(term):
+                    token_counts[term][other] += n
+
+    values = [
+        {"term": term, "kind": kind, "suggestion": suggestion, "count": count}
+        for kind, counts_by_term in (("brand", brand_counts), ("token", token_counts))
+        for term, counts in counts_by_term.items()
+        for suggestion, count in counts.most_common(_TOP_PER_KIND)
+    ]
+    await db.execute(delete(SearchSuggestion))
+    for start in range(0, len(values), _INSERT_BATCH):
+        await db.execute(insert(SearchSuggestion), values[start : start + _INSERT_BATCH])
+    await db.commit()
+    return len(values)
+
+
+def _term_filter(term: str):
+    if len(term) <= _PREFIX_KEY_MAX:
+        return SearchSuggestion.term == term
+    # 접두어 범위: [term, term의 마지막 글자 + 1)
+    upper = term[:-1] + chr(ord(term[-1]) + 1)
+    return and_(SearchSuggestion.term >= term, SearchSuggestion.term < upper)
+
+
+async def _indexed_candidates(db: AsyncSession, term: str) -> list[tuple[str, str]]:
+    total = func.sum(SearchSuggestion.count)
+    rows = (
+        await db.execute(
+            select(SearchSuggestion.kind, SearchSuggestion.suggestion)
+            .where(_term_filter(term[:_MAX_TERM_LEN]))
+            .group_by(SearchSuggestion.kind, SearchSuggestion.suggestion)
+            .order_by(
+                case((SearchSuggestion.kind == "brand", 0), else_=1),
+                total.desc(),
+                SearchSuggestion.suggestion,
+            )
+            .limit(_TOP_PER_KIND * 2)
+        )
+    ).all()
+    return [(kind, value) for kind, value in rows]
+
+
+async def _phrase_candidates(db: AsyncSession, query: str) -> list[tuple[str, str]]:
+    """문구 전체가 들어간 제품명(최대 300개)에서 브랜드·동시 등장 토큰 집계."""
+    rows = (
+        await db.execute(
+            select(Product.name, Brand.name)
+            .join(Brand, Product.brand_id == Brand.id, isouter=True)
+            .where(text_match(db, [Product.name], query), Product.is_active == True)  # noqa: E712
+            .limit(300)
+        )
+    ).all()
+    brand_counts: Counter[str] = Counter()
+    token_counts: Counter[str] = Counter()
+    for product_name, brand_name in rows:
+        brand = (brand_name or "").strip()
+        if brand:
+            brand_counts[brand] += 1
+        token_counts.update(tokenize_name(product_name or ""))
+    return [("brand", b) for b, _ in brand_counts.most_common()] + [
+        ("token", t) for t, _ in token_counts.most_common()
+    ]
+
+
+async def get_related_searches(
+    db: AsyncSession, q: str, limit: int = 8
+) -> list[str]:
+    """
+    검색어 기준 연관검색어.
+    - 검색어가 들어간 제품의 브랜드명 상위
+    - 같은 제품명에 함께 등장한 키워드 ("{q} {키워드}")
+    """
+    query = q.strip().lower()
+    if not query:
+        return []
+    words = [w for w in _split_words(query) if w]
+
+    if len(words) > 1:
+        rows = await _phrase_candidates(db, query)
+    else:
+        rows = await _indexed_candidates(db, words[0] if words else query)
+
+    if not rows:
+        brand_rows = (
+            await db.execute(
+                select(Brand.name)
+                .where(text_match(db, [Brand.name, Brand.slug], query))
+                .order_by(*text_rank(db, Brand.name, query), Brand.name)
+                .limit(limit)
+            )
+        ).all()
+        return [name for (name,) in brand_rows if name][:limit]
+
+    phrase = q.strip()
+    suggestions: list[str] = []
+    seen: set[str] = set()
+    for kind, value in rows:
+        if kind == "brand":
+            if value.lower() == query:
+                continue
+            keyword = value
+        else:
+            if value == query or query in value or value in words:
+                continue
+            if len(words) > 1 and value.startswith(words[-1]) and query.endswith(words[-1]):
+                # 입력 중인 마지막 단어는 토큰으로 완성 ("nike hoo" → "nike hoodie")
+                keyword = phrase[: len(phrase) - len(words[-1])] + value
+            else:
+                keyword = f"{phrase} {value}"
+        key = keyword.lower()
+        if key in seen:
+            continue
+        suggestions.append(keyword)
+        seen.add(key)
+        if len(suggestions) >= limit:
+            break
+    return suggestions